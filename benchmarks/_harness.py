@@ -0,0 +1,99 @@
+"""Timing helpers and result handling shared by the benchmark modules."""
+
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from rich.console import Console
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.duallogger import DualLogger
+
+# Metric name suffixes where a smaller number is better; everything else is a rate.
+LOWER_IS_BETTER = ("_us", "_ms", "dropped", "_files")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def latency_summary(samples_ns: list[int]) -> dict[str, float]:
+    """Summarize caller-side latencies measured in nanoseconds."""
+    return {
+        "p50_us": percentile(samples_ns, 50) / 1000,
+        "p99_us": percentile(samples_ns, 99) / 1000,
+    }
+
+
+def timed_calls(fn: Callable[[int], Any], count: int) -> tuple[float, list[int]]:
+    """Call ``fn(i)`` ``count`` times; return elapsed seconds and per-call nanoseconds."""
+    clock = time.perf_counter_ns
+    samples = [0] * count
+    start = clock()
+    for i in range(count):
+        before = clock()
+        fn(i)
+        samples[i] = clock() - before
+    return (clock() - start) / 1e9, samples
+
+
+@contextmanager
+def bench_logger(name: str, **overrides: Any) -> Iterator[DualLogger]:
+    """Yield a DualLogger writing to a temporary directory with the console muted."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cfg = LoggerConfig(name=name, log_file_path=os.path.join(tmp, f"{name}.log"), **overrides)
+        logger = DualLogger(name, cfg=cfg)
+        mute_console(logger.console_logger)
+        try:
+            yield logger
+        finally:
+            logger.shutdown()
+
+
+def mute_console(console_logger: Any) -> None:
+    """Point a ConsoleLogger's handler at an in-memory stream so rendering still happens."""
+    handler = console_logger.handler
+    if hasattr(handler, "console"):
+        handler.console = Console(file=io.StringIO(), width=120, force_terminal=False)
+    elif hasattr(handler, "setStream"):
+        handler.setStream(io.StringIO())
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": str(os.cpu_count()),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return a line per metric that regressed by more than ``tolerance`` against ``baseline``."""
+    regressions = []
+    for bench, metrics in results["benchmarks"].items():
+        for metric, value in metrics.items():
+            old = baseline.get("benchmarks", {}).get(bench, {}).get(metric)
+            if not isinstance(old, int | float) or not old:
+                continue
+            change = (value - old) / old
+            worse = change > tolerance if metric.endswith(LOWER_IS_BETTER) else -change > tolerance
+            if worse:
+                regressions.append(f"{bench}.{metric}: {old:,.2f} -> {value:,.2f} ({change:+.1%})")
+    return regressions
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,155 @@
+"""End-to-end DualLogger benchmarks: sync, event loop, threads and overflow."""
+
+import asyncio
+import logging
+import threading
+import time
+
+from dual_logging.config.log_config import QueueOverflowPolicy
+from dual_logging.core.record import Record
+
+from ._harness import bench_logger, latency_summary, timed_calls
+
+CTX = {"trace_id": "4bf92f3577b34da6", "user": "alice"}
+
+
+def bench_sync(records: int) -> dict[str, float]:
+    """Plain synchronous callers, no event loop running."""
+    with bench_logger("bench_sync", console_queue_size=0, file_queue_size=0) as logger:
+        elapsed, samples = timed_calls(
+            lambda i: logger.info("request %d handled", i, **CTX), records
+        )
+        start = time.perf_counter()
+        logger.flush()
+        drained = elapsed + time.perf_counter() - start
+    return {
+        "caller_records_per_s": records / elapsed,
+        "end_to_end_records_per_s": records / drained,
+        **latency_summary(samples),
+    }
+
+
+def bench_event_loop(records: int) -> dict[str, float]:
+    """Callers inside a running asyncio loop."""
+
+    async def run(logger) -> tuple[float, list[int], float]:
+        def call(i: int) -> None:
+            logger.info("request %d handled", i, **CTX)
+
+        elapsed, samples = 0.0, []
+        # Yield to the loop between chunks like a real server would.
+        for offset in range(0, records, 100):
+            chunk, chunk_samples = timed_calls(call, min(100, records - offset))
+            elapsed += chunk
+            samples += chunk_samples
+            await asyncio.sleep(0)
+        start = time.perf_counter()
+        while logger.stats()["queues"]["async"]["depth"]:
+            await asyncio.sleep(0.001)
+        await logger.flush_async()
+        return elapsed, samples, time.perf_counter() - start
+
+    with bench_logger("bench_loop", file_queue_size=records) as logger:
+        elapsed, samples, drain = asyncio.run(run(logger))
+    return {
+        "caller_records_per_s": records / elapsed,
+        "end_to_end_records_per_s": records / (elapsed + drain),
+        **latency_summary(samples),
+    }
+
+
+def bench_threads(records: int, threads: int) -> dict[str, float]:
+    """``threads`` callers logging concurrently."""
+    per_thread = records // threads
+    samples: list[int] = []
+    lock = threading.Lock()
+
+    with bench_logger("bench_threads", console_queue_size=0, file_queue_size=0) as logger:
+
+        def worker() -> None:
+            _, local = timed_calls(
+                lambda i: logger.info("request %d handled", i, **CTX), per_thread
+            )
+            with lock:
+                samples.extend(local)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        start = time.perf_counter()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - start
+        logger.flush()
+        drained = time.perf_counter() - start
+    total = per_thread * threads
+    return {
+        "caller_records_per_s": total / elapsed,
+        "end_to_end_records_per_s": total / drained,
+        **latency_summary(samples),
+    }
+
+
+def bench_enqueue(records: int, threads: int) -> dict[str, float]:
+    """``threads`` callers handing ready-made records to the queues, nothing else timed.
+
+    Isolates the hand-off every log call ends in, where callers can contend.
+    """
+    per_thread = records // threads
+    with bench_logger("bench_enqueue", console_queue_size=0, file_queue_size=0) as logger:
+        ready = threading.Barrier(threads + 1)
+
+        def worker() -> None:
+            record = Record(logging.INFO, "request handled", None, dict(CTX), callsite=None)
+            ready.wait()
+            for _ in range(per_thread):
+                logger._enqueue(record)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for t in workers:
+            t.start()
+        ready.wait()
+        start = time.perf_counter()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - start
+        logger.flush()
+        stats = logger.stats()["queues"]["file"]
+    return {"records_per_s": per_thread * threads / elapsed, "file_dropped": stats["dropped"]}
+
+
+def bench_overflow(records: int, policy: QueueOverflowPolicy) -> dict[str, float]:
+    """Sustained overflow: a burst far larger than the queues."""
+    with bench_logger(
+        f"bench_{policy.value}",
+        console_queue_size=64,
+        file_queue_size=64,
+        queue_overflow_policy=policy,
+        queue_block_timeout=0.001,
+    ) as logger:
+
+        def call(i: int) -> None:
+            level = logger.error if i % 10 == 0 else logger.info
+            level("request %d handled", i, **CTX)
+
+        elapsed, samples = timed_calls(call, records)
+        logger.flush()
+        dropped = logger.dropped_file_logs
+    return {
+        "caller_records_per_s": records / elapsed,
+        "file_dropped": dropped,
+        **latency_summary(samples),
+    }
+
+
+def collect(records: int, threads: tuple[int, ...]) -> dict[str, dict[str, float]]:
+    results = {
+        "logger.sync": bench_sync(records),
+        "logger.event_loop": bench_event_loop(records),
+    }
+    for count in threads:
+        results[f"logger.threads_{count}"] = bench_threads(records, count)
+        results[f"logger.enqueue_threads_{count}"] = bench_enqueue(records, count)
+    for policy in QueueOverflowPolicy:
+        results[f"overflow.{policy.value}"] = bench_overflow(records, policy)
+    return results
@@ -0,0 +1,129 @@
+"""Per-sink costs: FileLogger JSON rendering, ConsoleLogger rendering and rotation."""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.console_logger import ConsoleLogger
+from dual_logging.core.file_logger import FileLogger
+from dual_logging.core.record import Record
+from dual_logging.core.tracebacks import TracebackCache
+
+from ._harness import latency_summary, mute_console, timed_calls
+
+CTX = {"trace_id": "4bf92f3577b34da6", "user": "alice", "attempt": 3, "latency_ms": 12.5}
+CALLSITE = ("/srv/app/handlers.py", 42)
+
+
+def bench_json(records: int, fast_json: bool) -> dict[str, float]:
+    """Render records to JSON lines without writing them."""
+    with tempfile.TemporaryDirectory() as tmp:
+        file_logger = FileLogger(
+            LoggerConfig(log_file_path=os.path.join(tmp, "bench.log"), fast_json=fast_json)
+        )
+        start = time.perf_counter()
+        for i in range(records):
+            record = Record(
+                logging.INFO, "request handled", None, {"seq": i, **CTX}, callsite=CALLSITE
+            )
+            file_logger._render(record)
+        elapsed = time.perf_counter() - start
+        file_logger.handler.close()
+    return {"records_per_s": records / elapsed}
+
+
+def bench_console(records: int, console_format: str = "rich") -> dict[str, float]:
+    """Single-record console rendering into an in-memory stream."""
+    with tempfile.TemporaryDirectory() as tmp:
+        console_logger = ConsoleLogger(
+            LoggerConfig(log_file_path=os.path.join(tmp, "c.log"), console_format=console_format)
+        )
+        mute_console(console_logger)
+        elapsed, samples = timed_calls(
+            lambda i: console_logger._log_sync(
+                "info", "request handled", seq=i, callsite=CALLSITE, **CTX
+            ),
+            records,
+        )
+    return {"records_per_s": records / elapsed, **latency_summary(samples)}
+
+
+def _raise(seq: int) -> None:
+    raise ValueError(f"bad row {seq}")
+
+
+def bench_exceptions(records: int, console_format: str, cached: bool) -> dict[str, float]:
+    """Console rendering of one exception recurring in a loop, as in an error storm."""
+    tracebacks = TracebackCache() if cached else None
+    with tempfile.TemporaryDirectory() as tmp:
+        console_logger = ConsoleLogger(
+            LoggerConfig(log_file_path=os.path.join(tmp, "c.log"), console_format=console_format)
+        )
+        mute_console(console_logger)
+
+        def log_exception(i: int) -> None:
+            try:
+                _raise(i)
+            except ValueError:
+                record = Record(
+                    logging.ERROR,
+                    "import failed",
+                    exc_info=sys.exc_info(),
+                    callsite=CALLSITE,
+                    tracebacks=tracebacks,
+                )
+            console_logger.write_batch([record])
+
+        elapsed, samples = timed_calls(log_exception, records)
+    return {"records_per_s": records / elapsed, **latency_summary(samples)}
+
+
+def bench_rotation(records: int) -> dict[str, float]:
+    """Single-record writes with a small max_bytes so rollovers land on the write path."""
+    with tempfile.TemporaryDirectory() as tmp:
+        file_logger = FileLogger(
+            LoggerConfig(
+                log_file_path=os.path.join(tmp, "rotate.log"),
+                max_bytes=64 * 1024,
+                backup_count=3,
+                fast_json=True,
+            )
+        )
+        rollovers = 0
+        do_rollover = file_logger.handler.doRollover
+
+        def counting_rollover() -> None:
+            nonlocal rollovers
+            rollovers += 1
+            do_rollover()
+
+        file_logger.handler.doRollover = counting_rollover
+        elapsed, samples = timed_calls(
+            lambda i: file_logger.write_batch([("info", "request handled", {"seq": i, **CTX})]),
+            records,
+        )
+        file_logger.handler.close()
+    return {
+        "records_per_s": records / elapsed,
+        "rollovers": rollovers,
+        "max_us": max(samples) / 1000,
+        **latency_summary(samples),
+    }
+
+
+def collect(records: int) -> dict[str, dict[str, float]]:
+    return {
+        "file.json_structlog": bench_json(records, fast_json=False),
+        "file.json_fast": bench_json(records, fast_json=True),
+        "console.rich": bench_console(max(1, records // 10)),
+        "console.text": bench_console(records, "text"),
+        "console.logfmt": bench_console(records, "logfmt"),
+        "file.rotation": bench_rotation(records),
+        "exceptions.rich_full": bench_exceptions(max(1, records // 100), "rich", cached=False),
+        "exceptions.rich_cached": bench_exceptions(max(1, records // 100), "rich", cached=True),
+        "exceptions.text_full": bench_exceptions(max(1, records // 10), "text", cached=False),
+        "exceptions.text_cached": bench_exceptions(max(1, records // 10), "text", cached=True),
+    }
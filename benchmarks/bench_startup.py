@@ -0,0 +1,70 @@
+"""Startup costs: importing the package, creating loggers and writing the first record."""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.duallogger import DualLogger
+
+from ._harness import mute_console
+
+_IMPORT = "import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+
+
+def bench_import(module: str, runs: int) -> dict[str, float]:
+    """Import ``module`` in fresh interpreters, as a CLI or batch job starts."""
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", _IMPORT.format(module=module)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(float(out))
+    return {"median_ms": statistics.median(samples) * 1000}
+
+
+def bench_construct(loggers: int) -> dict[str, float]:
+    """Create loggers that never log, like library loggers from ``logging.getLogger``."""
+    with tempfile.TemporaryDirectory() as tmp:
+        created = []
+        start = time.perf_counter()
+        for i in range(loggers):
+            cfg = LoggerConfig(name=f"idle_{i}", log_file_path=os.path.join(tmp, f"{i}.log"))
+            created.append(DualLogger(f"idle_{i}", cfg=cfg))
+        elapsed = time.perf_counter() - start
+        files = len(os.listdir(tmp))
+        for logger in created:
+            logger.shutdown()
+    return {"per_logger_us": elapsed / loggers * 1e6, "opened_files": files}
+
+
+def bench_first_record(loggers: int) -> dict[str, float]:
+    """Create a logger and get its first record onto disk, sinks built on the way."""
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(loggers):
+            start = time.perf_counter()
+            cfg = LoggerConfig(name=f"first_{i}", log_file_path=os.path.join(tmp, f"{i}.log"))
+            logger = DualLogger(f"first_{i}", cfg=cfg)
+            mute_console(logger.console_logger)
+            logger.info("ready", attempt=i)
+            logger.flush()
+            samples.append(time.perf_counter() - start)
+            logger.shutdown()
+    return {"median_us": statistics.median(samples) * 1e6}
+
+
+def collect(records: int) -> dict[str, dict[str, float]]:
+    runs = max(3, min(20, records // 1000))
+    return {
+        "startup.import_package": bench_import("dual_logging", runs),
+        "startup.import_logger": bench_import("dual_logging.duallogger", runs),
+        "startup.idle_loggers": bench_construct(max(10, records // 20)),
+        "startup.first_record": bench_first_record(max(10, records // 200)),
+    }
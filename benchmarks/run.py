@@ -0,0 +1,64 @@
+"""Run the benchmark suite and optionally compare against a saved baseline.
+
+Usage::
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline results.json --tolerance 0.15
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from . import bench_logger, bench_sinks, bench_startup
+from ._harness import compare, environment, load
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000, help="records per benchmark")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--quick", action="store_true", help="small run for smoke testing")
+    parser.add_argument("--only", choices=["logger", "sinks", "startup"], help="run one group only")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="compare against results saved with --output")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.10, help="allowed relative regression (0.10 = 10%%)"
+    )
+    args = parser.parse_args(argv)
+    records = 1_000 if args.quick else args.records
+
+    benchmarks: dict[str, dict[str, float]] = {}
+    if args.only in (None, "logger"):
+        benchmarks.update(bench_logger.collect(records, tuple(args.threads)))
+    if args.only in (None, "sinks"):
+        benchmarks.update(bench_sinks.collect(records))
+    if args.only in (None, "startup"):
+        benchmarks.update(bench_startup.collect(records))
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "records": records,
+        "environment": environment(),
+        "benchmarks": benchmarks,
+    }
+
+    for name, metrics in benchmarks.items():
+        shown = "  ".join(f"{k}={v:,.1f}" for k, v in metrics.items())
+        print(f"{name:<28} {shown}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        regressions = compare(results, load(args.baseline), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,32 @@
-from .config import LoggerConfig, QueueOverflowPolicy
-from .duallogger import DualLogger
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import LoggerConfig, QueueOverflowPolicy
+    from .duallogger import DualLogger
+
+# Loaded on first use, so tools that only need a submodule skip the logger itself.
+_EXPORTS = {
+    "DualLogger": "duallogger",
+    "LoggerConfig": "config",
+    "QueueOverflowPolicy": "config",
+}
 
 __all__ = [
     "DualLogger",
     "LoggerConfig",
     "QueueOverflowPolicy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
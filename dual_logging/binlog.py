@@ -0,0 +1,77 @@
+"""Read binary log files written with ``file_format="binary"``.
+
+Usage::
+
+    python -m dual_logging.binlog convert app.log > app.jsonl
+    python -m dual_logging.binlog convert app.log.1.gz --output app.1.jsonl
+    python -m dual_logging.binlog tail -n 20 -f app.log
+"""
+
+import argparse
+import sys
+import time
+from collections import deque
+from typing import IO
+
+from .core.binary_format import BinaryLogReader, open_log
+from .core.fast_json import encode_event
+
+
+def convert(paths: list[str], out: IO[str]) -> int:
+    """Write every record in ``paths`` to ``out`` as JSON lines, returning the count."""
+    count = 0
+    for path in paths:
+        with open_log(path) as f:
+            for event in BinaryLogReader(f).events():
+                out.write(encode_event(event) + "\n")
+                count += 1
+    return count
+
+
+def tail(
+    path: str, out: IO[str], lines: int = 10, follow: bool = False, poll: float = 0.25
+) -> None:
+    """Print the last ``lines`` records of ``path``, then new ones as they arrive if ``follow``."""
+    with open_log(path) as f:
+        reader = BinaryLogReader(f)
+        for event in deque(reader.events(), maxlen=lines):
+            out.write(encode_event(event) + "\n")
+        out.flush()
+        while follow:
+            time.sleep(poll)
+            for event in reader.events():
+                out.write(encode_event(event) + "\n")
+            out.flush()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert_cmd = commands.add_parser("convert", help="write records as JSON lines")
+    convert_cmd.add_argument("paths", nargs="+", help="binary logs, optionally .gz or .zst")
+    convert_cmd.add_argument("--output", help="write to this path instead of stdout")
+    tail_cmd = commands.add_parser("tail", help="print the last records of a log")
+    tail_cmd.add_argument("path")
+    tail_cmd.add_argument("-n", "--lines", type=int, default=10)
+    tail_cmd.add_argument("-f", "--follow", action="store_true", help="keep printing new records")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "convert":
+            if args.output:
+                with open(args.output, "w", encoding="utf-8") as out:
+                    convert(args.paths, out)
+            else:
+                convert(args.paths, sys.stdout)
+        else:
+            tail(args.path, sys.stdout, args.lines, args.follow)
+    except KeyboardInterrupt:
+        pass
+    except (OSError, ValueError) as exc:
+        print(f"binlog: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
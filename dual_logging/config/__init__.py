@@ -1,13 +1,21 @@
 from .log_config import LoggerConfig, QueueOverflowPolicy
-from .log_context import LogContextManager, logcontext
+from .log_context import LogContextManager, current_context, log_context_manager, logcontext
 
 DROP_OVERFLOW = QueueOverflowPolicy.DROP
 BLOCK_OVERFLOW = QueueOverflowPolicy.BLOCK
+DROP_OLDEST_OVERFLOW = QueueOverflowPolicy.DROP_OLDEST
+PRIORITY_OVERFLOW = QueueOverflowPolicy.PRIORITY
+SPILL_OVERFLOW = QueueOverflowPolicy.SPILL
 
 __all__ = [
     "LoggerConfig",
     "DROP_OVERFLOW",
     "BLOCK_OVERFLOW",
+    "DROP_OLDEST_OVERFLOW",
+    "PRIORITY_OVERFLOW",
+    "SPILL_OVERFLOW",
     "LogContextManager",
     "logcontext",
+    "log_context_manager",
+    "current_context",
 ]
@@ -1,13 +1,19 @@
 import logging
 import os
+import signal
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 
 class QueueOverflowPolicy(Enum):
     DROP = "drop"
     BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    PRIORITY = "priority"
+    SPILL = "spill"
 
 
 @dataclass
@@ -18,13 +24,57 @@ class LoggerConfig:
     file_level: str = "DEBUG"
     log_file_path: str | None = None
     rotate: bool = False
-    max_bytes: int = 1_000_000
+    max_bytes: int = 64 * 1024 * 1024
     backup_count: int = 3
+    rotate_when: str = "size"
+    rotate_interval: float = 86400.0
+    rotate_compression: str | None = None
+    rotate_max_total_bytes: int | None = None
     console_queue_size: int = 100
     file_queue_size: int = 100
     use_utc: bool = False
     time_format: str = "iso"
     queue_overflow_policy: QueueOverflowPolicy = QueueOverflowPolicy.DROP
+    console_overflow_policy: QueueOverflowPolicy | None = None
+    file_overflow_policy: QueueOverflowPolicy | None = None
+    queue_block_timeout: float = 1.0
+    spill_dir: str | None = None
+    writer_batch_size: int = 256
+    writer_min_interval: float = 0.01
+    writer_max_interval: float = 0.5
+    async_batch_size: int = 512
+    async_flush_interval: float = 0.05
+    fast_json: bool = False
+    console_format: str = "auto"
+    file_backend: str = "rotating"
+    file_format: str = "json"
+    file_index: bool = False
+    file_index_block_bytes: int = 64 * 1024
+    mmap_sync: str = "none"
+    mmap_sync_interval: float = 1.0
+    durability: str = "none"
+    fsync_interval: float = 1.0
+    fsync_every: int = 100
+    fsync_level: str = "WARNING"
+    shutdown_timeout: float = 5.0
+    drain_at_exit: bool = True
+    drain_signals: tuple[str, ...] = ()
+    log_server_address: str | None = None
+    sinks: list[Any] = field(default_factory=list)
+    callsite_level: str | None = "DEBUG"
+    traceback_window: float | None = 60.0
+    traceback_cache_size: int = 256
+    storm_limit: int | None = None
+    storm_window: float = 1.0
+    storm_level_limits: dict[str, int] = field(default_factory=dict)
+    sampling: bool = False
+    sampling_start: float = 0.5
+    sampling_info_floor: float = 0.1
+    sampling_target_rate: float | None = None
+    sampling_by_trace: bool = True
+    metrics_interval: float | None = None
+    metrics_callback: Callable[[dict[str, Any]], None] | None = None
+    metrics_prometheus_path: str | None = None
     extra_ignores: list[str] = field(default_factory=lambda: ["asyncio", "socket"])
 
     def __post_init__(self) -> None:
@@ -32,8 +82,51 @@ class LoggerConfig:
         self.console_level_num = getattr(logging, self.console_level.upper(), logging.INFO)
         self.file_level_num = getattr(logging, self.file_level.upper(), logging.DEBUG)
         self.file_level_num = min(self.file_level_num, self.console_level_num)
+        # Records below this level carry no pathname/lineno; None disables capture.
+        self.callsite_level_num = (
+            getattr(logging, self.callsite_level.upper(), logging.DEBUG)
+            if self.callsite_level
+            else logging.CRITICAL + 1
+        )
+        self.fsync_level_num = getattr(logging, self.fsync_level.upper(), logging.WARNING)
+        if self.rotate_when not in ("size", "time", "size_or_time"):
+            raise ValueError(
+                f"rotate_when must be 'size', 'time' or 'size_or_time', not {self.rotate_when!r}"
+            )
+        if self.console_format not in ("auto", "rich", "text", "logfmt"):
+            raise ValueError(
+                "console_format must be 'auto', 'rich', 'text' or 'logfmt', "
+                f"not {self.console_format!r}"
+            )
+        if self.file_backend not in ("rotating", "mmap"):
+            raise ValueError(
+                f"file_backend must be 'rotating' or 'mmap', not {self.file_backend!r}"
+            )
+        if self.file_format not in ("json", "binary"):
+            raise ValueError(f"file_format must be 'json' or 'binary', not {self.file_format!r}")
+        if self.file_format == "binary" and self.file_backend == "mmap":
+            raise ValueError("file_format='binary' needs file_backend='rotating'")
+        if self.file_index and self.file_backend == "mmap":
+            raise ValueError("file_index needs file_backend='rotating'")
+        if self.rotate_when != "size" and self.file_backend == "mmap":
+            raise ValueError(f"rotate_when={self.rotate_when!r} needs file_backend='rotating'")
+        self._check_durability()
+        names = [sink.name for sink in self.sinks]
+        reserved = {"console", "file", "async"}.intersection(names)
+        if reserved or len(set(names)) < len(names):
+            raise ValueError(f"sink names must be unique and not console, file or async: {names}")
 
         if not self.log_file_path:
-            os.makedirs("logs", exist_ok=True)
+            # FileLogger creates the directory, once a record is actually written.
             stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.log_file_path = os.path.join("logs", f"app_{stamp}.log")
+
+    def _check_durability(self) -> None:
+        if self.durability not in ("none", "interval", "every_n", "level"):
+            raise ValueError(
+                "durability must be 'none', 'interval', 'every_n' or 'level', "
+                f"not {self.durability!r}"
+            )
+        for name in self.drain_signals:
+            if not isinstance(getattr(signal, name, None), signal.Signals):
+                raise ValueError(f"drain_signals holds an unknown signal name: {name!r}")
@@ -1,64 +1,96 @@
 import contextvars
 import inspect
-from collections.abc import Callable, Generator
+from collections.abc import AsyncGenerator, Callable, Generator, Mapping
 from contextlib import asynccontextmanager, contextmanager
 from functools import wraps
+from types import MappingProxyType
 from typing import Any
 
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+class _ContextFrame:
+    """One immutable layer of log context chained onto its parent.
+
+    Entering a context pushes a frame and leaving it restores the parent, so
+    neither copies what is already bound. The merged view is built the first
+    time it is asked for and then reused, since a frame never changes.
+    """
+
+    __slots__ = ("_flat", "fields", "parent")
+
+    def __init__(self, parent: "_ContextFrame | None", fields: Mapping[str, Any]) -> None:
+        self.parent = parent
+        self.fields = fields
+        self._flat: Mapping[str, Any] | None = None
+
+    def flat(self) -> Mapping[str, Any]:
+        if self._flat is None:
+            base = self.parent.flat() if self.parent is not None else _EMPTY
+            self._flat = MappingProxyType({**base, **self.fields})
+        return self._flat
+
 
 class LogContextManager:
     def __init__(self):
-        self.log_context: contextvars.ContextVar[dict[str, Any]] = contextvars.ContextVar(
+        self.log_context: contextvars.ContextVar[_ContextFrame | None] = contextvars.ContextVar(
             "log_context", default=None
         )
 
+    def snapshot(self) -> Mapping[str, Any] | None:
+        """Return the current context as a read-only mapping, or None if nothing is bound."""
+        frame = self.log_context.get()
+        return frame.flat() if frame is not None else None
+
     def _get_log_context(self) -> dict[str, Any]:
-        """Retrieve the current log context, initializing if necessary."""
-        current_context = self.log_context.get(None)
-        if current_context is None:
-            current_context = {}
-            self.log_context.set(current_context)
-        return current_context
+        """Retrieve a copy of the current log context."""
+        return dict(self.snapshot() or {})
 
     def _set_log_context(self, new_ctx: dict[str, Any]) -> None:
-        """Set or update the log context."""
-        self.log_context.set(new_ctx)
+        """Replace the log context of the current task or thread."""
+        self.log_context.set(_ContextFrame(None, dict(new_ctx)))
+
+    def _push(self, fields: Mapping[str, Any]) -> contextvars.Token:
+        return self.log_context.set(_ContextFrame(self.log_context.get(), fields))
 
     @contextmanager
     def context(self, temp_ctx: dict[str, Any]) -> Generator[None, None, None]:
-        """Temporarily modify the log context."""
-        current_context = self._get_log_context().copy()
+        """Temporarily add ``temp_ctx`` to the log context."""
+        token = self._push(dict(temp_ctx))
         try:
-            current_context.update(temp_ctx)
-            self._set_log_context(current_context)
             yield
         finally:
-            self._set_log_context(current_context)
+            self.log_context.reset(token)
 
     @asynccontextmanager
-    async def async_context(self, temp_ctx: dict[str, Any]) -> Generator[None, None, None]:
-        """Asynchronous context manager for modifying the log context."""
-        current_context = self._get_log_context().copy()
+    async def async_context(self, temp_ctx: dict[str, Any]) -> AsyncGenerator[None, None]:
+        """Asynchronous context manager for adding to the log context."""
+        token = self._push(dict(temp_ctx))
         try:
-            current_context.update(temp_ctx)
-            self._set_log_context(current_context)
             yield
         finally:
-            self._set_log_context(current_context)
+            self.log_context.reset(token)
 
     def decorator(self, temp_ctx: dict[str, Any]):
         """Apply temporary log context during function execution."""
+        fields = MappingProxyType(dict(temp_ctx))
 
         def decorator(func: Callable):
             @wraps(func)
             def sync_wrapper(*args: str, **kwargs: Any):
-                with self.context(temp_ctx):
+                token = self._push(fields)
+                try:
                     return func(*args, **kwargs)
+                finally:
+                    self.log_context.reset(token)
 
             @wraps(func)
             async def async_wrapper(*args: str, **kwargs: Any):
-                async with self.async_context(temp_ctx):
+                token = self._push(fields)
+                try:
                     return await func(*args, **kwargs)
+                finally:
+                    self.log_context.reset(token)
 
             if inspect.iscoroutinefunction(func):
                 return async_wrapper
@@ -69,4 +101,6 @@ class LogContextManager:
 
 # Singleton instance for easy access
 _log_context_manager = LogContextManager()
+log_context_manager = _log_context_manager
 logcontext = _log_context_manager.decorator
+current_context = _log_context_manager.snapshot
@@ -1,5 +1,98 @@
-from .base_logger import BaseLogger
-from .console_logger import ConsoleLogger
-from .file_logger import FileLogger
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["BaseLogger", "ConsoleLogger", "FileLogger"]
+if TYPE_CHECKING:
+    from .async_file_sink import AsyncFileSink
+    from .async_queue import AsyncOverflowQueue
+    from .base_logger import BaseLogger
+    from .batch_writer import BatchWriter
+    from .binary_format import BinaryLogReader, BinaryRotatingFileHandler
+    from .callsite import CallsiteCache
+    from .console_logger import ConsoleLogger
+    from .durability import FsyncPolicy
+    from .file_logger import FileLogger
+    from .log_index import LogIndex, query
+    from .metrics import LoggerMetrics, MetricsReporter
+    from .mmap_writer import MmapSegmentHandler
+    from .network import NDJSONSink, NetworkSink, SyslogSink
+    from .overflow import OverflowQueue
+    from .remote import LogServer, RemoteSink, run_log_server
+    from .sampling import AdaptiveSampler
+    from .sink_worker import SinkWorker
+    from .suppression import StormSuppressor
+    from .thread_buffers import ThreadBuffers
+    from .tracebacks import TracebackCache
+
+# Submodules are imported on first use, so importing one sink does not load the rest.
+_EXPORTS = {
+    "AdaptiveSampler": "sampling",
+    "AsyncFileSink": "async_file_sink",
+    "AsyncOverflowQueue": "async_queue",
+    "BaseLogger": "base_logger",
+    "BatchWriter": "batch_writer",
+    "BinaryLogReader": "binary_format",
+    "BinaryRotatingFileHandler": "binary_format",
+    "CallsiteCache": "callsite",
+    "ConsoleLogger": "console_logger",
+    "FileLogger": "file_logger",
+    "FsyncPolicy": "durability",
+    "LogIndex": "log_index",
+    "LogServer": "remote",
+    "LoggerMetrics": "metrics",
+    "MetricsReporter": "metrics",
+    "MmapSegmentHandler": "mmap_writer",
+    "NDJSONSink": "network",
+    "NetworkSink": "network",
+    "OverflowQueue": "overflow",
+    "RemoteSink": "remote",
+    "SinkWorker": "sink_worker",
+    "StormSuppressor": "suppression",
+    "SyslogSink": "network",
+    "ThreadBuffers": "thread_buffers",
+    "TracebackCache": "tracebacks",
+    "query": "log_index",
+    "run_log_server": "remote",
+}
+
+__all__ = [
+    "AdaptiveSampler",
+    "AsyncFileSink",
+    "AsyncOverflowQueue",
+    "BaseLogger",
+    "BatchWriter",
+    "BinaryLogReader",
+    "BinaryRotatingFileHandler",
+    "CallsiteCache",
+    "ConsoleLogger",
+    "FileLogger",
+    "FsyncPolicy",
+    "LogIndex",
+    "LogServer",
+    "LoggerMetrics",
+    "MetricsReporter",
+    "MmapSegmentHandler",
+    "NDJSONSink",
+    "NetworkSink",
+    "OverflowQueue",
+    "RemoteSink",
+    "SinkWorker",
+    "StormSuppressor",
+    "SyslogSink",
+    "ThreadBuffers",
+    "TracebackCache",
+    "query",
+    "run_log_server",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
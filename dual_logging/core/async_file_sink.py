@@ -0,0 +1,97 @@
+import asyncio
+import contextlib
+import time
+
+from .file_logger import FileLogger
+from .record import Record
+
+
+class AsyncFileSink:
+    """Group-commit consumer that moves records from an asyncio queue into a FileLogger.
+
+    Records are gathered until ``max_batch`` are waiting or ``max_latency``
+    seconds have passed since the first one arrived, then rendered and written
+    in a single call on a worker thread. Writes go through the FileLogger's
+    handler, so the file stays open between ticks and rotation follows the
+    same ``max_bytes``/``backup_count`` as the sync path.
+    """
+
+    def __init__(self, file_logger: FileLogger, max_batch: int = 512, max_latency: float = 0.05):
+        self.file_logger = file_logger
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+
+    async def run(self, queue: asyncio.Queue) -> None:
+        """Consume ``queue`` until cancelled, writing whatever is left on the way out.
+
+        A batch already handed to the worker thread is written by it even if
+        the task is cancelled meanwhile, so it is waited for, not written again.
+        """
+        batch: list[Record] = []
+        writing: asyncio.Future | None = None
+        try:
+            while True:
+                batch.append(await queue.get())
+                await self._gather(queue, batch)
+                writing = asyncio.ensure_future(self.write(batch))
+                batch = []
+                await asyncio.shield(writing)
+        except asyncio.CancelledError:
+            if writing is not None:
+                # Cancelled along with this task, it has still handed the batch over.
+                with contextlib.suppress(asyncio.CancelledError):
+                    await writing
+            batch.extend(_take_nowait(queue))
+            if batch:
+                self.file_logger.write_batch(batch)
+            raise
+
+    async def _gather(self, queue: asyncio.Queue, batch: list) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_latency
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                async with asyncio.timeout(remaining):
+                    batch.append(await queue.get())
+            except TimeoutError:
+                return
+
+    async def write(self, batch: list[Record]) -> None:
+        """Render and write ``batch`` with one hop to a worker thread."""
+        if batch:
+            start = time.perf_counter()
+            await asyncio.to_thread(self.file_logger.write_batch, batch)
+            self.file_logger.metrics.flushed(len(batch), time.perf_counter() - start)
+
+    async def drain(self, queue: asyncio.Queue) -> None:
+        """Write everything currently waiting in ``queue``."""
+        while batch := _take_nowait(queue, self.max_batch):
+            await self.write(batch)
+
+    def drain_sync(self, queue: asyncio.Queue, deadline: float) -> None:
+        """Write what is waiting in ``queue`` from this thread until the ``time.monotonic()`` deadline.
+
+        For shutdown, when the queue's loop may be stopped or already closed.
+        """
+        while time.monotonic() < deadline and (batch := _take_nowait(queue, self.max_batch)):
+            start = time.perf_counter()
+            self.file_logger.write_batch(batch)
+            self.file_logger.metrics.flushed(len(batch), time.perf_counter() - start)
+
+
+def _take_nowait(queue: asyncio.Queue, limit: int | None = None) -> list:
+    batch = []
+    while limit is None or len(batch) < limit:
+        try:
+            batch.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return batch
@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any
+
+from ..config.log_config import QueueOverflowPolicy
+from .overflow import _OverflowMixin
+from .record import Record
+
+
+class AsyncOverflowQueue(asyncio.Queue, _OverflowMixin):
+    """asyncio.Queue that applies a QueueOverflowPolicy through ``offer``.
+
+    asyncio queues bind to one event loop, so DualLogger keeps one per loop
+    that logs.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: QueueOverflowPolicy = QueueOverflowPolicy.DROP,
+        spill_path: str | None = None,
+        block_timeout: float = 1.0,
+    ) -> None:
+        super().__init__(maxsize)
+        self._waiting = 0
+        self._setup_overflow(policy, spill_path, block_timeout)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        self._maxsize = value
+
+    def must_wait(self) -> bool:
+        """Return whether ``offer`` would have to wait for room rather than return at once.
+
+        Only under BLOCK: when the queue is full, or records offered earlier
+        are still waiting for room, so that later ones wait their turn too.
+        """
+        return (
+            self.policy is QueueOverflowPolicy.BLOCK
+            and (self._waiting > 0 or self.full())
+            and not self._spilling()
+        )
+
+    def offer_nowait(self, item: Record) -> bool:
+        """Enqueue ``item`` without suspending, returning False if the policy dropped it.
+
+        For callers that have checked ``must_wait()``; a full BLOCK queue
+        drops ``item`` as if it had timed out at once.
+        """
+        if self._spilling():
+            self.spill.append(item)
+            return True
+        if not self.full():
+            self.put_nowait(item)
+            self._track_peak()
+            return True
+        return self._overflow(
+            item, "block_timeout" if self.policy is QueueOverflowPolicy.BLOCK else "queue_full"
+        )
+
+    async def offer(self, item: Record) -> bool:
+        """Enqueue ``item``, returning False if the policy dropped it."""
+        if not self.must_wait():
+            return self.offer_nowait(item)
+        self._waiting += 1
+        try:
+            async with asyncio.timeout(self.block_timeout):
+                await self.put(item)
+        except TimeoutError:
+            return self.offer_nowait(item)
+        finally:
+            self._waiting -= 1
+        self._track_peak()
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        return self._stats()
+
+    def discard(self, reason: str) -> int:
+        return self._discard(reason)
+
+    def _get(self) -> Record:
+        item = self._queue.popleft()
+        self._refill()
+        return item
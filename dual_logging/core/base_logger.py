@@ -1,17 +1,73 @@
+import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
+from ..config.log_config import QueueOverflowPolicy
+from .record import Record
 
-class BaseLogger(ABC):
-    @abstractmethod
-    def _log_sync(self, level: str, message: str, exc_info: bool = False, **kwargs: Any) -> None:
+
+class SinkHandler(logging.Handler):
+    """Placeholder handler so ``logging.shutdown()`` also closes a sink that has no stream of its own."""
+
+    def __init__(self, sink: "BaseLogger") -> None:
+        super().__init__()
+        self._sink = sink
+
+    def emit(self, record: logging.LogRecord) -> None:
         pass
 
+    def close(self) -> None:
+        self._sink.close()
+        super().close()
+
+
+class BaseLogger(ABC):
+    """A destination for records, written to in batches by its own worker thread.
+
+    DualLogger gives every sink a queue and a writer thread, so a slow sink
+    only ever backs up its own queue. ``queue_size``, ``overflow_policy``
+    and ``block_timeout`` override the LoggerConfig defaults for that queue;
+    ``level`` is the lowest level the sink wants, so DualLogger does not
+    reject records at entry that it would write.
+    """
+
+    name: str = "sink"
+    level: int = logging.NOTSET
+    queue_size: int | None = None
+    overflow_policy: QueueOverflowPolicy | None = None
+    block_timeout: float | None = None
+
     @abstractmethod
+    def write_batch(self, records: list[Record]) -> None:
+        """Write ``records`` in order; legacy ``(level, message, ctx)`` tuples are accepted too."""
+
+    def _log_sync(self, level: str, message: str, exc_info: bool = False, **ctx: Any) -> None:
+        self.write_batch([Record.from_item((level, message, {"exc_info": exc_info, **ctx}))])
+
     async def _log_async(
-        self, level: str, message: str, exc_info: bool = False, **kwargs: Any
+        self, level: str, message: str, exc_info: bool = False, **ctx: Any
     ) -> None:
-        pass
+        import asyncio  # noqa: PLC0415
+
+        await asyncio.to_thread(self._log_sync, level, message, exc_info, **ctx)
+
+    def flush(self) -> None:
+        """Push out anything the sink buffers."""
+        handler = getattr(self, "handler", None)
+        if handler is not None:
+            handler.flush()
+
+    def close(self) -> None:
+        """Release the sink's file, stream or socket."""
+        handler = getattr(self, "handler", None)
+        if handler is not None:
+            handler.close()
+
+    def sync(self) -> None:  # noqa: B027
+        """Force written records to disk; a sink without files has nothing to do."""
+
+    def sync_if_due(self) -> None:  # noqa: B027
+        """Sync if the sink's durability policy has records waiting for it."""
 
     def debug(self, message: str, **kwargs: Any) -> None:
         self._log_sync("debug", message, **kwargs)
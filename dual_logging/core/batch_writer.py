@@ -0,0 +1,72 @@
+import threading
+import traceback
+from collections.abc import Callable
+
+
+class BatchWriter:
+    """Long-lived background thread that drains a logger's queues in batches."""
+
+    def __init__(
+        self,
+        drain: Callable[[], int],
+        name: str = "dual-logger-writer",
+        min_interval: float = 0.01,
+        max_interval: float = 0.5,
+    ) -> None:
+        self._drain = drain
+        self.name = name
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the writer thread if it is not already running."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def notify(self) -> None:
+        """Wake the writer ahead of its next scheduled drain."""
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def stop(self, timeout: float | None = None) -> bool:
+        """Stop the writer after a final drain, returning False if it outlived ``timeout``."""
+        thread = self._thread
+        if thread is None:
+            return True
+        self._stop.set()
+        self._wake.set()
+        self._thread = None
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def _run(self) -> None:
+        interval = self.max_interval
+        while not self._stop.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            # Busy queues shorten the wait, idle ones let it back off.
+            if self._drain_safely():
+                interval = max(self.min_interval, interval / 2)
+            else:
+                interval = min(self.max_interval, interval * 2)
+        self._drain_safely()
+
+    def _drain_safely(self) -> int:
+        try:
+            return self._drain()
+        except Exception:
+            print(f"Writer error:\n{traceback.format_exc()}")
+            return 0
@@ -0,0 +1,413 @@
+"""Compact binary log files: a per-file string table, varints and length-prefixed blocks.
+
+A file is a sequence of blocks, each one type byte followed by a varint
+length and that many bytes:
+
+* ``H`` header: ``MAGIC`` then JSON metadata (logger name, time format,
+  UTC). It starts every file and resets the string table, so a writer
+  that reopens an existing file just appends a new header.
+* ``D`` data: entries, each a tag byte, a varint length and a body. A
+  ``0x01`` entry adds the next string to the table. A ``0x02`` entry is
+  one record: zigzag-varint timestamp delta in microseconds, the level's
+  string id, a flags byte, the message template's string id (or the
+  message inline), the callsite, the ``%``-args and ``key id, value``
+  pairs for the fields. Args that are not None, booleans, numbers or
+  strings would read back as their text rather than themselves, so those
+  messages are formatted when written and stored inline, without args.
+
+Values are tagged: None, booleans, zigzag varint ints, 8-byte floats,
+inline strings, tuples and, for anything nested, JSON text. A block is
+written in one ``write()``, so a reader only ever sees an incomplete block
+at the end of the file.
+"""
+
+import gzip
+import json
+import logging
+import struct
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import IO, Any
+
+from .fast_json import _fallback, make_formatter
+from .record import format_message
+from .rotation import BackgroundRotatingFileHandler, _zstd
+
+MAGIC = b"DLOGB\x01"
+HEADER, DATA = b"H", b"D"
+_STRING, _RECORD = 0x01, 0x02
+_EXC_INFO, _CALLSITE, _ARGS, _INLINE_MESSAGE = 1, 2, 4, 8
+_NONE, _TRUE, _FALSE, _INT, _FLOAT, _STR, _JSON, _TUPLE = range(8)
+_DOUBLE = struct.Struct("<d")
+_LOW_BITS, _MORE = 0x7F, 0x80
+# Type byte plus the longest length varint we write.
+_BLOCK_PREFIX = 1 + 10
+# Message templates are interned only while the table is smaller than this.
+MAX_TEMPLATES = 65_536
+
+# (timestamp_us, level, message, args, fields, exc_info, callsite)
+Row = tuple[int, str, Any, Any, Mapping[str, Any], bool, tuple[str, int] | None]
+# %-args of these types read back as themselves, so formatting can wait for the reader.
+_DEFERRABLE = frozenset({type(None), bool, int, float, str})
+
+
+def _varint(buf: bytearray, n: int) -> None:
+    while n > _LOW_BITS:
+        buf.append((n & _LOW_BITS) | _MORE)
+        n >>= 7
+    buf.append(n)
+
+
+def _deferrable(args: Any) -> bool:
+    values = args.values() if isinstance(args, Mapping) else args
+    return isinstance(args, tuple | Mapping) and all(type(v) in _DEFERRABLE for v in values)
+
+
+def _zigzag(n: int) -> int:
+    return n << 1 if n >= 0 else (-n << 1) - 1
+
+
+def _unzigzag(n: int) -> int:
+    return n >> 1 if not n & 1 else -((n + 1) >> 1)
+
+
+def _read_varint(data: bytes | memoryview, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & _LOW_BITS) << shift
+        if byte < _MORE:
+            return result, pos
+        shift += 7
+
+
+class BlockEncoder:
+    """Encode batches of rows into data blocks against one file's string table."""
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._last = 0
+
+    def start(self, meta: dict[str, Any]) -> bytes:
+        """Reset the string table and return the header block that begins a file."""
+        self._ids.clear()
+        self._last = 0
+        body = MAGIC + json.dumps(meta).encode("utf-8")
+        buf = bytearray(HEADER)
+        _varint(buf, len(body))
+        return bytes(buf + body)
+
+    def encode(self, rows: Iterable[Row]) -> bytes:
+        payload = bytearray()
+        for timestamp_us, level, template, template_args, fields, exc_info, callsite in rows:
+            rec = bytearray()
+            _varint(rec, _zigzag(timestamp_us - self._last))
+            self._last = timestamp_us
+            _varint(rec, self._sid(payload, level))
+            message, args, formatted = template, template_args, False
+            if args and not _deferrable(args):
+                message, args, formatted = format_message(template, args), None, True
+            interned = (
+                not formatted
+                and isinstance(message, str)
+                and (message in self._ids or len(self._ids) < MAX_TEMPLATES)
+            )
+            rec.append(
+                (_EXC_INFO if exc_info else 0)
+                | (_CALLSITE if callsite is not None else 0)
+                | (_ARGS if args else 0)
+                | (0 if interned else _INLINE_MESSAGE)
+            )
+            if interned:
+                _varint(rec, self._sid(payload, message))
+            else:
+                self._value(rec, message)
+            if callsite is not None:
+                _varint(rec, self._sid(payload, callsite[0]))
+                _varint(rec, callsite[1])
+            if args:
+                self._value(rec, args)
+            _varint(rec, len(fields))
+            for key, value in fields.items():
+                _varint(rec, self._sid(payload, key))
+                self._value(rec, value)
+            payload.append(_RECORD)
+            _varint(payload, len(rec))
+            payload += rec
+        block = bytearray(DATA)
+        _varint(block, len(payload))
+        return bytes(block + payload)
+
+    def _sid(self, payload: bytearray, text: str) -> int:
+        sid = self._ids.get(text)
+        if sid is None:
+            sid = self._ids[text] = len(self._ids)
+            raw = text.encode("utf-8")
+            payload.append(_STRING)
+            _varint(payload, len(raw))
+            payload += raw
+        return sid
+
+    def _value(self, buf: bytearray, value: Any) -> None:
+        if value is None:
+            buf.append(_NONE)
+        elif value is True:
+            buf.append(_TRUE)
+        elif value is False:
+            buf.append(_FALSE)
+        elif type(value) is int:
+            buf.append(_INT)
+            _varint(buf, _zigzag(value))
+        elif type(value) is float:
+            buf.append(_FLOAT)
+            buf += _DOUBLE.pack(value)
+        elif type(value) is tuple:
+            buf.append(_TUPLE)
+            _varint(buf, len(value))
+            for item in value:
+                self._value(buf, item)
+        else:
+            if isinstance(value, str):
+                tag, raw = _STR, value.encode("utf-8")
+            elif isinstance(value, dict | list):
+                tag, raw = _JSON, json.dumps(value, default=_fallback).encode("utf-8")
+            else:
+                tag, raw = _STR, str(_fallback(value)).encode("utf-8")
+            buf.append(tag)
+            _varint(buf, len(raw))
+            buf += raw
+
+
+class BinaryRotatingFileHandler(BackgroundRotatingFileHandler):
+    """BackgroundRotatingFileHandler writing binary blocks instead of JSON lines.
+
+    Every file, including each one opened by a rollover, starts with its own
+    header and string table, so rotated segments and compressed backups can
+    be read on their own.
+    """
+
+    file_mode = "ab"
+    file_encoding = None
+
+    def __init__(self, filename: str, *, meta: dict[str, Any], **kwargs: Any) -> None:
+        self.meta = meta
+        self._encoder = BlockEncoder()
+        self._needs_header = True
+        super().__init__(filename, **kwargs)
+
+    def write_rows(self, rows: list[Row]) -> int:
+        """Encode ``rows`` as one block and write it, returning the bytes written."""
+        with self.lock:
+            try:
+                if self.stream is None:
+                    if self._closed:
+                        return 0
+                    self.stream = self._open()
+                data = self._encode(rows)
+                if self._should_rollover(len(data)):
+                    self.doRollover()
+                    data = self._encode(rows)
+                self.stream.write(data)
+                self.stream.flush()
+                if self.index is not None:
+                    self.index.add_rows(self._size, len(data), rows)
+                self._size += len(data)
+                return len(data)
+            except Exception:
+                # The table may now disagree with the file; start a fresh one.
+                self._needs_header = True
+                raise
+
+    def _encode(self, rows: list[Row]) -> bytes:
+        header = b""
+        if self._needs_header:
+            header = self._encoder.start(self.meta)
+            self._needs_header = False
+        return header + self._encoder.encode(rows)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            callsite = (record.pathname, record.lineno) if record.pathname else None
+            row = (
+                int(record.created * 1_000_000),
+                record.levelname.lower(),
+                record.msg,
+                record.args,
+                {},
+                bool(record.exc_info),
+                callsite,
+            )
+            self.write_rows([row])
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:  # noqa: N802
+        self._needs_header = True
+        super().doRollover()
+
+
+class BinaryLogReader:
+    """Stream records out of a binary log, one complete block at a time.
+
+    ``records()`` reads whatever complete blocks are available and stops at
+    end of file or at a partially written block, leaving the position at its
+    start so a later call (``tail -f``) picks it up once it is complete.
+    """
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self.stream = stream
+        self.meta: dict[str, Any] = {}
+        self._strings: list[str] = []
+        self._last = 0
+        self._format_time = make_formatter("iso", False)
+
+    def records(
+        self, wanted: Callable[[int], bool] | None = None
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield ``(epoch_microseconds, event)`` with events in the JSON-lines schema.
+
+        Data blocks whose file offset ``wanted`` rejects only have their
+        strings and timestamps read, which keeps the table and clock in step.
+        """
+        while True:
+            offset = self.stream.tell()
+            if (block := self._next_block()) is None:
+                return
+            kind, body = block
+            if kind == HEADER:
+                self._start(body)
+            elif kind == DATA:
+                yield from self._data(body, wanted is None or wanted(offset))
+            else:
+                raise ValueError(f"not a binary log block: {kind!r}")
+
+    def events(self) -> Iterator[dict[str, Any]]:
+        for _, event in self.records():
+            yield event
+
+    def _next_block(self) -> tuple[bytes, bytes] | None:
+        start = self.stream.tell()
+        head = self.stream.read(_BLOCK_PREFIX)
+        if not head:
+            self.stream.seek(start)
+            return None
+        try:
+            length, offset = _read_varint(head, 1)
+        except IndexError:
+            self.stream.seek(start)
+            return None
+        self.stream.seek(start + offset)
+        body = self.stream.read(length)
+        if len(body) < length:
+            self.stream.seek(start)
+            return None
+        return head[:1], body
+
+    def _start(self, body: bytes) -> None:
+        if not body.startswith(MAGIC):
+            raise ValueError("not a dual_logging binary log")
+        self.meta = json.loads(body[len(MAGIC) :])
+        self._strings = []
+        self._last = 0
+        self._format_time = make_formatter(
+            self.meta.get("time_format"), self.meta.get("utc", False)
+        )
+
+    def _data(self, body: bytes, decode: bool) -> Iterator[tuple[int, dict[str, Any]]]:
+        view = memoryview(body)
+        pos = 0
+        while pos < len(view):
+            tag = view[pos]
+            length, pos = _read_varint(view, pos + 1)
+            end = pos + length
+            if tag == _STRING:
+                self._strings.append(str(view[pos:end], "utf-8"))
+            elif tag == _RECORD:
+                if decode:
+                    yield self._record(view, pos)
+                else:
+                    self._last += _unzigzag(_read_varint(view, pos)[0])
+            pos = end
+
+    def _record(self, view: memoryview, pos: int) -> tuple[int, dict[str, Any]]:
+        strings = self._strings
+        delta, pos = _read_varint(view, pos)
+        self._last += _unzigzag(delta)
+        level_id, pos = _read_varint(view, pos)
+        flags = view[pos]
+        if flags & _INLINE_MESSAGE:
+            message, pos = self._value(view, pos + 1)
+        else:
+            template_id, pos = _read_varint(view, pos + 1)
+            message = strings[template_id]
+        callsite = None
+        if flags & _CALLSITE:
+            path_id, pos = _read_varint(view, pos)
+            lineno, pos = _read_varint(view, pos)
+            callsite = (strings[path_id], lineno)
+        if flags & _ARGS:
+            args, pos = self._value(view, pos)
+            message = format_message(message, args)
+        count, pos = _read_varint(view, pos)
+        event: dict[str, Any] = {}
+        for _ in range(count):
+            key_id, pos = _read_varint(view, pos)
+            event[strings[key_id]], pos = self._value(view, pos)
+        event["exc_info"] = bool(flags & _EXC_INFO)
+        event["event"] = message
+        event["timestamp"] = self._format_time(self._last)
+        event["level"] = strings[level_id]
+        if callsite is not None:
+            event["pathname"], event["lineno"] = callsite
+        return self._last, event
+
+    def _value(self, view: memoryview, pos: int) -> tuple[Any, int]:
+        tag = view[pos]
+        pos += 1
+        if tag == _NONE:
+            return None, pos
+        if tag == _TRUE:
+            return True, pos
+        if tag == _FALSE:
+            return False, pos
+        if tag == _INT:
+            n, pos = _read_varint(view, pos)
+            return _unzigzag(n), pos
+        if tag == _FLOAT:
+            return _DOUBLE.unpack_from(view, pos)[0], pos + _DOUBLE.size
+        if tag == _TUPLE:
+            count, pos = _read_varint(view, pos)
+            items = []
+            for _ in range(count):
+                item, pos = self._value(view, pos)
+                items.append(item)
+            return tuple(items), pos
+        length, pos = _read_varint(view, pos)
+        text = str(view[pos : pos + length], "utf-8")
+        return (json.loads(text) if tag == _JSON else text), pos + length
+
+
+def open_log(path: str) -> IO[bytes]:
+    """Open a binary log for reading, decompressing ``.gz``/``.zst`` backups."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".zst"):
+        if _zstd is None:
+            raise ValueError("reading .zst needs Python 3.14+ or the 'zstandard' package")
+        return _zstd.open(path, "rb")
+    return open(path, "rb")
+
+
+def is_binary_log(path: str) -> bool:
+    """Return whether ``path`` (optionally compressed) starts with a binary log header."""
+    with open_log(path) as f:
+        head = f.read(_BLOCK_PREFIX + len(MAGIC))
+    if not head.startswith(HEADER):
+        return False
+    try:
+        _, pos = _read_varint(head, 1)
+    except IndexError:
+        return False
+    return head[pos : pos + len(MAGIC)] == MAGIC
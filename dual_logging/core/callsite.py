@@ -0,0 +1,51 @@
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable
+from types import CodeType
+
+Callsite = tuple[str, int]
+
+
+class CallsiteCache:
+    """Find the calling application frame and memoize its (pathname, lineno).
+
+    Frames from modules whose name starts with an ignored prefix (this
+    package, ``logging``, ``structlog`` and any extras) are skipped; their
+    code objects are remembered, so later walks pass them without looking
+    at the module again. Results are cached per code object and line, so
+    repeated calls from the same line share one tuple. At most
+    ``max_entries`` lines are remembered, least recently used dropped first,
+    so the cache does not keep the code of every line that ever logged alive.
+    """
+
+    def __init__(self, extra_ignores: Iterable[str] = (), max_entries: int = 1024) -> None:
+        self._ignores = ("dual_logging", "logging", "structlog", *extra_ignores)
+        self.max_entries = max_entries
+        # Code of the ignored modules only: a bounded set that lives as long as they do.
+        self._skipped: set[CodeType] = set()
+        self._sites: OrderedDict[tuple[CodeType, int], Callsite] = OrderedDict()
+
+    def capture(self) -> Callsite:
+        frame = sys._getframe(1)
+        skipped = self._skipped
+        while frame.f_back is not None:
+            code = frame.f_code
+            if code not in skipped:
+                if not frame.f_globals.get("__name__", "?").startswith(self._ignores):
+                    break
+                skipped.add(code)
+            frame = frame.f_back
+        key = (frame.f_code, frame.f_lineno)
+        sites = self._sites
+        site = sites.get(key)
+        if site is None:
+            site = sites[key] = (frame.f_code.co_filename, frame.f_lineno)
+            if len(sites) > self.max_entries:
+                sites.popitem(last=False)
+        else:
+            try:
+                sites.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread since the lookup; the tuple is still good.
+                pass
+        return site
@@ -1,18 +1,27 @@
 import logging
 from typing import Any
 
-from rich.logging import RichHandler
-
 from ..config.log_config import LoggerConfig
 from .base_logger import BaseLogger
+from .metrics import SinkMetrics
+from .plain_console import PlainConsoleHandler, PlainConsoleRenderer, resolve_console_format
+from .record import MISSING, REPLAYED, Record, as_records
 
 
 class ConsoleLogger(BaseLogger):
     def __init__(self, cfg: LoggerConfig) -> None:
         self._logger = logging.Logger(f"{cfg.name}-console")
         self._logger.setLevel(cfg.console_level_num)
+        self.metrics = SinkMetrics()
+        self.format = resolve_console_format(cfg)
+        self._plain = None if self.format == "rich" else PlainConsoleRenderer(cfg, self.format)
+
+        if self._plain is not None:
+            self.handler = PlainConsoleHandler()
+            self._logger.addHandler(self.handler)
+        elif not self._logger.handlers:
+            from rich.logging import RichHandler  # noqa: PLC0415
 
-        if not self._logger.handlers:
             self.handler = RichHandler(
                 show_time=True,
                 show_level=True,
@@ -23,11 +32,47 @@ class ConsoleLogger(BaseLogger):
         else:
             self.handler = self._logger.handlers[0]
 
-    def _log_sync(self, level: str, message: str, exc_info: bool = False, **ctx: Any) -> None:
-        ctx.pop("trace_id", None)
-        extra = " ".join(f"{k}={v}" for k, v in ctx.items())
-        fn = getattr(self._logger, level.lower(), self._logger.info)
-        fn(f"{message} {extra}", exc_info=exc_info)
+    def write_batch(self, records: list[Record]) -> None:
+        records = [r for r in as_records(records) if self._logger.isEnabledFor(r.levelno)]
+        if not records:
+            return
+        if self._plain is not None:
+            self._write_plain(records)
+            return
+        for record in records:
+            self._emit_rich(record)
+        self.metrics.wrote(len(records))
+
+    def _emit_rich(self, record: Record) -> None:
+        fields = record.merged()
+        extra = " ".join(f"{k}={v}" for k, v in fields.items() if k != "trace_id")
+        message = f"{record.text()} {extra}"
+        # A replayed exception is already in the fields as text; logging needs a tuple.
+        exc_info = record.exc_info if record.exc_info is not REPLAYED else None
+        if record.tracebacks is not None and (text := record.exception_text()) is not None:
+            if record.exc_repeat:
+                # Shown in full earlier in the window; Rich would render it all again.
+                message, exc_info = f"{message}\n{text}", None
+            else:
+                # Rich draws the traceback itself; keep the fingerprint line for reference.
+                marker = text.rpartition("\n")[2]
+                message = f"{message} {marker}"
+        callsite = record.callsite
+        if callsite is None or callsite is MISSING:
+            callsite = ("(unknown file)", 0)  # what logging itself uses without a caller
+        # Build the LogRecord at the captured callsite so Rich shows the caller's path.
+        log_record = self._logger.makeRecord(
+            self._logger.name, record.levelno, *callsite, message, None, exc_info
+        )
+        log_record.created = record.timestamp_us / 1_000_000
+        log_record.msecs = record.timestamp_us % 1_000_000 // 1000
+        self._logger.handle(log_record)
+
+    def _write_plain(self, records: list[Record]) -> None:
+        """Render a batch without Rich and hand it to stdout in a single write."""
+        text = "\n".join([self._plain.render(r) for r in records]) + "\n"
+        self.handler.write_batch(text)
+        self.metrics.wrote(len(records), len(text))
 
     async def _log_async(
         self, level: str, message: str, exc_info: bool = False, **ctx: Any
@@ -0,0 +1,124 @@
+"""When written records are forced to disk, and draining loggers when the process exits."""
+
+import atexit
+import logging
+import signal
+import threading
+import time
+import traceback
+import weakref
+from typing import Any
+
+from .record import Record
+
+DURABILITY_MODES = ("none", "interval", "every_n", "level")
+
+
+class FsyncPolicy:
+    """Decide after each written batch whether to fsync the log file.
+
+    ``"none"`` leaves write-back to the OS. ``"interval"`` syncs at most once
+    per ``interval`` seconds, and once more when writing goes quiet so the
+    last records are not left behind. ``"every_n"`` syncs once ``every``
+    records have been written since the last sync, and ``"level"`` as soon as
+    a batch holds a record at ``level`` or above, which also covers every
+    record written before it.
+    """
+
+    def __init__(
+        self,
+        mode: str = "none",
+        *,
+        interval: float = 1.0,
+        every: int = 100,
+        level: int = logging.WARNING,
+    ) -> None:
+        if mode not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {DURABILITY_MODES}, not {mode!r}")
+        self.mode = mode
+        self.interval = interval
+        self.every = every
+        self.level = level
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "none"
+
+    def wrote(self, records: list[Record]) -> bool:
+        """Count a written batch and return whether it should be synced now."""
+        if self.mode == "none":
+            return False
+        with self._lock:
+            self._unsynced += len(records)
+            if self.mode == "every_n":
+                return self._unsynced >= self.every
+            if self.mode == "level":
+                return any(r.levelno >= self.level for r in records)
+            return time.monotonic() - self._last_sync >= self.interval
+
+    def due(self) -> bool:
+        """Return whether an ``"interval"`` policy has records waiting out a quiet spell."""
+        with self._lock:
+            return (
+                self.mode == "interval"
+                and self._unsynced > 0
+                and time.monotonic() - self._last_sync >= self.interval
+            )
+
+    def synced(self) -> None:
+        with self._lock:
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+
+_loggers: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_hooked = threading.Event()
+_signals: set[int] = set()
+_lock = threading.Lock()
+
+
+def drain_at_exit(logger: Any, signals: tuple[str, ...] = ()) -> None:
+    """Shut ``logger`` down at interpreter exit, and on each of ``signals`` first exit cleanly.
+
+    A signal is only taken over while it still has its default disposition
+    and only from the main thread; its handler raises ``SystemExit`` so the
+    main thread unwinds, releasing any lock it held mid-write, before the
+    exit hook drains the queues. SIGINT needs nothing: KeyboardInterrupt
+    already ends in the exit hook.
+    """
+    with _lock:
+        _loggers.add(logger)
+        if not _hooked.is_set():
+            atexit.register(drain_all)
+            _hooked.set()
+        if threading.current_thread() is not threading.main_thread():
+            return
+        for name in signals:
+            signum = getattr(signal, name)
+            if signum not in _signals and signal.getsignal(signum) is signal.SIG_DFL:
+                signal.signal(signum, _exit_on_signal)
+                _signals.add(signum)
+
+
+def forget(logger: Any) -> None:
+    """Stop draining ``logger`` at exit."""
+    with _lock:
+        _loggers.discard(logger)
+
+
+def drain_all() -> None:
+    """Shut down every logger registered with ``drain_at_exit``, each within its own deadline."""
+    with _lock:
+        loggers = list(_loggers)
+    for logger in loggers:
+        try:
+            logger.shutdown()
+        except Exception:
+            print(f"Shutdown error:\n{traceback.format_exc()}")
+
+
+def _exit_on_signal(signum: int, frame: Any) -> None:
+    raise SystemExit(128 + signum)
@@ -0,0 +1,124 @@
+import json
+import time
+from datetime import UTC, datetime
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+from ..config.log_config import LoggerConfig
+
+try:
+    from json.encoder import c_make_encoder
+except ImportError:
+    c_make_encoder = None
+
+
+def _fallback(obj: Any) -> Any:
+    """Serialize unknown objects the way structlog's JSONRenderer does."""
+    structlog_hook = getattr(obj, "__structlog__", None)
+    if structlog_hook is not None:
+        return structlog_hook()
+    return repr(obj)
+
+
+def _make_encoder():
+    if c_make_encoder is None:
+        return json.JSONEncoder(default=_fallback).encode
+    encoder = c_make_encoder(
+        None, _fallback, encode_basestring_ascii, None, ": ", ", ", False, False, True
+    )
+    return lambda event: "".join(encoder(event, 0))
+
+
+# Same separators, escaping and fallback as structlog's JSONRenderer (json.dumps defaults).
+encode_event = _make_encoder()
+
+# Levels the structlog pipeline renders under their own name; a record at any
+# other level goes through that pipeline so both paths agree on its name.
+RENDERED_LEVELS = frozenset({"debug", "info", "warning", "error", "critical"})
+
+
+class FastJSONRenderer:
+    """Render file records straight to JSON lines without the structlog pipeline.
+
+    Output is byte-for-byte what ``FileLogger``'s structlog chain produces:
+    bound context first, then ``exc_info``, ``event``, ``timestamp``,
+    ``level`` and, when a callsite was captured, ``pathname`` and
+    ``lineno``, with ``json.dumps``' separators and ASCII escaping. The encoder and the
+    timestamp formatter are built once; no logger is bound per record. Only
+    levels in ``RENDERED_LEVELS`` are rendered here.
+    """
+
+    def __init__(self, cfg: LoggerConfig) -> None:
+        self._now = make_clock(cfg.time_format, cfg.use_utc)
+        self._format = make_formatter(cfg.time_format, cfg.use_utc)
+        self._encode = encode_event
+
+    def render(
+        self,
+        level: str,
+        message: Any,
+        exc_info: Any = False,
+        ctx: dict[str, Any] | None = None,
+        callsite: tuple[str, int] | None = None,
+        *,
+        timestamp_us: int | None = None,
+    ) -> str:
+        event = dict(ctx) if ctx else {}
+        event["exc_info"] = bool(exc_info)
+        event["event"] = message
+        event["timestamp"] = self._now() if timestamp_us is None else self._format(timestamp_us)
+        event["level"] = level
+        if callsite is not None:
+            event["pathname"], event["lineno"] = callsite
+        return self._encode(event)
+
+
+def make_clock(fmt: str | None, utc: bool):
+    """Build a callable returning the timestamp value TimeStamper would add."""
+    if fmt is None:
+        return time.time
+    if fmt.upper() == "ISO":
+        return _IsoClock(utc)
+    if utc:
+        return lambda: datetime.now(tz=UTC).strftime(fmt)
+    return lambda: datetime.now().astimezone().strftime(fmt)
+
+
+def make_formatter(fmt: str | None, utc: bool):
+    """Build a callable formatting epoch microseconds as TimeStamper would at that instant."""
+    if fmt is None:
+        return lambda micros: micros / 1_000_000
+    if fmt.upper() == "ISO":
+        clock = _IsoClock(utc)
+        return lambda micros: clock.at(*divmod(micros, 1_000_000))
+
+    def strftime(micros: int) -> str:
+        seconds, fraction = divmod(micros, 1_000_000)
+        stamp = datetime.fromtimestamp(seconds, UTC).replace(microsecond=fraction)
+        return (stamp if utc else stamp.astimezone()).strftime(fmt)
+
+    return strftime
+
+
+class _IsoClock:
+    """ISO 8601 timestamps that only run the date formatting once per second."""
+
+    def __init__(self, utc: bool) -> None:
+        self._tz = UTC if utc else None
+        self._suffix = "Z" if utc else ""
+        self._cached: tuple[int, str] = (-1, "")
+
+    def __call__(self) -> str:
+        seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+        return self.at(seconds, nanos // 1000)
+
+    def at(self, seconds: int, micros: int) -> str:
+        cached_seconds, prefix = self._cached
+        if cached_seconds != seconds:
+            stamp = datetime.fromtimestamp(seconds, self._tz).replace(tzinfo=None)
+            prefix = stamp.isoformat()
+            self._cached = (seconds, prefix)
+        # datetime.isoformat() leaves out a zero fraction entirely.
+        if micros:
+            return f"{prefix}.{micros:06d}{self._suffix}"
+        return prefix + self._suffix
@@ -1,19 +1,18 @@
 import logging
-from logging.handlers import RotatingFileHandler
+import os
 from typing import Any
 
-import aiofiles
-import structlog
-from structlog.processors import (
-    CallsiteParameter,
-    CallsiteParameterAdder,
-    JSONRenderer,
-    TimeStamper,
-    add_log_level,
-)
-
 from ..config.log_config import LoggerConfig
 from .base_logger import BaseLogger
+from .binary_format import BinaryRotatingFileHandler
+from .callsite import CallsiteCache
+from .durability import FsyncPolicy
+from .fast_json import RENDERED_LEVELS, FastJSONRenderer, make_formatter
+from .log_index import BlockSummary, LogIndex
+from .metrics import SinkMetrics
+from .mmap_writer import MmapSegmentHandler
+from .record import MISSING, Record, as_records
+from .rotation import BackgroundRotatingFileHandler
 
 
 class FileLogger(BaseLogger):
@@ -22,48 +21,181 @@ class FileLogger(BaseLogger):
         self._logger = logging.Logger(f"{cfg.name}-file")
         self._logger.setLevel(cfg.file_level_num)
 
+        self.metrics = SinkMetrics()
         if not self._logger.handlers:
-            self.handler = RotatingFileHandler(
-                cfg.log_file_path,
-                maxBytes=cfg.max_bytes,
-                backupCount=cfg.backup_count,
-            )
+            os.makedirs(os.path.dirname(cfg.log_file_path) or ".", exist_ok=True)
+            if cfg.file_backend == "mmap":
+                self.handler = MmapSegmentHandler(
+                    cfg.log_file_path,
+                    segment_size=cfg.max_bytes,
+                    backup_count=cfg.backup_count,
+                    sync=cfg.mmap_sync,
+                    sync_interval=cfg.mmap_sync_interval,
+                    compression=cfg.rotate_compression,
+                    max_total_bytes=cfg.rotate_max_total_bytes,
+                )
+            else:
+                handler_cls = BackgroundRotatingFileHandler
+                options: dict[str, Any] = {}
+                if cfg.file_index:
+                    options["index"] = LogIndex(
+                        os.path.abspath(cfg.log_file_path), cfg.file_index_block_bytes
+                    )
+                if cfg.file_format == "binary":
+                    handler_cls = BinaryRotatingFileHandler
+                    options["meta"] = {
+                        "logger": cfg.name,
+                        "time_format": cfg.time_format,
+                        "utc": cfg.use_utc,
+                    }
+                self.handler = handler_cls(
+                    cfg.log_file_path,
+                    **options,
+                    max_bytes=cfg.max_bytes,
+                    backup_count=cfg.backup_count,
+                    when=cfg.rotate_when,
+                    interval=cfg.rotate_interval,
+                    utc=cfg.use_utc,
+                    compression=cfg.rotate_compression,
+                    max_total_bytes=cfg.rotate_max_total_bytes,
+                )
+            self.handler.on_rollover = self._count_rollover
+            self.handler.fsync_on_close = cfg.durability != "none"
             self.handler.setFormatter(logging.Formatter("%(message)s"))
             self._logger.addHandler(self.handler)
         else:
             self.handler = self._logger.handlers[0]
 
+        self.fsync = FsyncPolicy(
+            cfg.durability,
+            interval=cfg.fsync_interval,
+            every=cfg.fsync_every,
+            level=cfg.fsync_level_num,
+        )
+        self._callsites = CallsiteCache(cfg.extra_ignores)
+        self._format_time = make_formatter(cfg.time_format, cfg.use_utc)
+        self._renderer = None
+        self._fast_renderer = FastJSONRenderer(cfg) if cfg.fast_json else None
+
+    def _structlog_renderer(self) -> Any:
+        """Build the structlog pipeline, importing structlog only once a record needs it."""
+        import structlog  # noqa: PLC0415
+        from structlog.processors import JSONRenderer, add_log_level  # noqa: PLC0415
+
         pipeline = [
-            TimeStamper(fmt=cfg.time_format, utc=cfg.use_utc),
+            self._add_timestamp,
             add_log_level,
-            CallsiteParameterAdder(
-                parameters=[CallsiteParameter.PATHNAME, CallsiteParameter.LINENO],
-                additional_ignores=cfg.extra_ignores,
-            ),
+            self._add_callsite,
             JSONRenderer(),
         ]
-        self._struct_logger = structlog.wrap_logger(self._logger, processors=pipeline)
+        return structlog.wrap_logger(structlog.ReturnLogger(), processors=pipeline)
+
+    def _count_rollover(self) -> None:
+        self.metrics.rotated()
 
-    def _log_sync(self, level: str, message: str, exc_info: bool = False, **ctx: Any) -> None:
-        logger = self._struct_logger.bind(**ctx)
-        getattr(logger, level)(message, exc_info=exc_info)
-        logger.unbind(*ctx.keys())
+    def _add_callsite(self, logger: Any, method_name: str, event_dict: dict) -> dict:
+        """Move the record's callsite into ``pathname``/``lineno``."""
+        callsite = event_dict.pop("callsite")
+        if callsite is not None:
+            event_dict["pathname"], event_dict["lineno"] = callsite
+        return event_dict
+
+    def _add_timestamp(self, logger: Any, method_name: str, event_dict: dict) -> dict:
+        """Stamp the event with the time the record was created, as TimeStamper formats it."""
+        event_dict["timestamp"] = self._format_time(event_dict.pop("timestamp_us"))
+        return event_dict
+
+    def write_batch(self, records: list[Record]) -> None:
+        records = [r for r in as_records(records) if self._logger.isEnabledFor(r.levelno)]
+        if not records:
+            return
+        if isinstance(self.handler, BinaryRotatingFileHandler):
+            self._write_binary(records)
+        else:
+            self._write_json(records)
+        if self.fsync.wrote(records):
+            self.sync()
+
+    def _write_json(self, records: list[Record]) -> None:
+        # One emit per batch: a single write, flush and rollover check.
+        text = "\n".join([self._render(r) for r in records])
+        record = self._logger.makeRecord(self._logger.name, logging.INFO, "", 0, text, None, None)
+        if getattr(self.handler, "index", None) is not None:
+            record.index_summary = self._summarize(records)
+        self.handler.handle(record)
+        # Rendered JSON is pure ASCII, so characters equal bytes; +1 for the terminator.
+        self.metrics.wrote(len(records), len(text) + 1)
+
+    def _write_binary(self, records: list[Record]) -> None:
+        """Write a batch as one binary block; templates and ``%``-args are stored unformatted."""
+        rows = [
+            (
+                r.timestamp_us,
+                r.level,
+                r.message,
+                r.args,
+                r.merged(),
+                r.exc_info is not None,
+                self._callsite(r),
+            )
+            for r in records
+        ]
+        size = self.handler.write_rows(rows)
+        self.metrics.wrote(len(rows), size)
+
+    @staticmethod
+    def _summarize(records: list[Record]) -> BlockSummary:
+        """Describe a rendered batch for the index: its levels, fields and time range."""
+        summary = BlockSummary(records[0].timestamp_us)
+        for r in records:
+            summary.add(r.level, r.merged(), r.timestamp_us)
+        return summary
+
+    def _callsite(self, record: Record) -> tuple[str, int] | None:
+        if record.callsite is MISSING:
+            # Called directly rather than through DualLogger: find the caller now.
+            return self._callsites.capture()
+        return record.callsite
+
+    def _render(self, record: Record) -> str:
+        callsite = self._callsite(record)
+        exc_info = record.exc_info is not None
+        if self._fast_renderer is not None and record.level in RENDERED_LEVELS:
+            return self._fast_renderer.render(
+                record.level,
+                record.text(),
+                exc_info,
+                record.merged(),
+                callsite,
+                timestamp_us=record.timestamp_us,
+            )
+        if self._renderer is None:
+            self._renderer = self._structlog_renderer()
+        logger = self._renderer.bind(**record.merged())
+        return getattr(logger, record.level, logger.info)(
+            record.text(), exc_info=exc_info, callsite=callsite, timestamp_us=record.timestamp_us
+        )
 
     async def _log_async(
         self, level: str, message: str, exc_info: bool = False, **ctx: Any
     ) -> None:
-        log_entry = structlog.processors.JSONRenderer()({
-            "level": level.upper(),
-            "event": message,
-            "exc_info": exc_info,
-            "timestamp": TimeStamper(fmt=self.cfg.time_format, utc=self.cfg.use_utc)(),
-            **ctx,
-        })
-        await self._write_log(log_entry)
-
-    async def _write_log(self, log_entry: str) -> None:
-        async with aiofiles.open(self.cfg.log_file_path, "a") as f:
-            await f.write(log_entry + "\n")
+        record = Record.from_item((level, message, {"exc_info": exc_info, **ctx}))
+        if record.callsite is MISSING:
+            record.callsite = self._callsites.capture()
+        # Already loaded: there is a running loop.
+        import asyncio  # noqa: PLC0415
+
+        await asyncio.to_thread(self.write_batch, [record])
+
+    def sync(self) -> None:
+        """Force everything written so far to disk."""
+        self.handler.fsync()
+        self.fsync.synced()
+        self.metrics.synced()
+
+    def sync_if_due(self) -> None:
+        if self.fsync.due():
+            self.sync()
 
     def flush(self) -> None:
         self.handler.flush()
@@ -0,0 +1,313 @@
+"""Sidecar indexes over log files, and queries that use them to skip unrelated data.
+
+Next to ``app.log`` the writer keeps ``app.log.idx``: one JSON line per
+span of roughly ``block_bytes`` of log, holding its byte offset and length,
+the first and last write time in epoch microseconds, a bitmask of the
+levels in it and a Bloom filter of its ``key`` and ``key=value`` field
+tokens. Spans are summarised batch by batch and appended once complete.
+The sidecar moves with its log through rotation, so ``app.log.3.gz`` is
+described by ``app.log.3.idx``.
+
+Whatever the index does not cover, such as a span not yet flushed before a
+crash or a file written with indexing off, is always read; the index only
+ever narrows what is scanned.
+"""
+
+import json
+import logging
+import os
+import zlib
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime
+from typing import IO, Any
+
+from .binary_format import BinaryLogReader, is_binary_log, open_log
+from .rotation import BackupRotator, backup_files
+
+SIDECAR_SUFFIX = BackupRotator.SIDECAR_SUFFIX
+BLOOM_BITS = 4096
+_LEVELS = logging.getLevelNamesMapping()
+_ALL_LEVELS = (1 << 6) - 1
+
+
+def _level_bit(level: str) -> int:
+    return 1 << min(_LEVELS.get(level.upper(), logging.INFO) // 10, 5)
+
+
+def _token(key: str, value: Any) -> str:
+    """Return the ``key=value`` text indexed for a field, with values spelled as in JSON."""
+    if isinstance(value, str) or type(value) is int:
+        return f"{key}={value}"
+    return f"{key}={json.dumps(value, default=repr, separators=(',', ':'))}"
+
+
+def _bloom_bits(token: str) -> int:
+    raw = token.encode("utf-8")
+    return 1 << (zlib.crc32(raw) % BLOOM_BITS) | 1 << (zlib.crc32(raw, 0x5BD1E995) % BLOOM_BITS)
+
+
+class BlockSummary:
+    """What one written batch contains: its time range, levels and field tokens."""
+
+    __slots__ = ("first", "last", "levels", "tokens")
+
+    def __init__(self, first: int) -> None:
+        self.first = self.last = first
+        self.levels = 0
+        self.tokens: set[str] = set()
+
+    def add(self, level: str, fields: Mapping[str, Any], timestamp_us: int | None = None) -> None:
+        if timestamp_us is not None:
+            self.first = min(self.first, timestamp_us)
+            self.last = max(self.last, timestamp_us)
+        self.levels |= _level_bit(level)
+        tokens = self.tokens
+        for key, value in fields.items():
+            tokens.add(key)
+            try:
+                tokens.add(_token(key, value))
+            except (TypeError, ValueError):
+                pass
+
+
+class LogIndex:
+    """Append-only writer for one log file's sidecar index."""
+
+    def __init__(self, log_path: str, block_bytes: int = 64 * 1024) -> None:
+        self.path = log_path + SIDECAR_SUFFIX
+        self.block_bytes = block_bytes
+        self._entry: dict[str, Any] | None = None
+        self._bloom = 0
+        self._stream = self._open(os.path.getsize(log_path) if os.path.exists(log_path) else 0)
+
+    def _open(self, log_size: int) -> IO[str]:
+        end = 0
+        if os.path.exists(self.path):
+            entries = read_index(self.path[: -len(SIDECAR_SUFFIX)])
+            end = max((e["offset"] + e["length"] for e in entries), default=0)
+        stream = open(self.path, "a", encoding="utf-8")
+        if log_size > end:
+            # Written without an index, or lost in a crash: mark it to be scanned.
+            stream.write(
+                json.dumps({"offset": end, "length": log_size - end, "first": None}) + "\n"
+            )
+            stream.flush()
+        return stream
+
+    def add(self, offset: int, length: int, summary: BlockSummary) -> None:
+        """Fold a batch just written at ``offset`` into the current span."""
+        entry = self._entry
+        if entry is None or entry["offset"] + entry["length"] != offset:
+            self.flush()
+            entry = self._entry = {
+                "offset": offset,
+                "length": 0,
+                "first": summary.first,
+                "last": summary.last,
+                "levels": 0,
+            }
+        entry["length"] += length
+        entry["first"] = min(entry["first"], summary.first)
+        entry["last"] = max(entry["last"], summary.last)
+        entry["levels"] |= summary.levels
+        for token in summary.tokens:
+            self._bloom |= _bloom_bits(token)
+        if entry["length"] >= self.block_bytes:
+            self.flush()
+
+    def add_record(self, offset: int, length: int, record: logging.LogRecord) -> None:
+        """Index a handler write, using the summary FileLogger attached to the record if any."""
+        summary = getattr(record, "index_summary", None)
+        if summary is None:
+            summary = BlockSummary(int(record.created * 1_000_000))
+            summary.add(record.levelname, {})
+        self.add(offset, length, summary)
+
+    def add_rows(self, offset: int, length: int, rows: list[tuple]) -> None:
+        """Index a binary block from its ``(timestamp_us, level, _, _, fields, ...)`` rows."""
+        summary = BlockSummary(rows[0][0])
+        for row in rows:
+            summary.add(row[1], row[4], row[0])
+        self.add(offset, length, summary)
+
+    def flush(self) -> None:
+        """Write out the span being built, if any."""
+        if self._entry is None:
+            return
+        entry, self._entry = self._entry, None
+        entry["bloom"] = f"{self._bloom:x}"
+        self._bloom = 0
+        self._stream.write(json.dumps(entry) + "\n")
+        self._stream.flush()
+
+    def roll(self, moved_to: str) -> None:
+        """Move the sidecar along with a log just renamed to ``moved_to`` and start a new one."""
+        self.close()
+        if os.path.exists(self.path):
+            os.replace(self.path, moved_to + SIDECAR_SUFFIX)
+        self._stream = open(self.path, "w", encoding="utf-8")
+
+    def close(self) -> None:
+        self.flush()
+        self._stream.close()
+
+
+def read_index(log_path: str) -> list[dict[str, Any]]:
+    """Return the index entries for ``log_path``, or ``[]`` if it has none."""
+    name = log_path
+    for suffix in (".gz", ".zst"):
+        name = name.removesuffix(suffix)
+    try:
+        with open(name + SIDECAR_SUFFIX, encoding="utf-8") as f:
+            entries = []
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break  # torn last line
+            return entries
+    except FileNotFoundError:
+        return []
+
+
+def log_files(log_path: str) -> list[str]:
+    """Return ``log_path``'s backups, oldest first, followed by the log itself."""
+    files = [path for _, path, _ in reversed(backup_files(log_path))]
+    if os.path.exists(log_path):
+        files.append(log_path)
+    return files
+
+
+def _epoch_us(value: datetime | float | None) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.timestamp()
+    return int(value * 1_000_000)
+
+
+def _event_us(timestamp: Any) -> int | None:
+    """Recover the epoch time of a JSON record's timestamp when its format allows it."""
+    if isinstance(timestamp, int | float):
+        return int(timestamp * 1_000_000)
+    try:
+        return int(datetime.fromisoformat(timestamp).timestamp() * 1_000_000)
+    except (TypeError, ValueError):
+        return None
+
+
+class _Filter:
+    def __init__(
+        self,
+        start: datetime | float | None,
+        end: datetime | float | None,
+        levels: Iterable[str] | None,
+        fields: Mapping[str, Any] | None,
+    ) -> None:
+        self.start = _epoch_us(start)
+        self.end = _epoch_us(end)
+        self.levels = {level.lower() for level in levels} if levels else None
+        self.level_mask = _ALL_LEVELS
+        if self.levels:
+            self.level_mask = 0
+            for level in self.levels:
+                self.level_mask |= _level_bit(level)
+        self.fields = {key: _token(key, value) for key, value in (fields or {}).items()}
+        self.bloom = 0
+        for key, token in self.fields.items():
+            self.bloom |= _bloom_bits(key) | _bloom_bits(token)
+
+    def block(self, entry: dict[str, Any]) -> bool:
+        """Return whether an index entry may hold a match."""
+        if entry.get("first") is None:
+            return True
+        if self.start is not None and entry["last"] < self.start:
+            return False
+        if self.end is not None and entry["first"] > self.end:
+            return False
+        if not entry["levels"] & self.level_mask:
+            return False
+        return int(entry["bloom"], 16) & self.bloom == self.bloom
+
+    def record(self, event: dict[str, Any], micros: int | None) -> bool:
+        if self.levels is not None and str(event.get("level")).lower() not in self.levels:
+            return False
+        for key, token in self.fields.items():
+            if key not in event or _token(key, event[key]) != token:
+                return False
+        if micros is not None:
+            if self.start is not None and micros < self.start:
+                return False
+            if self.end is not None and micros > self.end:
+                return False
+        return True
+
+
+def _spans(entries: list[dict[str, Any]], wanted: _Filter) -> list[tuple[int, int | None]]:
+    """Merge the wanted entries into ``(offset, end)`` ranges; the unindexed tail ends at None."""
+    spans: list[tuple[int, int | None]] = []
+    indexed_end = 0
+    for entry in sorted(entries, key=lambda e: e["offset"]):
+        end = entry["offset"] + entry["length"]
+        indexed_end = max(indexed_end, end)
+        if not wanted.block(entry):
+            continue
+        if spans and spans[-1][1] == entry["offset"]:
+            spans[-1] = (spans[-1][0], end)
+        else:
+            spans.append((entry["offset"], end))
+    if spans and spans[-1][1] == indexed_end:
+        spans[-1] = (spans[-1][0], None)
+    else:
+        spans.append((indexed_end, None))
+    return spans
+
+
+def _query_json(path: str, spans: list[tuple[int, int | None]], wanted: _Filter) -> Iterator[dict]:
+    with open_log(path) as f:
+        for offset, end in spans:
+            f.seek(offset)
+            data = f.read() if end is None else f.read(end - offset)
+            for line in data.splitlines():
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue  # torn or foreign line
+                if wanted.record(event, _event_us(event.get("timestamp"))):
+                    yield event
+
+
+def _query_binary(
+    path: str, spans: list[tuple[int, int | None]], wanted: _Filter
+) -> Iterator[dict]:
+    def in_spans(offset: int) -> bool:
+        return any(start <= offset and (end is None or offset < end) for start, end in spans)
+
+    with open_log(path) as f:
+        for micros, event in BinaryLogReader(f).records(in_spans):
+            if wanted.record(event, micros):
+                yield event
+
+
+def query(
+    log_path: str,
+    *,
+    start: datetime | float | None = None,
+    end: datetime | float | None = None,
+    levels: Iterable[str] | None = None,
+    fields: Mapping[str, Any] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the records of ``log_path`` and its backups matching every given filter.
+
+    ``start`` and ``end`` are datetimes or epoch seconds, inclusive;
+    ``levels`` are level names; ``fields`` must all be present with equal
+    values (``{"status": 500}`` and ``{"status": "500"}`` match alike).
+    Files are read oldest first, and only the spans their index cannot rule out.
+    """
+    wanted = _Filter(start, end, levels, fields)
+    for path in log_files(log_path):
+        spans = _spans(read_index(path), wanted)
+        if is_binary_log(path):
+            yield from _query_binary(path, spans, wanted)
+        else:
+            yield from _query_json(path, spans, wanted)
@@ -0,0 +1,245 @@
+import bisect
+import os
+import threading
+import traceback
+from collections.abc import Callable
+from typing import Any
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style. Not locked; callers hold one."""
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative, buckets = 0, {}
+        for bound, count in zip((*self.bounds, float("inf")), self.counts, strict=True):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+
+class SinkMetrics:
+    """Write-side counters for one sink."""
+
+    def __init__(self, lock: "threading.Lock | None" = None) -> None:
+        self._lock = lock or threading.Lock()
+        self.records_written = 0
+        self.bytes_written = 0
+        self.rotations = 0
+        self.fsyncs = 0
+        self.records_failed = 0
+        self.reconnects = 0
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.flush_seconds = Histogram(LATENCY_BUCKETS)
+
+    def wrote(self, records: int, nbytes: int = 0) -> None:
+        with self._lock:
+            self.records_written += records
+            self.bytes_written += nbytes
+
+    def flushed(self, batch_size: int, seconds: float) -> None:
+        with self._lock:
+            self.batch_sizes.observe(batch_size)
+            self.flush_seconds.observe(seconds)
+
+    def rotated(self) -> None:
+        with self._lock:
+            self.rotations += 1
+
+    def synced(self) -> None:
+        with self._lock:
+            self.fsyncs += 1
+
+    def failed(self, records: int) -> None:
+        with self._lock:
+            self.records_failed += records
+
+    def reconnected(self) -> None:
+        with self._lock:
+            self.reconnects += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "records_written": self.records_written,
+            "bytes_written": self.bytes_written,
+            "rotations": self.rotations,
+            "fsyncs": self.fsyncs,
+            "records_failed": self.records_failed,
+            "reconnects": self.reconnects,
+            "flush_batch_size": self.batch_sizes.snapshot(),
+            "flush_seconds": self.flush_seconds.snapshot(),
+        }
+
+
+class LoggerMetrics:
+    """All sink counters of one DualLogger behind a single lock, so snapshots are consistent."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sinks: dict[str, SinkMetrics] = {}
+
+    def sink(self, name: str) -> SinkMetrics:
+        with self._lock:
+            if name not in self._sinks:
+                self._sinks[name] = SinkMetrics(self._lock)
+            return self._sinks[name]
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {name: sink.snapshot() for name, sink in self._sinks.items()}
+
+
+def to_prometheus(stats: dict[str, Any], logger: str) -> str:
+    """Render a ``DualLogger.stats()`` snapshot in the Prometheus text exposition format."""
+    lines: list[str] = []
+    label = _escape(logger)
+
+    def metric(name: str, kind: str, samples: list[tuple[str, float]]) -> None:
+        lines.append(f"# TYPE dual_logging_{name} {kind}")
+        lines.extend(f"dual_logging_{name}{{{labels}}} {value}" for labels, value in samples)
+
+    queues = stats["queues"].items()
+    metric(
+        "queue_depth", "gauge", [(f'logger="{label}",queue="{q}"', s["depth"]) for q, s in queues]
+    )
+    metric(
+        "queue_peak_depth",
+        "gauge",
+        [(f'logger="{label}",queue="{q}"', s["peak"]) for q, s in queues],
+    )
+    metric(
+        "dropped_total",
+        "counter",
+        [
+            (f'logger="{label}",queue="{q}",reason="{reason}",level="{level}"', count)
+            for q, s in queues
+            for reason, levels in s["drops"].items()
+            for level, count in levels.items()
+        ],
+    )
+
+    metric("suppressed_total", "counter", [(f'logger="{label}"', stats.get("suppressed", 0))])
+    sampling = stats.get("sampling") or {"sampled": {}, "keep_rate": {}}
+    metric(
+        "sampled_total",
+        "counter",
+        [(f'logger="{label}",level="{lvl}"', n) for lvl, n in sampling["sampled"].items()],
+    )
+    metric(
+        "sample_keep_rate",
+        "gauge",
+        [(f'logger="{label}",level="{lvl}"', r) for lvl, r in sampling["keep_rate"].items()],
+    )
+
+    tracebacks = stats.get("tracebacks") or {"rendered": 0, "referenced": 0}
+    metric(
+        "tracebacks_total",
+        "counter",
+        [
+            (f'logger="{label}",form="{form}"', tracebacks[form])
+            for form in ("rendered", "referenced")
+        ],
+    )
+
+    sinks = stats["sinks"].items()
+    for field in (
+        "records_written",
+        "bytes_written",
+        "rotations",
+        "fsyncs",
+        "records_failed",
+        "reconnects",
+    ):
+        metric(
+            f"{field}_total",
+            "counter",
+            [(f'logger="{label}",sink="{n}"', s[field]) for n, s in sinks],
+        )
+    for field in ("flush_batch_size", "flush_seconds"):
+        lines.append(f"# TYPE dual_logging_{field} histogram")
+        for name, sink in sinks:
+            hist = sink[field]
+            base = f'logger="{label}",sink="{name}"'
+            for bound, count in hist["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'dual_logging_{field}_bucket{{{base},le="{le}"}} {count}')
+            lines.append(f"dual_logging_{field}_sum{{{base}}} {hist['sum']}")
+            lines.append(f"dual_logging_{field}_count{{{base}}} {hist['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsReporter:
+    """Background thread pushing periodic stats snapshots to a callback and/or a .prom file."""
+
+    def __init__(
+        self,
+        snapshot: Callable[[], dict[str, Any]],
+        interval: float,
+        logger: str,
+        callback: Callable[[dict[str, Any]], None] | None = None,
+        prometheus_path: str | None = None,
+    ) -> None:
+        self._snapshot = snapshot
+        self.interval = interval
+        self.logger = logger
+        self.callback = callback
+        self.prometheus_path = prometheus_path
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{self.logger}-metrics", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._report_safely()
+
+    def report(self) -> None:
+        """Push one snapshot now."""
+        stats = self._snapshot()
+        if self.callback is not None:
+            self.callback(stats)
+        if self.prometheus_path:
+            # Write-then-rename so textfile collectors never read a partial file.
+            tmp = f"{self.prometheus_path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(to_prometheus(stats, self.logger))
+            os.replace(tmp, self.prometheus_path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._report_safely()
+
+    def _report_safely(self) -> None:
+        """Push a snapshot, printing rather than raising if the callback or file fails."""
+        try:
+            self.report()
+        except Exception:
+            print(f"Metrics error:\n{traceback.format_exc()}")
@@ -0,0 +1,183 @@
+import logging
+import mmap
+import os
+import time
+
+from .rotation import BackupRotator
+
+SYNC_POLICIES = ("none", "batch", "interval")
+
+
+def _extend(fd: int, offset: int, length: int) -> None:
+    os.ftruncate(fd, offset + length)
+
+
+# Allocates the blocks as it extends the file, so a full disk is an OSError here
+# rather than a SIGBUS when the mapping is written. Sparse where it is missing.
+_allocate = getattr(os, "posix_fallocate", _extend)
+
+
+class MmapSegmentHandler(logging.Handler):
+    """Append log lines into memory-mapped file segments.
+
+    Each segment is mapped ``segment_size`` bytes at a time, so appending a
+    batch is one ``posix_fallocate`` for its bytes and a memory copy instead
+    of a ``write()`` call. When a segment fills, it is handed to a
+    BackupRotator, which names backups like ``RotatingFileHandler`` does
+    (``app.log.1`` ... up to ``backup_count``) off the writing thread. With no
+    retention set (``backup_count=0`` and no ``max_total_bytes``) the mapping
+    moves on along the same file instead.
+
+    The file's length is what has been written, so a tailer sees an ordinary
+    JSON-lines file that grows a batch at a time. It can read zeros at the end
+    only while a batch is being copied in, as it could read half a line from
+    a ``write()``, and for the moment a new window is mapped (once per
+    ``segment_size`` bytes), when the file is briefly extended and cut back.
+    A file left behind by a crash in either moment is trimmed back to its
+    last record on open.
+
+    ``sync`` controls msync: ``"none"`` leaves write-back to the OS,
+    ``"batch"`` syncs after every write and ``"interval"`` at most once per
+    ``sync_interval`` seconds. ``fsync()`` forces one regardless, and with
+    ``fsync_on_close`` set every segment is synced before it is closed.
+    """
+
+    terminator = "\n"
+
+    def __init__(
+        self,
+        filename: str,
+        segment_size: int,
+        *,
+        backup_count: int = 0,
+        sync: str = "none",
+        sync_interval: float = 1.0,
+        compression: str | None = None,
+        max_total_bytes: int | None = None,
+    ) -> None:
+        if sync not in SYNC_POLICIES:
+            raise ValueError(f"sync must be one of {SYNC_POLICIES}, not {sync!r}")
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.segment_size = max(segment_size, mmap.PAGESIZE)
+        self.backup_count = backup_count
+        self._rolls = backup_count > 0 or max_total_bytes is not None
+        self.sync = sync
+        self.sync_interval = sync_interval
+        self.on_rollover = None
+        self.fsync_on_close = False
+        self.rotator = BackupRotator(self.baseFilename, backup_count, compression, max_total_bytes)
+        self.rotator.recover()
+
+        self._fd: int | None = None
+        self._map: mmap.mmap | None = None
+        self._base = 0  # file offset where the mapping starts
+        self._pos = 0  # file offset of the next byte to write
+        self._synced = 0
+        self._last_sync = time.monotonic()
+        self._open()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.write((self.format(record) + self.terminator).encode("utf-8"))
+        except Exception:
+            self.handleError(record)
+
+    def write(self, data: bytes) -> None:
+        """Copy ``data`` into the active segment, rolling or growing it first if needed."""
+        if self._map is None:
+            self._open()
+        if self._pos + len(data) > self._base + len(self._map):
+            if self._rolls and self._pos:
+                self.doRollover()
+            self._remap(len(data))
+        _allocate(self._fd, self._pos, len(data))
+        start = self._pos - self._base
+        self._map[start : start + len(data)] = data
+        self._pos += len(data)
+
+        if self.sync == "batch" or (
+            self.sync == "interval" and time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self._msync()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._map is not None and self.sync != "none":
+                self._msync()
+
+    def fsync(self) -> None:
+        """Write the active segment's new records back to disk now."""
+        with self.lock:
+            if self._map is not None:
+                self._msync()
+
+    def doRollover(self) -> None:  # noqa: N802
+        self._close_segment()
+        pending = self.rotator.pending_name()
+        os.replace(self.baseFilename, pending)
+        self.rotator.submit(pending)
+        self._open()
+        if self.on_rollover is not None:
+            self.on_rollover()
+
+    def close(self) -> None:
+        with self.lock:
+            self._close_segment()
+        super().close()
+        self.rotator.close()
+
+    def _open(self) -> None:
+        self._fd = os.open(self.baseFilename, os.O_RDWR | os.O_CREAT, 0o644)
+        self._pos = self._synced = _used_length(self._fd)
+        os.ftruncate(self._fd, self._pos)
+        self._base = self._pos - self._pos % mmap.ALLOCATIONGRANULARITY
+        self._map_window(self.segment_size)
+
+    def _remap(self, needed: int) -> None:
+        """Move the mapping window to start at the write position with room for ``needed``."""
+        self._map.close()
+        self._base = self._pos - self._pos % mmap.ALLOCATIONGRANULARITY
+        self._map_window(max(self.segment_size, needed + self._pos - self._base))
+
+    def _map_window(self, length: int) -> None:
+        length = max(length, self._pos - self._base + 1)
+        # mmap() will not map past the end of the file, so it is extended for
+        # the call only; write() allocates each batch before touching its pages.
+        os.ftruncate(self._fd, self._base + length)
+        try:
+            self._map = mmap.mmap(self._fd, length, offset=self._base)
+        finally:
+            os.ftruncate(self._fd, self._pos)
+
+    def _msync(self) -> None:
+        # msync needs a page-aligned start within the mapping.
+        start = max(self._synced, self._base)
+        start -= (start - self._base) % mmap.PAGESIZE
+        self._map.flush(start - self._base, self._pos - start)
+        self._synced = self._pos
+        self._last_sync = time.monotonic()
+
+    def _close_segment(self) -> None:
+        if self._map is None:
+            return
+        if self.sync != "none" or self.fsync_on_close:
+            self._msync()
+        self._map.close()
+        self._map = None
+        os.ftruncate(self._fd, self._pos)
+        os.close(self._fd)
+        self._fd = None
+
+
+def _used_length(fd: int, chunk: int = 64 * 1024) -> int:
+    """Return the file length without a trailing run of zero bytes."""
+    end = os.fstat(fd).st_size
+    while end > 0:
+        start = max(0, end - chunk)
+        data = os.pread(fd, end - start, start)
+        stripped = data.rstrip(b"\0")
+        if stripped:
+            return start + len(stripped)
+        end = start
+    return 0
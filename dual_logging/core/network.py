@@ -0,0 +1,274 @@
+"""Sinks that ship record batches to a collector on the same host: syslog and NDJSON over TCP."""
+
+import errno
+import os
+import socket
+import threading
+import time
+from abc import abstractmethod
+from collections import deque
+from typing import Any
+
+from ..config.log_config import QueueOverflowPolicy
+from .base_logger import BaseLogger, SinkHandler
+from .fast_json import encode_event, make_formatter
+from .metrics import SinkMetrics
+from .record import MISSING, Record, as_records, level_number
+
+# RFC 5424 severities; levels in between take the next more severe one.
+_SEVERITIES = ((50, 2), (40, 3), (30, 4), (20, 6))
+
+
+def _peer_closed(sock: socket.socket) -> bool:
+    """Return whether the other end of a stream socket has hung up."""
+    try:
+        return sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT) == b""
+    except BlockingIOError:
+        return False
+    except OSError:
+        return True
+
+
+class NetworkSink(BaseLogger):
+    """Send each batch over one socket that stays open between batches.
+
+    The connection is opened by the first batch and reopened after an error,
+    a hang-up or a fork. A failed connect or send is retried after
+    ``backoff`` seconds, doubling up to ``backoff_max``; records arriving in
+    the meantime wait, at most ``max_pending`` of them, and go out ahead of
+    the next batch, or when the writer next finds its queue idle. Records
+    pushed out of that bound, or still waiting at ``close()``, are counted as
+    ``records_failed``. Delivery is at least once: a stream cut off mid-batch
+    is sent again whole on the new connection.
+
+    Each sink runs on its own writer thread with its own queue, sized by
+    ``queue_size`` and ``overflow_policy`` (the LoggerConfig file queue
+    settings when left as None), so a collector that is down or slow never
+    holds up the console or the file.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        level: str | int = "DEBUG",
+        queue_size: int | None = None,
+        overflow_policy: QueueOverflowPolicy | None = None,
+        block_timeout: float | None = None,
+        timeout: float = 5.0,
+        backoff: float = 0.1,
+        backoff_max: float = 30.0,
+        max_pending: int = 10_000,
+        time_format: str = "iso",
+        utc: bool = True,
+    ) -> None:
+        self.name = name
+        self.level = level_number(level)
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.timeout = timeout
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.max_pending = max_pending
+        self.metrics = SinkMetrics()
+        self.handler = SinkHandler(self)
+        self._format_time = make_formatter(time_format, utc)
+        self._lock = threading.Lock()
+        self._pending: deque[bytes] = deque()
+        self._sock: socket.socket | None = None
+        self._pid = os.getpid()
+        self._delay = 0.0
+        self._retry_at = 0.0
+
+    @abstractmethod
+    def _connect(self) -> socket.socket:
+        """Open the socket batches are sent over."""
+
+    @abstractmethod
+    def _frame(self, record: Record) -> bytes:
+        """Encode one record as the bytes sent for it."""
+
+    def _send(self, sock: socket.socket, frames: deque[bytes]) -> int:
+        """Send and remove ``frames``, returning how many were refused for good.
+
+        A stream takes the whole batch in one ``sendall``.
+        """
+        sock.sendall(b"".join(frames))
+        frames.clear()
+        return 0
+
+    def _render(self, record: Record) -> str:
+        """Render a record as the JSON object the file would hold, with its traceback as text."""
+        event = dict(record.merged())
+        if (text := record.exception_text()) is not None:
+            event["exception"] = text
+        event["event"] = record.text()
+        event["timestamp"] = self._format_time(record.timestamp_us)
+        event["level"] = record.level
+        if record.callsite not in (None, MISSING):
+            event["pathname"], event["lineno"] = record.callsite
+        return encode_event(event)
+
+    def write_batch(self, records: list[Record]) -> None:
+        frames = [self._frame(r) for r in as_records(records) if r.levelno >= self.level]
+        if not frames:
+            return
+        with self._lock:
+            self._pending.extend(frames)
+            if (excess := len(self._pending) - self.max_pending) > 0:
+                for _ in range(excess):
+                    self._pending.popleft()
+                self.metrics.failed(excess)
+            self._send_pending()
+
+    def _send_pending(self) -> None:
+        if self._pid != os.getpid():
+            # A socket inherited across fork is shared with the parent; never write to it.
+            self._sock, self._pid = None, os.getpid()
+        if not self._pending or time.monotonic() < self._retry_at:
+            return
+        sock = self._sock
+        if sock is not None and sock.type == socket.SOCK_STREAM and _peer_closed(sock):
+            self._close_socket()
+            sock = None
+        waiting = len(self._pending)
+        nbytes = sum(map(len, self._pending))
+        try:
+            if sock is None:
+                sock = self._sock = self._connect()
+                if self._delay:
+                    self.metrics.reconnected()
+            refused = self._send(sock, self._pending)
+        except OSError:
+            self._close_socket()
+            self._delay = min(self.backoff_max, self._delay * 2 or self.backoff)
+            self._retry_at = time.monotonic() + self._delay
+            if sent := waiting - len(self._pending):
+                # Datagrams that went out before the error.
+                self.metrics.wrote(sent)
+            return
+        self._delay = 0.0
+        self.metrics.wrote(waiting - refused, nbytes)
+
+    def sync_if_due(self) -> None:
+        """Retry records held back by a failed send once the backoff has passed."""
+        with self._lock:
+            self._send_pending()
+
+    def flush(self) -> None:
+        """Try sending held-back records now, whatever the backoff."""
+        with self._lock:
+            self._retry_at = 0.0
+            self._send_pending()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pending:
+                self.metrics.failed(len(self._pending))
+                self._pending.clear()
+            self._close_socket()
+
+    def _close_socket(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class SyslogSink(NetworkSink):
+    """RFC 5424 syslog to a local daemon, over UDP or a Unix socket.
+
+    ``address`` is a ``(host, port)`` pair for UDP or a socket path, as for
+    ``logging.handlers.SysLogHandler``. Each record is one message whose MSG
+    part is the record as a JSON object. A Unix socket is opened as a
+    datagram socket, as rsyslog, syslog-ng and journald listen, falling back
+    to a stream with RFC 6587 octet-counting framing.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int] | str = "/dev/log",
+        *,
+        name: str = "syslog",
+        facility: int = 1,
+        app_name: str = "-",
+        **options: Any,
+    ) -> None:
+        # RFC 5424 timestamps are ISO 8601 with a zone.
+        options.update(time_format="iso", utc=True)
+        super().__init__(name, **options)
+        self.address = address
+        self.facility = facility
+        self.app_name = app_name
+        self.hostname = socket.gethostname() or "-"
+
+    def _connect(self) -> socket.socket:
+        if isinstance(self.address, str):
+            try:
+                return self._open(socket.AF_UNIX, socket.SOCK_DGRAM, self.address)
+            except OSError as exc:
+                if exc.errno != errno.EPROTOTYPE:
+                    raise
+                return self._open(socket.AF_UNIX, socket.SOCK_STREAM, self.address)
+        host, port = self.address
+        family, kind, proto, _, address = socket.getaddrinfo(host, port, type=socket.SOCK_DGRAM)[0]
+        return self._open(family, kind, address, proto)
+
+    def _open(self, family: int, kind: int, address: object, proto: int = 0) -> socket.socket:
+        sock = socket.socket(family, kind, proto)
+        try:
+            sock.settimeout(self.timeout)
+            sock.connect(address)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _frame(self, record: Record) -> bytes:
+        severity = next((sev for floor, sev in _SEVERITIES if record.levelno >= floor), 7)
+        timestamp = self._format_time(record.timestamp_us)
+        header = f"<{self.facility * 8 + severity}>1 {timestamp} {self.hostname} "
+        header += f"{self.app_name} {os.getpid()} - - "
+        return (header + self._render(record)).encode("utf-8")
+
+    def _send(self, sock: socket.socket, frames: deque[bytes]) -> int:
+        if sock.type == socket.SOCK_STREAM:
+            sock.sendall(b"".join(b"%d %s" % (len(f), f) for f in frames))
+            frames.clear()
+            return 0
+        refused = 0
+        while frames:
+            try:
+                sock.send(frames[0])
+            except OSError as exc:
+                if exc.errno != errno.EMSGSIZE:
+                    raise
+                # Larger than the daemon accepts; it would never go through.
+                self.metrics.failed(1)
+                refused += 1
+            frames.popleft()
+        return refused
+
+
+class NDJSONSink(NetworkSink):
+    """Newline-delimited JSON over TCP, for a collector such as Vector, Fluent Bit or Logstash.
+
+    Each record is the JSON object the file would hold, traceback included
+    as ``exception``, on its own line; a batch goes out in one ``sendall``.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ("127.0.0.1", 5170),
+        *,
+        name: str = "ndjson",
+        **options: Any,
+    ) -> None:
+        super().__init__(name, **options)
+        self.address = address
+
+    def _connect(self) -> socket.socket:
+        return socket.create_connection(self.address, timeout=self.timeout)
+
+    def _frame(self, record: Record) -> bytes:
+        return self._render(record).encode("utf-8") + b"\n"
@@ -0,0 +1,231 @@
+import json
+import os
+import threading
+from collections import Counter, deque
+from typing import Any
+
+from ..config.log_config import QueueOverflowPolicy
+from .record import Record
+
+
+def _level_of(item: Record) -> int:
+    return item.levelno
+
+
+class SpillBuffer:
+    """FIFO of records overflowed to a JSON-lines file, removed once fully replayed."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._writer = None
+        self._reader = None
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, item: Record) -> None:
+        if self._writer is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._writer = open(self.path, "w", encoding="utf-8")
+            self._reader = open(self.path, encoding="utf-8")
+        self._writer.write(json.dumps(item.plain(), default=str) + "\n")
+        self._count += 1
+
+    def pop(self) -> Record:
+        self._writer.flush()
+        item = Record.from_item(json.loads(self._reader.readline()))
+        self._count -= 1
+        if not self._count:
+            self.close()
+        return item
+
+    def close(self) -> None:
+        """Close and remove the spill file, discarding anything not yet replayed."""
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._reader.close()
+        self._writer = self._reader = None
+        self._count = 0
+        os.remove(self.path)
+
+
+def combined_stats(queues: list["_OverflowMixin"]) -> dict[str, Any]:
+    """Report ``queues`` as one queue, such as the async queues of several event loops."""
+    drops: dict[str, dict[str, int]] = {}
+    for queue in queues:
+        for (reason, level), count in queue.drops.items():
+            by_level = drops.setdefault(reason, {})
+            by_level[level] = by_level.get(level, 0) + count
+    return {
+        "depth": sum(len(queue._queue) for queue in queues),
+        "peak": max(queue.peak for queue in queues),
+        "capacity": queues[0].maxsize,
+        "spilled": sum(len(queue.spill) for queue in queues if queue.spill is not None),
+        "dropped": sum(queue.dropped for queue in queues),
+        "drops": drops,
+    }
+
+
+class _OverflowMixin:
+    """Overflow handling shared by the thread-safe and asyncio queues.
+
+    Subclasses keep records in ``self._queue`` (a deque) and call
+    ``_overflow(item)`` with their lock held once the queue is full.
+    """
+
+    policy: QueueOverflowPolicy
+    spill: SpillBuffer | None
+    dropped: int
+    drops: Counter
+    peak: int
+    _queue: deque
+
+    def _setup_overflow(
+        self, policy: QueueOverflowPolicy, spill_path: str | None, block_timeout: float
+    ) -> None:
+        self.spill = None
+        self.dropped = 0
+        self.drops = Counter()
+        self.peak = 0
+        self.set_policy(policy, spill_path, block_timeout)
+
+    def set_policy(
+        self, policy: QueueOverflowPolicy, spill_path: str | None, block_timeout: float
+    ) -> None:
+        """Change the overflow policy; a spill file already holding records is kept."""
+        self.policy = policy
+        self.block_timeout = block_timeout
+        if not self._spilling():
+            self.spill = SpillBuffer(spill_path) if spill_path else None
+
+    def _spilling(self) -> bool:
+        # Once anything is on disk, newer records queue behind it to keep order.
+        return self.spill is not None and len(self.spill) > 0
+
+    def _drop(self, item: Record, reason: str) -> None:
+        self.dropped += 1
+        self.drops[reason, item.level] += 1
+
+    def _overflow(self, item: Record, reason: str = "queue_full") -> bool:
+        """Make room for ``item`` according to the policy; return whether it was queued."""
+        if self.policy is QueueOverflowPolicy.DROP_OLDEST:
+            self._drop(self._queue.popleft(), "evicted_oldest")
+            self._queue.append(item)
+            return True
+        if self.policy is QueueOverflowPolicy.PRIORITY:
+            victim = min(range(len(self._queue)), key=lambda i: _level_of(self._queue[i]))
+            if _level_of(self._queue[victim]) <= _level_of(item):
+                self._drop(self._queue[victim], "evicted_priority")
+                del self._queue[victim]
+                self._queue.append(item)
+                return True
+            reason = "rejected_priority"
+        elif self.policy is QueueOverflowPolicy.SPILL and self.spill is not None:
+            self.spill.append(item)
+            return True
+        self._drop(item, reason)
+        return False
+
+    def _track_peak(self) -> None:
+        self.peak = max(self.peak, len(self._queue))
+
+    def _stats(self) -> dict[str, Any]:
+        return combined_stats([self])
+
+    def absorb(self, other: "_OverflowMixin") -> None:
+        """Take over the drop counts and peak of ``other``, a queue being retired."""
+        self.dropped += other.dropped
+        self.drops.update(other.drops)
+        self.peak = max(self.peak, other.peak)
+
+    def _discard(self, reason: str) -> int:
+        """Drop every queued and spilled record under ``reason``, returning how many."""
+        count = 0
+        while self._queue:
+            self._drop(self._queue.popleft(), reason)
+            self._refill()
+            count += 1
+        return count
+
+    def _refill(self) -> None:
+        if self._spilling():
+            self._queue.append(self.spill.pop())
+
+
+class OverflowQueue(_OverflowMixin):
+    """Bounded thread-safe FIFO that applies a QueueOverflowPolicy when full."""
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: QueueOverflowPolicy = QueueOverflowPolicy.DROP,
+        spill_path: str | None = None,
+        block_timeout: float = 1.0,
+    ) -> None:
+        self.maxsize = maxsize
+        self._queue: deque[Record] = deque()
+        self._mutex = threading.Lock()
+        self._not_full = threading.Condition(self._mutex)
+        self._setup_overflow(policy, spill_path, block_timeout)
+
+    def qsize(self) -> int:
+        return len(self._queue)
+
+    def empty(self) -> bool:
+        return not self._queue
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._queue)
+
+    def put(self, item: Record) -> bool:
+        """Enqueue ``item``, returning False if the policy dropped it."""
+        with self._mutex:
+            return self._put(item)
+
+    def put_many(self, items: list[Record]) -> None:
+        """Enqueue ``items`` in order under one acquisition of the lock."""
+        with self._mutex:
+            for item in items:
+                self._put(item)
+
+    def _put(self, item: Record) -> bool:
+        if self._spilling():
+            self.spill.append(item)
+            return True
+        reason = "queue_full"
+        if self.full() and self.policy is QueueOverflowPolicy.BLOCK:
+            self._not_full.wait_for(lambda: not self.full(), self.block_timeout)
+            reason = "block_timeout"
+        if not self.full():
+            self._queue.append(item)
+            self._track_peak()
+            return True
+        return self._overflow(item, reason)
+
+    def get_batch(self, limit: int) -> list[Record]:
+        """Pop up to ``limit`` records without blocking, replaying spilled ones behind them."""
+        with self._mutex:
+            batch = []
+            while self._queue and len(batch) < limit:
+                batch.append(self._queue.popleft())
+                self._refill()
+            if batch:
+                self._not_full.notify_all()
+            return batch
+
+    def stats(self) -> dict[str, Any]:
+        with self._mutex:
+            return self._stats()
+
+    def discard(self, reason: str) -> int:
+        with self._mutex:
+            count = self._discard(reason)
+            self._not_full.notify_all()
+            return count
+
+    def close(self) -> None:
+        with self._mutex:
+            if self.spill is not None:
+                self.spill.close()
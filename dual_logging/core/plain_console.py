@@ -0,0 +1,108 @@
+import logging
+import os
+import sys
+from typing import Any
+
+from ..config.log_config import LoggerConfig
+from .fast_json import make_formatter
+from .record import MISSING, Record
+
+CONSOLE_FORMATS = ("auto", "rich", "text", "logfmt")
+_NEEDS_QUOTES = frozenset(' ="\\\n\t')
+
+
+def resolve_console_format(cfg: LoggerConfig) -> str:
+    """Pick the console layout: Rich on a terminal, plain text when stdout is piped."""
+    if cfg.console_format != "auto":
+        return cfg.console_format
+    try:
+        return "rich" if sys.stdout.isatty() else "text"
+    except (AttributeError, ValueError):
+        return "text"
+
+
+def _logfmt_value(value: Any) -> str:
+    text = value if isinstance(value, str) else str(value)
+    if text and _NEEDS_QUOTES.isdisjoint(text):
+        return text
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+class PlainConsoleRenderer:
+    """Render console records as one line of fixed-layout text or logfmt.
+
+    ``text`` is ``<timestamp> <LEVEL> <message> key=value ... [file:line]``
+    with any traceback on the lines below; ``logfmt`` puts everything,
+    traceback included, into ``key=value`` pairs on a single line. There is
+    no markup, width measurement or wrapping.
+    """
+
+    def __init__(self, cfg: LoggerConfig, layout: str = "text") -> None:
+        self._format_time = make_formatter(cfg.time_format, cfg.use_utc)
+        self._render = self._logfmt if layout == "logfmt" else self._text
+
+    def render(self, record: Record) -> str:
+        fields = record.merged()
+        if "trace_id" in fields:
+            fields = {k: v for k, v in fields.items() if k != "trace_id"}
+        return self._render(
+            self._format_time(record.timestamp_us),
+            record.level,
+            str(record.text()),
+            fields,
+            callsite=record.callsite if record.callsite is not MISSING else None,
+            exception=record.exception_text(),
+        )
+
+    def _text(
+        self,
+        timestamp: Any,
+        level: str,
+        message: str,
+        fields: dict[str, Any],
+        *,
+        callsite: tuple[str, int] | None,
+        exception: str | None,
+    ) -> str:
+        parts = [str(timestamp), f"{level.upper():<8}", message]
+        parts.extend(f"{k}={v}" for k, v in fields.items())
+        if callsite is not None:
+            parts.append(f"[{os.path.basename(callsite[0])}:{callsite[1]}]")
+        line = " ".join(parts)
+        return f"{line}\n{exception}" if exception else line
+
+    def _logfmt(
+        self,
+        timestamp: Any,
+        level: str,
+        message: str,
+        fields: dict[str, Any],
+        *,
+        callsite: tuple[str, int] | None,
+        exception: str | None,
+    ) -> str:
+        parts = [
+            f"ts={_logfmt_value(timestamp)}",
+            f"level={level.lower()}",
+            f"msg={_logfmt_value(message)}",
+        ]
+        parts.extend(f"{k}={_logfmt_value(v)}" for k, v in fields.items())
+        if callsite is not None:
+            parts.append(f"caller={_logfmt_value(f'{callsite[0]}:{callsite[1]}')}")
+        if exception:
+            parts.append(f"exc={_logfmt_value(exception)}")
+        return " ".join(parts)
+
+
+class PlainConsoleHandler(logging.StreamHandler):
+    """StreamHandler on stdout that also accepts pre-rendered batches in one write."""
+
+    def __init__(self) -> None:
+        super().__init__(sys.stdout)
+        self.setFormatter(logging.Formatter("%(asctime)s %(levelname)-8s %(message)s"))
+
+    def write_batch(self, text: str) -> None:
+        with self.lock:
+            self.stream.write(text)
+            self.stream.flush()
@@ -0,0 +1,190 @@
+import logging
+import sys
+import time
+import traceback
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .tracebacks import TracebackCache
+
+_LEVELS = logging.getLevelNamesMapping()
+# getLevelName, not the mapping: 50 is "critical" and 30 "warning", not their aliases.
+_NAMES = {levelno: logging.getLevelName(levelno).lower() for levelno in _LEVELS.values()}
+# Set on a Record whose callsite was never captured; the sink looks it up itself.
+MISSING: Any = object()
+# The exc_info of a Record rebuilt from plain(): there was an exception, and its
+# traceback comes along as text in the "exception" field.
+REPLAYED: Any = object()
+# Keys of the legacy (level, message, ctx) tuples that are not user fields.
+_ITEM_KEYS = frozenset({"exc_info", "callsite", "args", "log_context"})
+# Attributes every logging.LogRecord has; anything else came in through ``extra``.
+_LOG_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+def format_message(message: Any, args: Any) -> str:
+    """Apply deferred ``%``-style arguments as ``logging.LogRecord.getMessage`` does."""
+    message = str(message)
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError, KeyError):
+            message = f"{message} {args!r}"
+    return message
+
+
+def level_number(level: str | int) -> int:
+    if isinstance(level, int):
+        return level
+    return _LEVELS.get(level.upper(), logging.INFO)
+
+
+class Record:
+    """One log call, created at the call site and shared read-only by every queue and sink.
+
+    ``fields`` is the call's own keyword dict and ``context`` the bound log
+    context's cached view, so neither is copied on the way in. Sinks read
+    ``merged()`` (built once, on first use) instead of copying or popping
+    keys. ``exc_info`` keeps the exception tuple; its traceback is only
+    formatted by ``exception_text()``, once, if a sink asks for it.
+    """
+
+    __slots__ = (
+        "_exc_text",
+        "_merged",
+        "args",
+        "callsite",
+        "context",
+        "exc_info",
+        "exc_repeat",
+        "fields",
+        "levelno",
+        "message",
+        "timestamp_us",
+        "tracebacks",
+    )
+
+    def __init__(
+        self,
+        levelno: int,
+        message: Any,
+        args: Any = None,
+        fields: dict[str, Any] | None = None,
+        *,
+        timestamp_us: int | None = None,
+        context: Mapping[str, Any] | None = None,
+        exc_info: Any = None,
+        callsite: tuple[str, int] | None = MISSING,
+        tracebacks: "TracebackCache | None" = None,
+    ) -> None:
+        self.levelno = levelno
+        self.message = message
+        self.args = args
+        self.fields = {} if fields is None else fields
+        self.timestamp_us = time.time_ns() // 1000 if timestamp_us is None else timestamp_us
+        self.context = context
+        if exc_info is True:
+            exc_info = sys.exc_info()
+        self.exc_info = exc_info or None
+        self.callsite = callsite
+        self.tracebacks = tracebacks
+        self.exc_repeat = False
+        self._merged = None
+        self._exc_text = None
+
+    @property
+    def level(self) -> str:
+        """Return the lower-case level name used in rendered output."""
+        name = _NAMES.get(self.levelno)
+        return name if name is not None else logging.getLevelName(self.levelno).lower()
+
+    def text(self) -> Any:
+        """Return the message with its deferred ``%``-args applied."""
+        return format_message(self.message, self.args) if self.args else self.message
+
+    def merged(self) -> Mapping[str, Any]:
+        """Return the user fields: the bound context overlaid with the call's own fields."""
+        merged = self._merged
+        if merged is None:
+            merged = self.fields if not self.context else {**self.context, **self.fields}
+            self._merged = merged
+        return merged
+
+    def exception_text(self) -> str | None:
+        """Format the captured exception once; ``None`` when there is none.
+
+        With a TracebackCache attached, a traceback already shown within its
+        window comes back as a one-line reference and ``exc_repeat`` is set.
+        """
+        exc_info = self.exc_info
+        if self._exc_text is None and isinstance(exc_info, tuple) and exc_info[0] is not None:
+            cache = self.tracebacks
+            if cache is None:
+                self._exc_text = "".join(traceback.format_exception(*exc_info)).rstrip("\n")
+            else:
+                with cache.lock:
+                    # Another sink's worker may have got here first.
+                    if self._exc_text is None:
+                        text, self.exc_repeat = cache.render(exc_info, self.timestamp_us)
+                        self._exc_text = text
+        return self._exc_text
+
+    def plain(self) -> list[Any]:
+        """Return JSON-friendly ``[level, message, fields, timestamp_us]`` with args applied."""
+        fields = dict(self.merged())
+        fields["exc_info"] = self.exc_info is not None
+        if (text := self.exception_text()) is not None:
+            fields["exception"] = f"{text}\n"
+        if self.callsite is not MISSING:
+            fields["callsite"] = self.callsite
+        return [self.level, str(self.text()), fields, self.timestamp_us]
+
+    @classmethod
+    def from_item(cls, item: Any) -> "Record":
+        """Build a Record from ``(level, message, ctx[, timestamp_us])``, as older callers pass."""
+        if isinstance(item, Record):
+            return item
+        level, message, ctx, *rest = item
+        if _ITEM_KEYS.isdisjoint(ctx):
+            fields = ctx
+        else:
+            fields = {k: v for k, v in ctx.items() if k not in _ITEM_KEYS}
+        callsite = ctx.get("callsite", MISSING)
+        exc_info = ctx.get("exc_info")
+        if exc_info is True and "exception" in ctx:
+            # Replayed from plain(); True alone would capture whatever is being handled now.
+            exc_info = REPLAYED
+        return cls(
+            level_number(level),
+            message,
+            ctx.get("args"),
+            fields,
+            timestamp_us=rest[0] if rest else None,
+            context=ctx.get("log_context"),
+            exc_info=exc_info,
+            callsite=tuple(callsite) if isinstance(callsite, list) else callsite,
+        )
+
+    @classmethod
+    def from_log_record(
+        cls, record: logging.LogRecord, context: Mapping[str, Any] | None = None
+    ) -> "Record":
+        """Map a stdlib LogRecord, keeping only the attributes added through ``extra``."""
+        fields = {k: v for k, v in record.__dict__.items() if k not in _LOG_RECORD_ATTRS}
+        return cls(
+            record.levelno,
+            record.msg,
+            record.args,
+            fields,
+            timestamp_us=int(record.created * 1_000_000),
+            context=context,
+            exc_info=record.exc_info,
+            callsite=(record.pathname, record.lineno),
+        )
+
+
+def as_records(batch: list[Any]) -> list[Record]:
+    """Return ``batch`` as Records, converting any legacy tuples."""
+    if all(type(item) is Record for item in batch):
+        return batch
+    return [Record.from_item(item) for item in batch]
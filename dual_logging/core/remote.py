@@ -0,0 +1,181 @@
+import contextlib
+import json
+import os
+import signal
+import socket
+import struct
+import threading
+import traceback
+from typing import Any
+
+from ..config.log_config import LoggerConfig
+from .base_logger import BaseLogger, SinkHandler
+from .console_logger import ConsoleLogger
+from .file_logger import FileLogger
+from .metrics import SinkMetrics
+from .record import Record, as_records
+
+# Frames are a 4-byte big-endian length followed by a JSON list of Record.plain() lists.
+_HEADER = struct.Struct(">I")
+
+
+class RemoteSink(BaseLogger):
+    """Send record batches to a LogServer over a Unix socket.
+
+    Each ``write_batch`` call becomes one frame. ``sendall`` blocks while the
+    server is behind, which stalls the caller's writer thread and lets the
+    local queue fill, so backpressure is handled by the configured overflow
+    policy. The connection is opened lazily and reopened once per batch after
+    an error or a fork; a batch that still cannot be sent, because the server
+    is down, is counted as ``records_failed`` rather than raised.
+    """
+
+    def __init__(self, cfg: LoggerConfig) -> None:
+        self.cfg = cfg
+        self.address = cfg.log_server_address
+        self.metrics = SinkMetrics()
+        self.handler = SinkHandler(self)
+        self._lock = threading.Lock()
+        self._sock: socket.socket | None = None
+        self._pid = os.getpid()
+
+    def _send(self, frame: bytes) -> None:
+        if self._pid != os.getpid():
+            # A socket inherited across fork is shared with the parent; never write to it.
+            self._sock, self._pid = None, os.getpid()
+        for attempt in range(2):
+            try:
+                if self._sock is None:
+                    self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    self._sock.connect(self.address)
+                self._sock.sendall(frame)
+                return
+            except OSError:
+                self._close_socket()
+                if attempt:
+                    raise
+
+    def write_batch(self, records: list[Record]) -> None:
+        records = as_records(records)
+        payload = json.dumps([r.plain() for r in records], default=str).encode("utf-8")
+        frame = _HEADER.pack(len(payload)) + payload
+        with self._lock:
+            try:
+                self._send(frame)
+            except OSError:
+                self.metrics.failed(len(records))
+                return
+        self.metrics.wrote(len(records), len(frame))
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_socket()
+
+    def _close_socket(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class LogServer:
+    """The single writer of a multi-process deployment.
+
+    Listens on ``cfg.log_server_address`` and owns the console and file sinks
+    built from ``cfg``: rendering, rotation and flushing all happen here, one
+    batch at a time, whatever the number of client processes.
+    """
+
+    def __init__(self, cfg: LoggerConfig) -> None:
+        self.cfg = cfg
+        self.address = cfg.log_server_address
+        self.console_logger = ConsoleLogger(cfg)
+        self.file_logger = FileLogger(cfg)
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._listener: socket.socket | None = None
+        self._connections: set[socket.socket] = set()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """Bind the socket and accept clients on a background thread."""
+        if os.path.exists(self.address):
+            os.remove(self.address)  # left behind by a server that did not shut down
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self.address)
+        self._listener.listen()
+        self._spawn(self._accept_loop, f"{self.cfg.name}-log-server")
+
+    def serve_forever(self) -> None:
+        """Serve until ``close()`` is called or the process receives SIGTERM."""
+        signal.signal(signal.SIGTERM, lambda *_: self._stop.set())
+        self.start()
+        try:
+            self._stop.wait()
+        finally:
+            self.close()
+
+    def write(self, records: list[Record]) -> None:
+        with self._write_lock:
+            self.console_logger.write_batch(records)
+            self.file_logger.write_batch(records)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._listener is not None:
+            # shutdown() is what wakes a thread blocked in accept() on Linux.
+            with contextlib.suppress(OSError):
+                self._listener.shutdown(socket.SHUT_RDWR)
+            self._listener.close()
+            self._listener = None
+            if os.path.exists(self.address):
+                os.remove(self.address)
+        for conn in list(self._connections):
+            with contextlib.suppress(OSError):
+                conn.shutdown(socket.SHUT_RDWR)
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self._threads.clear()
+        for sink in (self.console_logger, self.file_logger):
+            with contextlib.suppress(OSError, ValueError):
+                sink.flush()
+                sink.close()
+
+    def _spawn(self, target: Any, name: str, *args: Any) -> None:
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def _accept_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            self._connections.add(conn)
+            self._spawn(self._serve, f"{self.cfg.name}-log-client", conn)
+
+    def _serve(self, conn: socket.socket) -> None:
+        try:
+            with conn, conn.makefile("rb") as stream:
+                while header := stream.read(_HEADER.size):
+                    if len(header) < _HEADER.size:
+                        return  # connection cut mid-frame
+                    (length,) = _HEADER.unpack(header)
+                    payload = stream.read(length)
+                    if len(payload) < length:
+                        return
+                    # A frame that does not decode is reported and skipped; the next one still can.
+                    try:
+                        self.write([Record.from_item(item) for item in json.loads(payload)])
+                    except Exception:
+                        print(f"Log server error:\n{traceback.format_exc()}")
+        except OSError:
+            pass
+        finally:
+            self._connections.discard(conn)
+
+
+def run_log_server(cfg: LoggerConfig) -> None:
+    """Process entry point: ``multiprocessing.Process(target=run_log_server, args=(cfg,))``."""
+    LogServer(cfg).serve_forever()
@@ -0,0 +1,286 @@
+import contextlib
+import gzip
+import itertools
+import logging
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING
+
+try:
+    from compression import zstd as _zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as _zstd
+    except ImportError:
+        _zstd = None
+
+if TYPE_CHECKING:
+    from .log_index import LogIndex
+
+ROTATE_WHEN = ("size", "time", "size_or_time")
+_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def _compress(source: str, dest: str, compression: str) -> None:
+    tmp = f"{dest}.tmp"
+    with open(source, "rb") as src:
+        if compression == "gzip":
+            with gzip.open(tmp, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+        elif hasattr(_zstd, "ZstdCompressor") and hasattr(_zstd.ZstdCompressor, "copy_stream"):
+            with open(tmp, "wb") as dst:
+                _zstd.ZstdCompressor().copy_stream(src, dst)
+        else:
+            with _zstd.open(tmp, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace(tmp, dest)
+    os.remove(source)
+
+
+def backup_files(base_filename: str) -> list[tuple[int, str, str]]:
+    """Return ``(number, path, compression suffix)`` for each backup of ``base_filename``, by number."""
+    directory = os.path.dirname(base_filename) or "."
+    pattern = re.compile(rf"{re.escape(os.path.basename(base_filename))}\.(\d+)(\.gz|\.zst)?$")
+    backups = []
+    for name in os.listdir(directory):
+        if match := pattern.match(name):
+            backups.append((int(match[1]), os.path.join(directory, name), match[2] or ""))
+    return sorted(backups)
+
+
+class BackupRotator:
+    """Background worker that turns closed segments into numbered backups.
+
+    ``submit`` takes a segment the writer has already moved aside. The worker
+    shifts ``app.log.1``... up by one, moves (or compresses) the segment into
+    ``app.log.1``, then deletes backups beyond ``backup_count`` (0 keeps all)
+    and the oldest ones while their total size exceeds ``max_total_bytes``.
+    A segment's sidecar (``SIDECAR_SUFFIX``, such as a log index) moves
+    and is deleted with it; ``app.log.1.gz`` keeps ``app.log.1.idx``.
+    """
+
+    SIDECAR_SUFFIX = ".idx"
+
+    def __init__(
+        self,
+        base_filename: str,
+        backup_count: int = 0,
+        compression: str | None = None,
+        max_total_bytes: int | None = None,
+    ) -> None:
+        if compression not in _SUFFIXES:
+            raise ValueError(f"compression must be 'gzip', 'zstd' or None, not {compression!r}")
+        if compression == "zstd" and _zstd is None:
+            raise ValueError("zstd compression needs Python 3.14+ or the 'zstandard' package")
+        self.base_filename = base_filename
+        self.backup_count = backup_count
+        self.compression = compression
+        self.max_total_bytes = max_total_bytes
+
+        self._seq = itertools.count()
+        self._queue: queue.Queue[str | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def pending_name(self) -> str:
+        """Return a unique name to move the active file to before submitting it."""
+        return f"{self.base_filename}.{time.time_ns()}-{next(self._seq):06d}.pending"
+
+    def submit(self, path: str) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"{os.path.basename(self.base_filename)}-rotator",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._queue.put(path)
+
+    def recover(self) -> None:
+        """Queue segments a previous process moved aside but never finished rotating."""
+        directory = os.path.dirname(self.base_filename)
+        prefix = f"{os.path.basename(self.base_filename)}."
+        for name in sorted(os.listdir(directory)):
+            if name.startswith(prefix) and name.endswith(".pending"):
+                self.submit(os.path.join(directory, name))
+
+    def join(self) -> None:
+        """Wait until every submitted segment has been rotated."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Finish the queued work and stop the worker."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            path = self._queue.get()
+            try:
+                if path is None:
+                    return
+                self._rotate(path)
+            except Exception:
+                print(f"Rotation error:\n{traceback.format_exc()}")
+            finally:
+                self._queue.task_done()
+
+    def _backups(self) -> list[tuple[int, str, str]]:
+        return backup_files(self.base_filename)
+
+    def _rotate(self, path: str) -> None:
+        base, sidecar = self.base_filename, self.SIDECAR_SUFFIX
+        for n, name, suffix in reversed(self._backups()):
+            os.replace(name, f"{base}.{n + 1}{suffix}")
+            if os.path.exists(f"{base}.{n}{sidecar}"):
+                os.replace(f"{base}.{n}{sidecar}", f"{base}.{n + 1}{sidecar}")
+        target = f"{base}.1{_SUFFIXES[self.compression]}"
+        if self.compression:
+            _compress(path, target, self.compression)
+        else:
+            os.replace(path, target)
+        if os.path.exists(path + sidecar):
+            os.replace(path + sidecar, f"{base}.1{sidecar}")
+        self._prune()
+
+    def _prune(self) -> None:
+        total, over_budget = 0, False
+        for n, name, _ in self._backups():
+            total += os.path.getsize(name)
+            if self.max_total_bytes is not None and total > self.max_total_bytes:
+                over_budget = True
+            if over_budget or (self.backup_count and n > self.backup_count):
+                os.remove(name)
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(f"{self.base_filename}.{n}{self.SIDECAR_SUFFIX}")
+
+
+def _next_boundary(now: float, interval: float, utc: bool) -> float:
+    """Return the first multiple of ``interval`` after ``now``, counted in UTC or local time."""
+    offset = 0 if utc else time.localtime(now).tm_gmtoff
+    return ((now + offset) // interval + 1) * interval - offset
+
+
+class BackgroundRotatingFileHandler(logging.FileHandler):
+    """File handler whose rollover costs one rename on the logging thread.
+
+    ``when`` selects rollover by ``"size"`` (``max_bytes``), ``"time"``
+    (every ``interval`` seconds, aligned to UTC or local midnight) or
+    ``"size_or_time"``. At rollover the active file is moved to a
+    ``.pending`` name and a new one is opened; a BackupRotator does the
+    numbering, compression and retention off the hot path. As with
+    ``RotatingFileHandler``, size rollover needs some retention
+    (``backup_count`` or ``max_total_bytes``) to be enabled. An ``index``
+    is told about every write and follows the file through rollover.
+    With ``fsync_on_close`` set, a file is synced before it is closed or
+    moved aside, so records written just before a rollover are durable too.
+    """
+
+    file_mode = "a"
+    file_encoding: str | None = "utf-8"
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        when: str = "size",
+        interval: float = 86400.0,
+        utc: bool = False,
+        compression: str | None = None,
+        max_total_bytes: int | None = None,
+        index: "LogIndex | None" = None,
+    ) -> None:
+        if when not in ROTATE_WHEN:
+            raise ValueError(f"when must be one of {ROTATE_WHEN}, not {when!r}")
+        super().__init__(filename, mode=self.file_mode, encoding=self.file_encoding)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.utc = utc
+        self.on_rollover = None
+        self.index = index
+        self.fsync_on_close = False
+        self.rotator = BackupRotator(self.baseFilename, backup_count, compression, max_total_bytes)
+        self.rotator.recover()
+
+        self._by_size = (
+            when != "time" and max_bytes > 0 and (backup_count > 0 or max_total_bytes is not None)
+        )
+        self._by_time = when != "size"
+        self._size = self.stream.tell()
+        # An existing file rolls at the first boundary after it was last written.
+        self._next_rollover = _next_boundary(
+            os.path.getmtime(self.baseFilename) if self._size else time.time(), interval, utc
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                if self._closed:
+                    return
+                self.stream = self._open()
+            if self._should_rollover(len(msg)):
+                self.doRollover()
+            self.stream.write(msg)
+            self.stream.flush()
+            if self.index is not None:
+                self.index.add_record(self._size, len(msg), record)
+            self._size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _should_rollover(self, length: int) -> bool:
+        if not self._size:
+            # Nothing to move aside; an empty file starts the new period as is.
+            if self._by_time and time.time() >= self._next_rollover:
+                self._next_rollover = _next_boundary(time.time(), self.interval, self.utc)
+            return False
+        if self._by_time and time.time() >= self._next_rollover:
+            return True
+        return self._by_size and self._size + length >= self.max_bytes
+
+    def fsync(self) -> None:
+        """Flush the active file and fsync it."""
+        with self.lock:
+            if self.stream is not None:
+                self.stream.flush()
+                os.fsync(self.stream.fileno())
+
+    def doRollover(self) -> None:  # noqa: N802
+        if self.stream is not None:
+            if self.fsync_on_close:
+                self.fsync()
+            self.stream.close()
+            self.stream = None
+        if os.path.exists(self.baseFilename):
+            pending = self.rotator.pending_name()
+            os.replace(self.baseFilename, pending)
+            if self.index is not None:
+                self.index.roll(pending)
+            self.rotator.submit(pending)
+        self.stream = self._open()
+        self._size = 0
+        self._next_rollover = _next_boundary(time.time(), self.interval, self.utc)
+        if self.on_rollover is not None:
+            self.on_rollover()
+
+    def close(self) -> None:
+        if self.fsync_on_close:
+            self.fsync()
+        super().close()
+        if self.index is not None:
+            self.index.close()
+        self.rotator.close()
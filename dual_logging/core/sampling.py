@@ -0,0 +1,102 @@
+import logging
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+from .record import Record
+
+
+class AdaptiveSampler:
+    """Thin DEBUG and INFO records as the logger comes under pressure.
+
+    Pressure is the larger of the fullest queue's fill ratio (from
+    ``pressure``) and the enqueue rate over ``target_rate``, re-read at most
+    every ``interval`` seconds. Below ``start`` everything is kept. Above it,
+    DEBUG's keep-rate falls to zero over the first half of the remaining
+    range, then INFO's falls to ``info_floor``. WARNING and above are always
+    kept. Kept records below rate 1 carry ``sample_rate`` so counts can be
+    scaled back up.
+
+    With ``by_trace`` the decision for a record with a ``trace_id`` (passed
+    or bound in the log context) comes from a hash of it, so one request's
+    lines are kept or dropped together.
+    """
+
+    def __init__(
+        self,
+        pressure: Callable[[], float],
+        *,
+        start: float = 0.5,
+        info_floor: float = 0.1,
+        target_rate: float | None = None,
+        by_trace: bool = True,
+        interval: float = 0.05,
+    ) -> None:
+        self._pressure = pressure
+        self.start = start
+        self.info_floor = info_floor
+        self.target_rate = target_rate
+        self.by_trace = by_trace
+        self.interval = interval
+
+        self.sampled = Counter()
+        self.rates = {logging.DEBUG: 1.0, logging.INFO: 1.0}
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._updated = time.monotonic()
+
+    def keep(self, record: Record) -> bool:
+        """Decide whether to keep a record, tagging its fields with the rate when thinned."""
+        levelno = record.levelno
+        if levelno >= logging.WARNING:
+            return True
+        self._seen += 1
+        if time.monotonic() - self._updated >= self.interval:
+            self._update()
+        rate = self.rates[logging.DEBUG if levelno <= logging.DEBUG else logging.INFO]
+        if rate >= 1.0:
+            return True
+        trace_id = None
+        if self.by_trace:
+            trace_id = record.fields.get("trace_id") or (record.context or {}).get("trace_id")
+        draw = random.random() if trace_id is None else _unit_hash(trace_id)  # noqa: S311
+        if draw < rate:
+            record.fields["sample_rate"] = rate
+            return True
+        with self._lock:
+            self.sampled[record.level] += 1
+        return False
+
+    def _update(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            elapsed, self._updated = now - self._updated, now
+            seen, self._seen = self._seen, 0
+            if elapsed <= 0:
+                return
+            pressure = self._pressure()
+            if self.target_rate:
+                pressure = max(pressure, seen / elapsed / self.target_rate)
+            span = max(1.0 - self.start, 1e-9)
+            excess = min(1.0, max(0.0, (pressure - self.start) / span))
+            # DEBUG goes first; INFO only starts thinning once DEBUG is gone.
+            self.rates = {
+                logging.DEBUG: max(0.0, 1.0 - 2 * excess),
+                logging.INFO: 1.0 - max(0.0, 2 * excess - 1.0) * (1.0 - self.info_floor),
+            }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "sampled": dict(self.sampled),
+                "keep_rate": {logging.getLevelName(k).lower(): v for k, v in self.rates.items()},
+            }
+
+
+def _unit_hash(value: Any) -> float:
+    """Map ``value`` to [0, 1) the same way in every process."""
+    return zlib.crc32(str(value).encode()) / 2**32
@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+
+from .base_logger import BaseLogger
+from .batch_writer import BatchWriter
+from .overflow import OverflowQueue
+from .record import Record
+
+
+class SinkWorker:
+    """One sink's queue and writer thread.
+
+    Every sink of a DualLogger drains on its own thread, so a sink stuck in a
+    slow write or a reconnect only fills its own queue and drops by its own
+    overflow policy while the others keep writing. The sink itself is
+    created by ``factory`` when the first batch reaches it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], BaseLogger],
+        *,
+        queue: OverflowQueue | None = None,
+        batch_size: int = 256,
+        before_drain: Callable[[], None] | None = None,
+    ) -> None:
+        self.name = name
+        self.sink: BaseLogger | None = None
+        self.queue = queue if queue is not None else OverflowQueue()
+        self.batch_size = batch_size
+        self._factory = factory
+        self._before_drain = before_drain
+        self._injected: deque[Record] = deque()
+        self.lock = threading.Lock()
+        # Not ``lock``: drain() holds that while it builds the sink on first use.
+        self._build_lock = threading.Lock()
+        self.writer = BatchWriter(self.drain, name=name)
+
+    def get_sink(self) -> BaseLogger:
+        """Return the sink, creating it if no batch has reached it yet.
+
+        Built once whichever thread gets here first, so a file is never opened
+        by two sinks.
+        """
+        sink = self.sink
+        if sink is None:
+            with self._build_lock:
+                if self.sink is None:
+                    self.sink = self._factory()
+                sink = self.sink
+        return sink
+
+    def put(self, item: Record, wake_at: int) -> None:
+        """Queue ``item``, waking the writer once ``wake_at`` records are waiting."""
+        if self.queue.qsize() >= wake_at:
+            self.writer.notify()
+        self.queue.put(item)
+
+    def inject(self, items: Iterable[Record]) -> None:
+        """Add ``items`` to the next batch past the queue's bound, so a full queue cannot lose them."""
+        self._injected.extend(items)
+
+    def drain(self) -> int:
+        """Hand one batch to the sink, returning the records drained."""
+        if self._before_drain is not None:
+            self._before_drain()
+        with self.lock:
+            batch = self.queue.get_batch(self.batch_size)
+            while self._injected:
+                batch.append(self._injected.popleft())
+            if batch:
+                sink = self.get_sink()
+                start = time.perf_counter()
+                sink.write_batch(batch)
+                sink.metrics.flushed(len(batch), time.perf_counter() - start)
+            elif self.sink is not None:
+                self.sink.sync_if_due()
+        return len(batch)
+
+    def start(self) -> None:
+        self.writer.start()
+
+    def stop(self, timeout: float | None = None) -> bool:
+        """Stop the writer after a final drain, returning False if it outlived ``timeout``."""
+        return self.writer.stop(timeout)
@@ -0,0 +1,95 @@
+import threading
+import time
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+from .record import Record, level_number
+
+
+class _Window:
+    __slots__ = ("count", "first", "last", "start", "suppressed")
+
+    def __init__(self, start: float) -> None:
+        self.start = start
+        self.count = 1
+        self.suppressed = 0
+        self.first = self.last = 0.0
+
+
+class StormSuppressor:
+    """Coalesce repeated records before they reach the queues.
+
+    Records are fingerprinted by level, unformatted message and callsite.
+    The first ``limit`` per fingerprint in each ``window`` seconds pass (or
+    the level's entry in ``level_limits``); the rest are only counted. Once a
+    window ends, ``summaries()`` returns one record per fingerprint that lost
+    anything, carrying the count and the first and last suppressed times.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window: float = 1.0,
+        level_limits: Mapping[str, int] | None = None,
+        utc: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.limit = limit
+        self.window = window
+        self.level_limits = {k.lower(): v for k, v in (level_limits or {}).items()}
+        self.suppressed = 0
+        self._tz = UTC if utc else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._windows: dict[tuple[str, Any, Any], _Window] = {}
+        self._ready: list[Record] = []
+
+    def allow(self, level: str, message: Any, callsite: Any) -> bool:
+        """Return whether a record may be queued, counting it either way."""
+        key = (level, message, callsite)
+        now = self._clock()
+        with self._lock:
+            try:
+                window = self._windows.get(key)
+            except TypeError:
+                return True  # unhashable message: nothing to fingerprint
+            if window is None or now - window.start >= self.window:
+                if window is not None and window.suppressed:
+                    self._ready.append(self._summary(key, window))
+                self._windows[key] = _Window(now)
+                return True
+            window.count += 1
+            if window.count <= self.level_limits.get(level, self.limit):
+                return True
+            if not window.suppressed:
+                window.first = now
+            window.suppressed += 1
+            window.last = now
+            self.suppressed += 1
+            return False
+
+    def summaries(self, close_all: bool = False) -> list[Record]:
+        """Close finished windows (or all of them) and return their summary records."""
+        now = self._clock()
+        with self._lock:
+            ready, self._ready = self._ready, []
+            for key, window in list(self._windows.items()):
+                if close_all or now - window.start >= self.window:
+                    del self._windows[key]
+                    if window.suppressed:
+                        ready.append(self._summary(key, window))
+        return ready
+
+    def _summary(self, key: tuple[str, Any, Any], window: _Window) -> Record:
+        level, message, callsite = key
+        return Record(
+            level_number(level),
+            f"{message} (repeated {window.suppressed} times)",
+            fields={
+                "repeated": window.suppressed,
+                "first_seen": datetime.fromtimestamp(window.first, self._tz).isoformat(),
+                "last_seen": datetime.fromtimestamp(window.last, self._tz).isoformat(),
+            },
+            callsite=callsite,
+        )
@@ -0,0 +1,85 @@
+import heapq
+import os
+import threading
+import weakref
+from collections import deque
+
+from .record import Record
+
+_instances: "weakref.WeakSet[ThreadBuffers]" = weakref.WeakSet()
+
+
+def _timestamp(record: Record) -> int:
+    return record.timestamp_us
+
+
+class ThreadBuffers:
+    """One append-only buffer per logging thread, collected in batches by the writers.
+
+    A log call appends to its own thread's deque: no lock is shared with
+    other callers, so threads do not queue up behind one another (nor, on
+    free-threaded builds, serialize on a single queue). ``collect()`` takes
+    what every buffer holds and merges it by record timestamp, keeping each
+    thread's own order even if the clock steps back.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._buffers: list[tuple[threading.Thread, deque[Record]]] = []
+        _instances.add(self)
+
+    def append(self, item: Record) -> int:
+        """Buffer ``item`` for this thread and return how many the buffer now holds."""
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._register()
+        buffer.append(item)
+        return len(buffer)
+
+    def _register(self) -> deque[Record]:
+        buffer: deque[Record] = deque()
+        self._local.buffer = buffer
+        with self._lock:
+            self._buffers.append((threading.current_thread(), buffer))
+        return buffer
+
+    def __len__(self) -> int:
+        return sum(len(buffer) for _, buffer in self._buffers)
+
+    def collect(self) -> list[Record]:
+        """Take every buffered record, oldest first.
+
+        Callers serialize collection themselves, so that no thread's records
+        can overtake ones taken from the same buffer earlier.
+        """
+        with self._lock:
+            # Threads that have exited and been emptied need no further visits.
+            self._buffers = [
+                (thread, buffer) for thread, buffer in self._buffers if buffer or thread.is_alive()
+            ]
+            buffers = [buffer for _, buffer in self._buffers]
+        runs = []
+        for buffer in buffers:
+            # Only what is there now; the owner may keep appending meanwhile.
+            if run := [buffer.popleft() for _ in range(len(buffer))]:
+                runs.append(run)
+        if len(runs) == 1:
+            return runs[0]
+        return list(heapq.merge(*runs, key=_timestamp))
+
+    def _reset(self) -> None:
+        # The parent's buffers are the parent's to write.
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._buffers = []
+
+
+def _reset_after_fork() -> None:
+    for buffers in list(_instances):
+        buffers._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,94 @@
+"""Fingerprinting exceptions by where they came from, and rendering each traceback once."""
+
+import threading
+import traceback
+import zlib
+from collections import OrderedDict
+from typing import Any
+
+
+def fingerprint(exc: BaseException) -> str:
+    """Identify an exception by its type and the code locations of its traceback.
+
+    Chained causes and contexts count too, as they would print. Two
+    exceptions raised along the same path share a fingerprint whatever
+    their messages or local values.
+    """
+    crc = 0
+    seen: set[int] = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        cls = type(exc)
+        crc = zlib.crc32(f"{cls.__module__}.{cls.__qualname__}".encode(), crc)
+        tb = exc.__traceback__
+        while tb is not None:
+            code = tb.tb_frame.f_code
+            crc = zlib.crc32(f"|{code.co_filename}:{code.co_name}:{tb.tb_lineno}".encode(), crc)
+            tb = tb.tb_next
+        exc = exc.__cause__ or (None if exc.__suppress_context__ else exc.__context__)
+    return f"{crc:08x}"
+
+
+class _Seen:
+    __slots__ = ("count", "first_us")
+
+    def __init__(self, first_us: int) -> None:
+        self.first_us = first_us
+        self.count = 1
+
+
+class TracebackCache:
+    """Render each traceback in full once per fingerprint per ``window`` seconds.
+
+    Later occurrences inside the window render as a one-line reference:
+    the exception's type and latest message, its fingerprint and how often
+    it has been seen. At most ``max_entries`` fingerprints are remembered,
+    least recently seen first out; one that was pushed out renders in full
+    again. Windows follow the records' own timestamps, so the outcome does
+    not depend on when a sink gets round to a record.
+
+    Records call ``render`` from whichever sink worker formats them first,
+    holding ``lock``, so every sink shows the same form for a record.
+    """
+
+    def __init__(self, window: float = 60.0, max_entries: int = 256) -> None:
+        self.window_us = int(window * 1_000_000)
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self._seen: OrderedDict[str, _Seen] = OrderedDict()
+        self.rendered = 0
+        self.referenced = 0
+
+    def render(self, exc_info: tuple[Any, Any, Any], timestamp_us: int) -> tuple[str, bool]:
+        """Return the text for ``exc_info`` and whether it is a reference to an earlier one.
+
+        Callers hold ``lock``.
+        """
+        exc = exc_info[1]
+        if exc is None:
+            return self._full(exc_info), False
+        key = fingerprint(exc)
+        seen = self._seen.get(key)
+        if seen is not None and timestamp_us - seen.first_us < self.window_us:
+            seen.count += 1
+            self._seen.move_to_end(key)
+            self.referenced += 1
+            message = traceback.format_exception_only(exc_info[0], exc)[-1].rstrip("\n")
+            return f"{message} [traceback {key} repeated, seen {seen.count} times]", True
+        self._seen[key] = _Seen(timestamp_us)
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+        return f"{self._full(exc_info)}\n[traceback {key}]", False
+
+    def _full(self, exc_info: tuple[Any, Any, Any]) -> str:
+        self.rendered += 1
+        return "".join(traceback.format_exception(*exc_info)).rstrip("\n")
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return {
+                "rendered": self.rendered,
+                "referenced": self.referenced,
+                "fingerprints": len(self._seen),
+            }
@@ -1,139 +1,624 @@
-import asyncio
+import contextlib
+import functools
+import itertools
 import logging
-from asyncio import Queue
-from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+import threading
+import time
+from collections.abc import Mapping
 from logging import Logger
-from queue import Queue as SyncQueue
-from typing import Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from dual_logging.config.log_config import LoggerConfig
-from dual_logging.core.console_logger import ConsoleLogger
-from dual_logging.core.file_logger import FileLogger
+from dual_logging.config.log_config import LoggerConfig, QueueOverflowPolicy
+from dual_logging.config.log_context import current_context
+from dual_logging.core import durability
+from dual_logging.core.base_logger import BaseLogger
+from dual_logging.core.callsite import CallsiteCache
+from dual_logging.core.metrics import LoggerMetrics, MetricsReporter
+from dual_logging.core.overflow import OverflowQueue, combined_stats
+from dual_logging.core.record import MISSING, Record, level_number
+from dual_logging.core.sampling import AdaptiveSampler
+from dual_logging.core.sink_worker import SinkWorker
+from dual_logging.core.suppression import StormSuppressor
+from dual_logging.core.thread_buffers import ThreadBuffers
+from dual_logging.core.tracebacks import TracebackCache
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from dual_logging.core.async_queue import AsyncOverflowQueue
+
+
+class _AsyncLane(NamedTuple):
+    """An event loop's own async queue and the task writing it to the file."""
+
+    name: str
+    queue: "AsyncOverflowQueue"
+    task: "asyncio.Task"
 
 
 class DualLogger(Logger):
     def __init__(self, name: str, level: int = logging.NOTSET, cfg: LoggerConfig = None):
         super().__init__(name, level)
         self.cfg = cfg or LoggerConfig(name=name)
-        self.console_logger = ConsoleLogger(self.cfg)
-        self.file_logger = FileLogger(self.cfg)
+        # Sinks, their writer threads and the async machinery are all created on first use,
+        # so a logger that never logs opens no file and starts no thread.
+        self._sink_lock = threading.Lock()
+        self._collect_lock = threading.Lock()
+        self._buffers: ThreadBuffers | None = None
+        self._local_console = not self.cfg.log_server_address
+        self._workers: dict[str, SinkWorker] = {}
+        self._make_workers()
+        self._callsites = CallsiteCache(self.cfg.extra_ignores)
+        self._apply_traceback_config()
+        self._refresh_threshold()
+        self._suppressor = None
+        self._apply_suppression_config()
+        self._metrics = LoggerMetrics()
+        self._attach_metrics()
 
-        self._console_queue = SyncQueue(self.cfg.console_queue_size)
-        self._file_queue = SyncQueue(self.cfg.file_queue_size)
-        self._async_queue = Queue(self.cfg.file_queue_size)
+        # asyncio queues bind to one loop, so each loop that logs gets its own lane;
+        # this queue holds their settings and the counts of lanes already retired.
+        self._async_queue = OverflowQueue()
+        self._async_lanes: dict[asyncio.AbstractEventLoop, _AsyncLane] = {}
+        self._async_lane_ids = itertools.count(1)
+        self._async_lock = threading.Lock()
+        self._apply_queue_config()
+        self._apply_sampling_config()
+        self._async_sink = None
 
-        self.executor = ThreadPoolExecutor()
+        self._writer_started = False
+        self._apply_writer_config()
+        self._reporter = None
+        self._apply_metrics_config()
+        self._shut_down = False
+        self._apply_exit_config()
 
-        self.loop = None
-        self.flush_task = None
+    @property
+    def _console_queue(self) -> OverflowQueue:
+        return self._workers["console"].queue
 
-        self.dropped_console_logs = 0
-        self.dropped_file_logs = 0
+    @property
+    def _file_queue(self) -> OverflowQueue:
+        return self._workers["file"].queue
 
-        self.addHandler(self.console_logger.handler)
-        self.addHandler(self.file_logger.handler)
+    @property
+    def dropped_console_logs(self) -> int:
+        return self._console_queue.dropped
 
-    def _auto_detect_log(self, level: str, message: str, **ctx: Any) -> None:
-        loop = self._get_or_create_loop()
-        if loop.is_running():
-            asyncio.create_task(self._log_async(level, message, **ctx))
-        elif self.executor._shutdown:
-            self._log_sync(level, message, **ctx)
-        else:
-            try:
-                self.executor.submit(self._log_sync, level, message, **ctx)
-            except RuntimeError:
-                self._log_sync(level, message, **ctx)
-
-    def _get_or_create_loop(self):
-        if self.loop is None:
-            try:
-                self.loop = asyncio.get_running_loop()
-            except RuntimeError:
-                self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
-            self.flush_task = self.loop.create_task(self._flush_periodically())
-        return self.loop
-
-    def _log_sync(self, level: str, message: str, **ctx: Any) -> None:
-        if not self._console_queue.full():
-            self._console_queue.put_nowait((level, message, ctx))
+    @property
+    def dropped_file_logs(self) -> int:
+        return self._file_queue.dropped + sum(q.dropped for q in self._async_queues())
+
+    def _async_queues(self) -> list["OverflowQueue | AsyncOverflowQueue"]:
+        return [self._async_queue, *(lane.queue for lane in list(self._async_lanes.values()))]
+
+    def _make_workers(self) -> None:
+        """Give every sink its own queue and writer, keeping the queues of sinks already known.
+
+        The console worker always exists so its queue shows up in ``stats()``,
+        but records only reach it when the console is rendered locally.
+        """
+        old, batch_size = self._workers, self.cfg.writer_batch_size
+        self._extra_sinks = {sink.name: sink for sink in self.cfg.sinks}
+        factories = {"console": self._build_console, "file": self._build_file}
+        for name, sink in self._extra_sinks.items():
+            factories[name] = functools.partial(self._attach, sink, name)
+        self._workers = {
+            name: SinkWorker(
+                f"{self.name}-{name}-writer",
+                factory,
+                queue=old[name].queue if name in old else None,
+                batch_size=batch_size,
+                before_drain=self._collect,
+            )
+            for name, factory in factories.items()
+        }
+        self._targets = [
+            self._workers["file"],
+            *(self._workers[name] for name in self._extra_sinks),
+        ]
+        if self._local_console:
+            self._targets.insert(0, self._workers["console"])
+        # Inside a running loop the file is written through the async path instead.
+        self._loop_targets = [w for w in self._targets if w is not self._workers["file"]]
+
+    def _spill_path(self, sink: str, policy: QueueOverflowPolicy) -> str | None:
+        if policy is not QueueOverflowPolicy.SPILL:
+            return None
+        spill_dir = self.cfg.spill_dir or os.path.dirname(self.cfg.log_file_path)
+        # Loggers and processes sharing a name must not write over each other's spill.
+        return os.path.join(spill_dir, f"{self.cfg.name}.{sink}.{os.getpid()}-{id(self):x}.spill")
+
+    def _queue_settings(self, name: str) -> tuple[int, QueueOverflowPolicy, float]:
+        """Return the capacity, overflow policy and block timeout of the queue called ``name``."""
+        cfg = self.cfg
+        if name == "console":
+            size, policy, timeout = cfg.console_queue_size, cfg.console_overflow_policy, None
+        elif name in ("file", "async"):
+            size, policy, timeout = cfg.file_queue_size, cfg.file_overflow_policy, None
         else:
-            self.dropped_console_logs += 1
+            sink = self._extra_sinks[name]
+            size, policy, timeout = sink.queue_size, sink.overflow_policy, sink.block_timeout
+            size = cfg.file_queue_size if size is None else size
+        return (
+            size,
+            policy or cfg.queue_overflow_policy,
+            cfg.queue_block_timeout if timeout is None else timeout,
+        )
+
+    def _apply_queue_config(self) -> None:
+        queues = {name: worker.queue for name, worker in self._workers.items()}
+        queues["async"] = self._async_queue
+        blocking = False
+        for name, queue in queues.items():
+            policy = self._configure_queue(queue, name)
+            blocking |= policy is QueueOverflowPolicy.BLOCK and name != "async"
+        for lane in list(self._async_lanes.values()):
+            self._configure_queue(lane.queue, "async", lane.name)
+        # BLOCK makes the caller wait for room, so its records have to go straight
+        # to the queues; every other policy is applied when the buffers are collected.
+        if blocking and self._buffers is not None:
+            self._collect()
+            self._buffers = None
+        elif not blocking and self._buffers is None:
+            self._buffers = ThreadBuffers()
+
+    def _configure_queue(
+        self, queue: "OverflowQueue | AsyncOverflowQueue", name: str, spill_name: str | None = None
+    ) -> QueueOverflowPolicy:
+        """Apply the settings of the queue called ``name`` to ``queue``, returning its policy."""
+        size, policy, timeout = self._queue_settings(name)
+        queue.maxsize = size
+        queue.set_policy(policy, self._spill_path(spill_name or name, policy), timeout)
+        return policy
+
+    @property
+    def console_logger(self) -> BaseLogger:
+        """Return the console sink, creating it if no record has reached it yet."""
+        if not self._local_console:
+            # The log server renders the console too; RemoteSink stands in for both.
+            return self.file_logger
+        return self._workers["console"].get_sink()
+
+    @property
+    def file_logger(self) -> BaseLogger:
+        """Return the file sink, creating it if no record has reached it yet."""
+        return self._workers["file"].get_sink()
+
+    def _build_console(self) -> BaseLogger:
+        # Sink modules are imported here, so a process that never logs never
+        # loads Rich, structlog or the file backends.
+        from dual_logging.core.console_logger import ConsoleLogger  # noqa: PLC0415
+
+        return self._attach(ConsoleLogger(self.cfg), "console")
+
+    def _build_file(self) -> BaseLogger:
+        if not self._local_console:
+            from dual_logging.core.remote import RemoteSink  # noqa: PLC0415
+
+            return self._attach(RemoteSink(self.cfg), "file")
+        from dual_logging.core.file_logger import FileLogger  # noqa: PLC0415
+
+        return self._attach(FileLogger(self.cfg), "file")
+
+    def _attach(self, sink: BaseLogger, name: str) -> BaseLogger:
+        sink.metrics = self._metrics.sink(name)
+        if (handler := getattr(sink, "handler", None)) is not None:
+            self.addHandler(handler)
+        return sink
+
+    def _attach_metrics(self) -> None:
+        """Register the sinks' counters up front so stats() lists them before any write."""
+        if self._local_console:
+            self._metrics.sink("console")
+        self._metrics.sink("file")
+        for sink in self.cfg.sinks:
+            self._metrics.sink(sink.name)
+
+    def _apply_metrics_config(self) -> None:
+        if self._reporter is not None:
+            self._reporter.stop()
+            self._reporter = None
+        cfg = self.cfg
+        if cfg.metrics_interval and (cfg.metrics_callback or cfg.metrics_prometheus_path):
+            self._reporter = MetricsReporter(
+                self.stats,
+                cfg.metrics_interval,
+                cfg.name,
+                callback=cfg.metrics_callback,
+                prometheus_path=cfg.metrics_prometheus_path,
+            )
+            self._reporter.start()
+
+    def _apply_traceback_config(self) -> None:
+        cfg = self.cfg
+        self._tracebacks = None
+        if cfg.traceback_window:
+            self._tracebacks = TracebackCache(cfg.traceback_window, cfg.traceback_cache_size)
+
+    def _apply_suppression_config(self) -> None:
+        cfg = self.cfg
+        old, self._suppressor = self._suppressor, None
+        if cfg.storm_limit is not None:
+            self._suppressor = StormSuppressor(
+                cfg.storm_limit, cfg.storm_window, cfg.storm_level_limits, utc=cfg.use_utc
+            )
+        if old is not None:
+            # Report what the previous settings held back rather than losing it.
+            for item in old.summaries(close_all=True):
+                self._enqueue(item)
+            if self._suppressor is not None:
+                self._suppressor.suppressed = old.suppressed
 
-        if not self._file_queue.full():
-            self._file_queue.put_nowait((level, message, ctx))
+    def _apply_sampling_config(self) -> None:
+        cfg = self.cfg
+        if not cfg.sampling:
+            self._sampler = None
+            return
+        self._sampler = AdaptiveSampler(
+            self._queue_pressure,
+            start=cfg.sampling_start,
+            info_floor=cfg.sampling_info_floor,
+            target_rate=cfg.sampling_target_rate,
+            by_trace=cfg.sampling_by_trace,
+        )
+
+    def _queue_pressure(self) -> float:
+        """Fill ratio of the fullest bounded queue, counting records still in thread buffers."""
+        buffered = len(self._buffers) if self._buffers is not None else 0
+        pressure = max(
+            (
+                (w.queue.qsize() + buffered) / w.queue.maxsize
+                for w in self._targets
+                if w.queue.maxsize
+            ),
+            default=0.0,
+        )
+        for queue in self._async_queues():
+            if queue.maxsize:
+                pressure = max(pressure, queue.qsize() / queue.maxsize)
+        return pressure
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of queue depths, drops and per-sink write metrics."""
+        # Buffered records count as queued; any the queues cannot take show up as drops.
+        self._collect()
+        return {
+            "queues": {
+                **{name: worker.queue.stats() for name, worker in self._workers.items()},
+                "async": combined_stats(self._async_queues()),
+            },
+            "sinks": self._metrics.snapshot(),
+            "suppressed": self._suppressor.suppressed if self._suppressor is not None else 0,
+            "sampling": self._sampler.stats() if self._sampler is not None else None,
+            "tracebacks": self._tracebacks.stats() if self._tracebacks is not None else None,
+        }
+
+    def _apply_exit_config(self) -> None:
+        if self.cfg.drain_at_exit:
+            durability.drain_at_exit(self, self.cfg.drain_signals)
         else:
-            self.dropped_file_logs += 1
+            durability.forget(self)
 
-    async def _log_async(self, level: str, message: str, **ctx: Any) -> None:
-        await self._async_queue.put((level, message, ctx))
+    def _apply_writer_config(self) -> None:
+        for worker in self._workers.values():
+            worker.writer.min_interval = self.cfg.writer_min_interval
+            worker.writer.max_interval = self.cfg.writer_max_interval
+            worker.batch_size = self.cfg.writer_batch_size
+        # Wake a writer early once its queue is half full rather than on every record.
+        limits = [w.queue.maxsize // 2 for w in self._targets if w.queue.maxsize]
+        self._wake_threshold = max(1, min([self.cfg.writer_batch_size, *limits]))
+        if self._async_sink is not None:
+            self._async_sink.file_logger = self.file_logger
+            self._async_sink.max_batch = self.cfg.async_batch_size
+            self._async_sink.max_latency = self.cfg.async_flush_interval
 
-    async def _flush_periodically(self) -> None:
-        delay = 1  # Initial delay of 1 second
-        max_delay = 60  # Cap the delay at 60 seconds
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802
+        # logging.Logger's checks, with the sinks' lowest level for the effective one.
+        return not self.disabled and level >= self._threshold and level > self.manager.disable
 
-        while True:
-            try:
-                await asyncio.sleep(delay)
-                self.flush()
-                delay = 1  # Reset delay on success
-            except Exception as e:
-                print(f"Flush error: {e}")
-                delay = min(delay * 2, max_delay)  # Exponential backoff
+    def _refresh_threshold(self) -> None:
+        """Cache the lowest level any sink accepts; records below it are rejected at entry."""
+        self._threshold = min(
+            self.cfg.console_level_num,
+            self.cfg.file_level_num,
+            *(sink.level for sink in self._extra_sinks.values()),
+        )
 
-    def flush(self) -> None:
-        while not self._console_queue.empty():
-            level, message, ctx = self._console_queue.get_nowait()
-            self.console_logger._log_sync(level, message, **ctx)
+    def _auto_detect_log(self, level: str, message: str, *args: Any, **ctx: Any) -> None:
+        if args:
+            # Same single-mapping rule as logging.LogRecord; formatting waits for the sink.
+            if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+                args = args[0]
+            ctx["args"] = args
+        # Without asyncio imported no loop can be running, and the check costs nothing.
+        # A writer thread may be importing it (structlog does) right now: until the
+        # module has its functions, no loop can be running either.
+        get_running_loop = getattr(sys.modules.get("asyncio"), "_get_running_loop", None)
+        loop = get_running_loop() if get_running_loop is not None else None
+        if loop is None:
+            self._log_sync(level, message, **ctx)
+            return
+        record = self._make_record(level, message, ctx)
+        if self._admit(record):
+            lane = self._async_lanes.get(loop) or self._start_async_sink(loop)
+            if lane.queue.must_wait():
+                # Only BLOCK waits for room, and waiting takes a task of its own.
+                loop.create_task(self._log_async(record, lane.queue))
+            else:
+                lane.queue.offer_nowait(record)
+            if self._loop_targets or self._suppressor is not None:
+                # Only the file has an async path; the console and other sinks keep their
+                # writers, and those writers' ticks are what hand out storm summaries.
+                self._enqueue(record, self._loop_targets)
+
+    def _start_async_sink(self, loop: "asyncio.AbstractEventLoop") -> _AsyncLane:
+        """Give the running loop its own async queue and a task writing it to the file.
+
+        Loops logging from several threads each keep theirs; lanes of loops
+        that have since closed are written out and retired here.
+        """
+        from dual_logging.core.async_file_sink import AsyncFileSink  # noqa: PLC0415
+        from dual_logging.core.async_queue import AsyncOverflowQueue  # noqa: PLC0415
+
+        with self._async_lock:
+            if (lane := self._async_lanes.get(loop)) is not None:
+                return lane
+            if self._async_sink is None:
+                self._async_sink = AsyncFileSink(
+                    self.file_logger, self.cfg.async_batch_size, self.cfg.async_flush_interval
+                )
+            for old in [old for old in self._async_lanes if old.is_closed()]:
+                self._retire_lane(old)
+            name = f"async-{next(self._async_lane_ids)}"
+            queue = AsyncOverflowQueue()
+            self._configure_queue(queue, "async", name)
+            lane = _AsyncLane(name, queue, loop.create_task(self._async_sink.run(queue)))
+            self._async_lanes[loop] = lane
+            return lane
+
+    def _retire_lane(self, loop: "asyncio.AbstractEventLoop") -> None:
+        """Write out what ``loop``'s lane still holds and keep only its counts."""
+        lane = self._async_lanes.pop(loop)
+        self._async_sink.drain_sync(lane.queue, float("inf"))
+        self._async_queue.absorb(lane.queue)
+
+    def _make_record(self, level: str, message: Any, ctx: dict[str, Any]) -> Record:
+        """Build the Record for a log call, moving DualLogger's own keys out of ``ctx``.
+
+        The active exception and log context are pinned here so they survive
+        the hop to the writer thread, and the caller's location is captured
+        once if the level asks for it.
+        """
+        levelno = level_number(level)
+        args = ctx.pop("args", None)
+        exc_info = ctx.pop("exc_info", None)
+        callsite = ctx.pop("callsite", MISSING)
+        if callsite is MISSING:
+            callsite = None
+            if levelno >= self.cfg.callsite_level_num:
+                callsite = self._callsites.capture()
+        return Record(
+            levelno,
+            message,
+            args,
+            ctx,
+            context=current_context(),
+            exc_info=exc_info,
+            callsite=callsite,
+            # Tracebacks are fingerprinted and rendered by the sink workers, not here.
+            tracebacks=self._tracebacks if exc_info else None,
+        )
+
+    def _admit(self, record: Record) -> bool:
+        """Apply storm suppression and sampling, returning whether to queue the record."""
+        if self._suppressor is not None and not self._suppressor.allow(
+            record.level, record.message, record.callsite
+        ):
+            return False
+        return self._sampler is None or self._sampler.keep(record)
+
+    def _log_sync(self, level: str, message: Any, **ctx: Any) -> None:
+        record = self._make_record(level, message, ctx)
+        if self._admit(record):
+            self._enqueue(record)
 
-        while not self._file_queue.empty():
-            level, message, ctx = self._file_queue.get_nowait()
-            self.file_logger._log_sync(level, message, **ctx)
+    def _enqueue(self, item: Record, workers: list[SinkWorker] | None = None) -> None:
+        if not self._writer_started:
+            self._writer_started = True
+            self._start_workers()
+        threshold = self._wake_threshold
+        buffers = self._buffers
+        if workers is None and buffers is not None:
+            # The writers collect the buffers as they drain; a thread that has
+            # filled a batch on its own moves it to the queues itself.
+            if buffers.append(item) >= threshold:
+                self._collect_buffers()
+                for worker in self._targets:
+                    worker.writer.notify()
+            return
+        for worker in self._targets if workers is None else workers:
+            worker.put(item, threshold)
+
+    def _start_workers(self) -> None:
+        for worker in self._targets:
+            worker.start()
+
+    async def _log_async(self, record: Record, queue: "AsyncOverflowQueue") -> None:
+        await queue.offer(record)
+
+    def _drain(self) -> int:
+        """Hand one batch from each sink's queue to its sink, returning the records drained."""
+        return sum([worker.drain() for worker in self._targets])
+
+    def _collect(self) -> None:
+        """Move buffered records to the sinks' queues and hand out due storm summaries."""
+        self._collect_buffers()
+        if self._suppressor is not None and (summaries := self._suppressor.summaries()):
+            # Summaries skip the queues so a full queue cannot lose them.
+            for worker in self._targets:
+                worker.inject(summaries)
+
+    def _collect_buffers(self) -> None:
+        buffers = self._buffers
+        if buffers is None:
+            return
+        # One collector at a time, so a thread's records reach the queues in its own order.
+        with self._collect_lock:
+            if batch := buffers.collect():
+                for worker in self._targets:
+                    worker.queue.put_many(batch)
+
+    def flush(self) -> None:
+        while self._drain():
+            pass
 
     async def flush_async(self) -> None:
-        while not self._async_queue.empty():
-            level, message, ctx = await self._async_queue.get()
-            await self.file_logger._log_async(level, message, **ctx)
+        # Already loaded: there is a running loop.
+        import asyncio  # noqa: PLC0415
+
+        if (lane := self._async_lanes.get(asyncio.get_running_loop())) is not None:
+            await self._async_sink.drain(lane.queue)
 
     def handle(self, record: logging.LogRecord) -> None:
-        """Handle a LogRecord, dispatching it to both loggers."""
-        self._auto_detect_log(record.levelname.lower(), record.msg, **record.__dict__)
-        self.callHandlers(record)
-
-    def shutdown(self) -> None:
-        self.flush()
-        if not self.executor._shutdown:
-            self.executor.shutdown(wait=True)
-        if self.flush_task:
-            self.flush_task.cancel()
-        logging.shutdown()
+        """Queue a stdlib LogRecord, as built by ``log()``, for both sinks exactly once."""
+        if self.disabled or not self.filter(record):
+            return
+        item = Record.from_log_record(record, current_context())
+        if item.exc_info is not None:
+            item.tracebacks = self._tracebacks
+        if self._admit(item):
+            self._enqueue(item)
+
+    def shutdown(self, timeout: float | None = None) -> dict[str, int]:
+        """Drain every queue, the async one included, then close the sinks.
+
+        Draining stops at ``timeout`` seconds (``cfg.shutdown_timeout`` by
+        default). Records still queued then are counted as ``"shutdown"``
+        drops and reported on stderr; the counts by queue are returned.
+        Calling it again, as the exit hook does, is a no-op.
+        """
+        if self._shut_down:
+            return {}
+        self._shut_down = True
+        self._writer_started = True  # keep _enqueue from starting a new writer
+        self._drain_until(
+            time.monotonic() + (self.cfg.shutdown_timeout if timeout is None else timeout)
+        )
+        for loop, lane in list(self._async_lanes.items()):
+            if not lane.task.done():
+                # The loop may be running on another thread, or closed already.
+                with contextlib.suppress(RuntimeError):
+                    loop.call_soon_threadsafe(lane.task.cancel)
+        lost = self._discard_queued()
+        with self._async_lock:
+            # A loop that logs after this starts a new lane.
+            for loop in list(self._async_lanes):
+                self._retire_lane(loop)
+        for worker in self._workers.values():
+            worker.queue.close()
+        if (file_sink := self._workers["file"].sink) is not None:
+            file_sink.sync()
+        self._close_sinks()
+        durability.forget(self)
+        if self._reporter is not None:
+            # Last, so its final snapshot counts everything written.
+            self._reporter.stop()
+        return lost
+
+    def _close_sinks(self) -> None:
+        for sink in {worker.sink for worker in self._workers.values()} - {None}:
+            # As in logging.shutdown(): at exit a stream may already be closed under us.
+            with contextlib.suppress(OSError, ValueError):
+                sink.flush()
+                sink.close()
+            if (handler := getattr(sink, "handler", None)) is not None:
+                self.removeHandler(handler)
+
+    def _drain_until(self, deadline: float) -> None:
+        """Stop the writers and write out every queue until the ``time.monotonic()`` deadline."""
+        if self._suppressor is not None:
+            for item in self._suppressor.summaries(close_all=True):
+                self._enqueue(item)
+        # Built-in sinks first, so a stalled network sink cannot use up their time.
+        for worker in self._workers.values():
+            # A writer stuck past the deadline still holds its lock; leave its queue be.
+            if not worker.stop(timeout=max(0.0, deadline - time.monotonic())):
+                continue
+            while time.monotonic() < deadline and worker.drain():
+                pass
+        if self._async_sink is not None:
+            for lane in list(self._async_lanes.values()):
+                self._async_sink.drain_sync(lane.queue, deadline)
+
+    def _discard_queued(self) -> dict[str, int]:
+        """Drop what the drain left behind, reporting it on stderr, and return the counts."""
+        self._collect_buffers()
+        lost = {name: worker.queue.discard("shutdown") for name, worker in self._workers.items()}
+        lost["async"] = sum(queue.discard("shutdown") for queue in self._async_queues())
+        if total := sum(lost.values()):
+            counts = ", ".join(f"{name}={count}" for name, count in lost.items() if count)
+            print(
+                f"{self.name}: shutdown deadline passed, {total} records lost ({counts})",
+                file=sys.stderr,
+            )
+        return lost
 
     def configure(self, cfg: LoggerConfig) -> None:
         """Dynamically reconfigure logger."""
         self.cfg = cfg
         self.setLevel(cfg.console_level_num)
-        self.console_logger = ConsoleLogger(cfg)
-        self.file_logger = FileLogger(cfg)
+        with self._sink_lock:
+            # Records already queued are written by the sinks they were queued for.
+            for worker in self._workers.values():
+                worker.stop()
+            # Release the old file now: an mmap segment must not have two writers.
+            self._close_sinks()
+            # The new sinks are built from the new config when the next record reaches them.
+            self._local_console = not cfg.log_server_address
+            self._make_workers()
+            self._attach_metrics()
+        self._callsites = CallsiteCache(cfg.extra_ignores)
+        self._apply_traceback_config()
+        self._refresh_threshold()
+        self._apply_queue_config()
+        self._apply_suppression_config()
+        self._apply_sampling_config()
+        self._apply_writer_config()
+        if self._writer_started:
+            self._start_workers()
+        self._apply_metrics_config()
+        self._shut_down = False
+        self._apply_exit_config()
 
-    # Standard logging methods
+    # Standard logging methods. Levels below every sink's fail the first, inline
+    # comparison; isEnabledFor then adds self.disabled and logging.disable().
     def debug(self, msg: Any, *args: Any, **kwargs: Any) -> None:
-        self._auto_detect_log("debug", msg, **kwargs)
+        if self._threshold <= logging.DEBUG and self.isEnabledFor(logging.DEBUG):
+            self._auto_detect_log("debug", msg, *args, **kwargs)
 
     def info(self, msg: Any, *args: Any, **kwargs: Any) -> None:
-        self._auto_detect_log("info", msg, **kwargs)
+        if self._threshold <= logging.INFO and self.isEnabledFor(logging.INFO):
+            self._auto_detect_log("info", msg, *args, **kwargs)
 
     def warning(self, msg: Any, *args: Any, **kwargs: Any) -> None:
-        self._auto_detect_log("warning", msg, **kwargs)
+        if self._threshold <= logging.WARNING and self.isEnabledFor(logging.WARNING):
+            self._auto_detect_log("warning", msg, *args, **kwargs)
 
     def error(self, msg: Any, *args: Any, **kwargs: Any) -> None:
-        self._auto_detect_log("error", msg, **kwargs)
+        if self._threshold <= logging.ERROR and self.isEnabledFor(logging.ERROR):
+            self._auto_detect_log("error", msg, *args, **kwargs)
 
     def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         # Route through auto detect to ensure consistency
-        self._auto_detect_log("critical", message, **kwargs)
+        if self._threshold <= logging.CRITICAL and self.isEnabledFor(logging.CRITICAL):
+            self._auto_detect_log("critical", message, *args, **kwargs)
 
     def exception(self, message: str, *args: Any, exc_info: bool = True, **kwargs: Any) -> None:
+        if not self.isEnabledFor(logging.ERROR):
+            return
         kwargs["exc_info"] = exc_info
         # Use auto detect to ensure it follows the same path
-        self._auto_detect_log("error", message, **kwargs)
+        self._auto_detect_log("error", message, *args, **kwargs)
@@ -0,0 +1,52 @@
+"""Query a log file and its rotated backups by time range, level and field.
+
+Usage::
+
+    python -m dual_logging.logquery logs/app.log --since 2026-10-18T14:00 --until 2026-10-18T14:05
+    python -m dual_logging.logquery logs/app.log --level error --field user=alice --count
+"""
+
+import argparse
+import sys
+from datetime import datetime
+
+from .core.fast_json import encode_event
+from .core.log_index import query
+
+
+def _field(text: str) -> tuple[str, str]:
+    key, sep, value = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {text!r}")
+    return key, value
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="the active log file; its backups are found next to it")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="ISO 8601 start, inclusive")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="ISO 8601 end, inclusive")
+    parser.add_argument("--level", action="append", help="level to include (repeatable)")
+    parser.add_argument(
+        "--field", type=_field, action="append", default=[], help="KEY=VALUE to match (repeatable)"
+    )
+    parser.add_argument("--count", action="store_true", help="print only the number of matches")
+    args = parser.parse_args(argv)
+
+    matches = query(
+        args.path, start=args.since, end=args.until, levels=args.level, fields=dict(args.field)
+    )
+    try:
+        if args.count:
+            print(sum(1 for _ in matches))
+        else:
+            for event in matches:
+                sys.stdout.write(encode_event(event) + "\n")
+    except (OSError, ValueError) as exc:
+        print(f"logquery: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
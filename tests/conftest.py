@@ -0,0 +1,55 @@
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.file_logger import FileLogger
+from dual_logging.duallogger import DualLogger
+
+
+@pytest.fixture
+def make_logger(tmp_path):
+    """Return a factory of DualLoggers writing ``tmp_path/app.log`` with the console quiet.
+
+    Keyword arguments override LoggerConfig fields. Every logger made is
+    shut down after the test, if the test has not done so itself.
+    """
+    loggers: list[DualLogger] = []
+
+    def make(name: str = "test", **overrides: Any) -> DualLogger:
+        options = {"console_level": "CRITICAL", "log_file_path": str(tmp_path / "app.log")}
+        options.update(overrides)
+        logger = DualLogger(name, cfg=LoggerConfig(name=name, **options))
+        loggers.append(logger)
+        return logger
+
+    yield make
+    for logger in loggers:
+        logger.shutdown()
+
+
+@pytest.fixture
+def make_file_logger(tmp_path):
+    """Return a factory of FileLoggers writing ``path``, ``tmp_path/app.log`` by default."""
+
+    def make(path: Path | None = None, **overrides: Any) -> FileLogger:
+        return FileLogger(
+            LoggerConfig(log_file_path=str(path or tmp_path / "app.log"), **overrides)
+        )
+
+    return make
+
+
+@pytest.fixture
+def wait_for():
+    """Return ``wait(predicate, timeout=5.0)``, which polls until ``predicate()`` is true."""
+
+    def wait(predicate: Any, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            assert time.monotonic() < deadline, "timed out"
+            time.sleep(0.01)
+
+    return wait
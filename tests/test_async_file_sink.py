@@ -0,0 +1,155 @@
+import asyncio
+import io
+import json
+import threading
+import time
+from unittest.mock import patch
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.async_file_sink import AsyncFileSink
+from dual_logging.core.file_logger import FileLogger
+from dual_logging.duallogger import DualLogger
+
+RECORDS_PER_LOOP = 200
+CLOSING_RECORDS = 2000
+
+
+async def test_sink_groups_records_into_one_write(tmp_path):
+    file_logger = FileLogger(LoggerConfig(name="sink_test", log_file_path=str(tmp_path / "a.log")))
+    sink = AsyncFileSink(file_logger, max_batch=100, max_latency=0.05)
+    writes = []
+    original = file_logger.write_batch
+    file_logger.write_batch = lambda batch: writes.append(len(batch)) or original(batch)
+
+    queue = asyncio.Queue()
+    task = asyncio.create_task(sink.run(queue))
+    for i in range(5):
+        queue.put_nowait(("info", "grouped", {"seq": i}))
+    await asyncio.sleep(0.2)
+    task.cancel()
+
+    assert writes == [5]
+    lines = (tmp_path / "a.log").read_text().splitlines()
+    assert [json.loads(line)["seq"] for line in lines] == list(range(5))
+
+
+async def test_sink_rotates_with_sync_settings(tmp_path):
+    cfg = LoggerConfig(
+        name="sink_rotate", log_file_path=str(tmp_path / "r.log"), max_bytes=500, backup_count=2
+    )
+    sink = AsyncFileSink(FileLogger(cfg))
+    for i in range(10):
+        await sink.write([("info", "x" * 100, {"seq": i})])
+    sink.file_logger.handler.rotator.join()
+
+    assert (tmp_path / "r.log.1").exists()
+    assert (tmp_path / "r.log.2").exists()
+    assert not (tmp_path / "r.log.3").exists()
+
+
+async def test_dual_logger_async_path_reaches_file(tmp_path):
+    path = tmp_path / "d.log"
+    cfg = LoggerConfig(name="sink_dual", console_level="CRITICAL", log_file_path=str(path))
+    logger = DualLogger("sink_dual", cfg=cfg)
+    for i in range(3):
+        logger.info("async record", seq=i)
+    await asyncio.sleep(0.2)
+    await logger.flush_async()
+    logger.shutdown()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["seq"] for line in lines] == [0, 1, 2]
+
+
+def test_loops_on_two_threads_each_write_their_own_records_once(tmp_path, recwarn):
+    path = tmp_path / "loops.log"
+    cfg = LoggerConfig(name="sink_loops", console_level="CRITICAL", log_file_path=str(path))
+    logger = DualLogger("sink_loops", cfg=cfg)
+    turns = [threading.Semaphore(1), threading.Semaphore(0)]
+
+    async def main(n: int) -> None:
+        # The loops take turns, so every record switches loop.
+        for i in range(RECORDS_PER_LOOP):
+            turns[n].acquire()
+            logger.info("looped", loop=n, seq=i)
+            turns[1 - n].release()
+            await asyncio.sleep(0)
+
+    threads = [threading.Thread(target=asyncio.run, args=(main(n),)) for n in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.shutdown()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    for n in range(2):
+        assert [line["seq"] for line in lines if line["loop"] == n] == list(range(RECORDS_PER_LOOP))
+    assert not [w for w in recwarn if "destroyed" in str(w.message)]
+    assert logger.stats()["queues"]["async"]["dropped"] == 0
+
+
+def test_records_logged_in_a_loop_reach_the_console(tmp_path):
+    cfg = LoggerConfig(
+        name="sink_console", console_format="text", log_file_path=str(tmp_path / "c.log")
+    )
+    logger = DualLogger("sink_console", cfg=cfg)
+    stream = io.StringIO()
+    logger.console_logger.handler.setStream(stream)
+
+    async def main() -> None:
+        logger.info("from the loop", seq=1)
+
+    asyncio.run(main())
+    logger.shutdown()
+    assert "from the loop" in stream.getvalue()
+    assert json.loads((tmp_path / "c.log").read_text())["event"] == "from the loop"
+
+
+async def test_logging_in_a_loop_creates_no_task_per_call(tmp_path):
+    cfg = LoggerConfig(
+        name="sink_tasks",
+        console_level="CRITICAL",
+        log_file_path=str(tmp_path / "t.log"),
+        file_queue_size=0,
+    )
+    logger = DualLogger("sink_tasks", cfg=cfg)
+    logger.info("starts the lane")
+    tasks = len(asyncio.all_tasks())
+    for i in range(RECORDS_PER_LOOP):
+        logger.info("no task", seq=i)
+    assert len(asyncio.all_tasks()) == tasks
+    logger.shutdown()
+    assert len((tmp_path / "t.log").read_text().splitlines()) == RECORDS_PER_LOOP + 1
+
+
+def test_a_batch_in_flight_when_the_loop_closes_is_written_once(tmp_path):
+    path = tmp_path / "closing.log"
+    cfg = LoggerConfig(
+        name="sink_closing",
+        console_level="CRITICAL",
+        log_file_path=str(path),
+        file_queue_size=0,
+    )
+    logger = DualLogger("sink_closing", cfg=cfg)
+    write = logger.file_logger.write_batch
+    logger.file_logger.write_batch = lambda batch: (time.sleep(0.05), write(batch))
+    writing = threading.Event()
+    sink_write = AsyncFileSink.write
+
+    async def write_and_signal(self, batch):
+        writing.set()
+        await sink_write(self, batch)
+
+    async def main() -> None:
+        for i in range(CLOSING_RECORDS):
+            logger.info("closing", seq=i)
+        while not writing.is_set():
+            await asyncio.sleep(0.001)
+
+    with patch.object(AsyncFileSink, "write", write_and_signal):
+        asyncio.run(main())
+    logger.shutdown()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["seq"] for line in lines] == list(range(CLOSING_RECORDS))
@@ -0,0 +1,58 @@
+import json
+import threading
+import time
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.batch_writer import BatchWriter
+from dual_logging.duallogger import DualLogger
+
+RECORDS: int = 10
+
+
+def test_writer_drains_on_notify():
+    drained = threading.Event()
+
+    def drain():
+        drained.set()
+        return 0
+
+    writer = BatchWriter(drain, min_interval=10, max_interval=10)
+    writer.start()
+    try:
+        writer.notify()
+        assert drained.wait(1)
+    finally:
+        writer.stop()
+    assert not writer.running
+
+
+def test_writer_final_drain_on_stop():
+    calls = []
+    writer = BatchWriter(lambda: calls.append(1) or 0, min_interval=10, max_interval=10)
+    writer.start()
+    writer.stop()
+    assert calls
+
+
+def test_records_reach_file_without_flush(tmp_path):
+    path = tmp_path / "writer.log"
+    cfg = LoggerConfig(
+        name="writer_test",
+        console_level="CRITICAL",
+        log_file_path=str(path),
+        writer_min_interval=0.001,
+        writer_max_interval=0.01,
+    )
+    logger = DualLogger("writer_test", cfg=cfg)
+    for i in range(RECORDS):
+        logger.info("batched", seq=i)
+
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and (
+        not path.exists() or len(path.read_text().splitlines()) < RECORDS
+    ):
+        time.sleep(0.01)
+    logger.shutdown()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["seq"] for line in lines] == list(range(RECORDS))
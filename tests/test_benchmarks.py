@@ -0,0 +1,20 @@
+from benchmarks._harness import compare, percentile
+
+MEDIAN: int = 3
+
+
+def test_percentile():
+    assert percentile([5, 1, 3, 2, 4], 50) == MEDIAN
+    assert percentile([], 99) == 0.0
+
+
+def test_compare_flags_regressions_in_the_right_direction():
+    baseline = {"benchmarks": {"b": {"records_per_s": 1000, "p99_us": 10, "file_dropped": 0}}}
+    better = {"benchmarks": {"b": {"records_per_s": 1500, "p99_us": 5, "file_dropped": 3}}}
+    worse_metrics = {"records_per_s": 800, "p99_us": 20}
+    worse = {"benchmarks": {"b": worse_metrics}}
+
+    assert compare(better, baseline, 0.1) == []
+    regressions = compare(worse, baseline, 0.1)
+    assert len(regressions) == len(worse_metrics)
+    assert regressions[0].startswith("b.records_per_s")
@@ -0,0 +1,128 @@
+import gzip
+import io
+import json
+from decimal import Decimal
+
+import pytest
+
+from dual_logging import binlog
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.binary_format import BinaryLogReader, BlockEncoder
+from dual_logging.core.record import Record
+
+BACKUPS: int = 3
+CLI_LINES: int = 5
+
+
+class _User:
+    def __str__(self) -> str:
+        return "alice"
+
+
+RECORDS = [
+    ("info", "user %s logged in", {"args": ("alice",), "attempt": 2, "callsite": ("/a.py", 7)}),
+    ("info", "user %s logged in", {"args": ("bob",), "attempt": 3, "callsite": ("/a.py", 7)}),
+    (
+        "warning",
+        "slow",
+        {
+            "ms": 12.5,
+            "tags": ("a", 1),
+            "meta": {"k": [1, None]},
+            "ok": False,
+            "callsite": ("/b.py", 1),
+        },
+    ),
+    ("error", "failed", {"exc_info": True, "err": None, "callsite": None, "delta": -4}),
+    (
+        "info",
+        "ctx",
+        {"log_context": {"trace_id": "t1", "user": "u"}, "user": "override", "callsite": None},
+    ),
+    ("debug", 12345, {"level": "shadowed", "text": 'café ☃ "q"\n', "callsite": None}),
+    ("info", "user %s", {"args": (_User(),), "callsite": None}),
+    ("info", "took %.2f ms", {"args": (Decimal("1.5"),), "callsite": None}),
+    ("info", "as %(who)s", {"args": {"who": _User()}, "callsite": None}),
+]
+
+
+def test_reads_back_what_the_json_format_writes(tmp_path, make_file_logger):
+    records = [Record.from_item(item) for item in RECORDS]
+    binary = make_file_logger(tmp_path / "b.log", file_level="DEBUG", file_format="binary")
+    binary.write_batch(records[:3])
+    binary.write_batch(records[3:])
+    binary.handler.close()
+
+    expected = make_file_logger(tmp_path / "j.log", file_level="DEBUG", fast_json=True)
+    lines = [json.loads(expected._render(record)) for record in records]
+    with open(tmp_path / "b.log", "rb") as f:
+        assert [json.loads(json.dumps(e)) for e in BinaryLogReader(f).events()] == lines
+    assert binary.metrics.records_written == len(RECORDS)
+
+
+def test_is_smaller_than_json_lines(tmp_path, make_file_logger):
+    binary = make_file_logger(tmp_path / "b.log", file_format="binary")
+    text = make_file_logger(tmp_path / "j.log", fast_json=True)
+    batch = [("info", "request done", {"status": 200, "path": "/x", "callsite": ("/a.py", 1)})]
+    for _ in range(200):
+        binary.write_batch(batch * 5)
+        text.write_batch(batch * 5)
+    binary.handler.close()
+    text.handler.close()
+    assert (tmp_path / "b.log").stat().st_size * 3 < (tmp_path / "j.log").stat().st_size
+
+
+def test_reader_stops_at_a_partial_block_and_resumes(tmp_path):
+    encoder = BlockEncoder()
+    header = encoder.start({"time_format": None})
+    first = encoder.encode([(1_000_000, "info", "one", None, {}, False, None)])
+    second = encoder.encode([(1_500_000, "info", "two", None, {"n": 1}, False, None)])
+    stream = io.BytesIO(header + first + second[:-2])
+
+    reader = BinaryLogReader(stream)
+    assert [e["event"] for e in reader.events()] == ["one"]
+    stream.seek(0, io.SEEK_END)
+    stream.write(second[-2:])
+    stream.seek(len(header + first))
+    assert list(reader.records()) == [
+        (1_500_000, {"n": 1, "exc_info": False, "event": "two", "timestamp": 1.5, "level": "info"})
+    ]
+
+
+def test_rotated_files_start_with_their_own_string_table(tmp_path, make_file_logger):
+    path = tmp_path / "b.log"
+    logger = make_file_logger(path, file_format="binary", max_bytes=80, backup_count=BACKUPS)
+    for i in range(20):
+        logger.write_batch([("info", "tick %d", {"args": (i,), "callsite": None})])
+    logger.handler.close()
+
+    files = [path, *sorted(tmp_path.glob("b.log.*"))]
+    assert len(files) == BACKUPS + 1
+    events = []
+    for name in reversed(files):
+        with open(name, "rb") as f:
+            events.extend(e["event"] for e in BinaryLogReader(f).events())
+    assert events == [f"tick {i}" for i in range(20 - len(events), 20)]
+
+
+def test_cli_converts_compressed_backups_and_tails(tmp_path, make_file_logger, capsys):
+    logger = make_file_logger(tmp_path / "b.log", file_format="binary")
+    logger.write_batch([("info", f"line {i}", {"callsite": None}) for i in range(CLI_LINES)])
+    logger.handler.close()
+    (tmp_path / "b.log.1.gz").write_bytes(gzip.compress((tmp_path / "b.log").read_bytes()))
+
+    out = tmp_path / "out.jsonl"
+    assert binlog.main(["convert", str(tmp_path / "b.log.1.gz"), "--output", str(out)]) == 0
+    assert len(out.read_text().splitlines()) == CLI_LINES
+    assert binlog.main(["tail", "-n", "2", str(tmp_path / "b.log")]) == 0
+    assert [json.loads(line)["event"] for line in capsys.readouterr().out.splitlines()] == [
+        "line 3",
+        "line 4",
+    ]
+
+
+def test_binary_needs_the_rotating_backend(tmp_path):
+    with pytest.raises(ValueError):
+        LoggerConfig(
+            log_file_path=str(tmp_path / "b.log"), file_format="binary", file_backend="mmap"
+        )
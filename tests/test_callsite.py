@@ -0,0 +1,60 @@
+import json
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.callsite import CallsiteCache
+from dual_logging.duallogger import DualLogger
+
+
+def _capture(cache):
+    return cache.capture()
+
+
+def test_cache_reuses_site_per_code_location():
+    cache = CallsiteCache()
+    sites = [_capture(cache) for _ in range(3)]
+    assert sites[0] == (__file__, _capture.__code__.co_firstlineno + 1)
+    assert sites[0] is sites[1] is sites[2]
+
+
+def test_cache_keeps_the_most_recently_used_lines():
+    cache = CallsiteCache(max_entries=2)
+    first = _capture(cache)
+    second = cache.capture()
+    assert _capture(cache) is first
+    third = cache.capture()
+    assert list(cache._sites.values()) == [first, third]
+    assert second not in cache._sites.values()
+
+
+def test_ignored_code_is_skipped_without_its_module():
+    cache = CallsiteCache()
+    internal = {"__name__": "dual_logging.fake", "cache": cache}
+    exec("def log():\n    return cache.capture()", internal)  # noqa: S102
+    assert internal["log"]() == (
+        __file__,
+        test_ignored_code_is_skipped_without_its_module.__code__.co_firstlineno + 4,
+    )
+    assert internal["log"].__code__ in cache._skipped
+    # Renamed afterwards, the module is not consulted again.
+    internal["__name__"] = "app"
+    assert internal["log"]()[0] == __file__
+
+
+def test_records_report_the_caller_not_the_flush_site(tmp_path):
+    path = tmp_path / "c.log"
+    cfg = LoggerConfig(
+        name="callsite_test",
+        console_level="CRITICAL",
+        log_file_path=str(path),
+        callsite_level="WARNING",
+    )
+    logger = DualLogger("callsite_test", cfg=cfg)
+    logger.info("no callsite")
+    logger.warning("with callsite")
+    expected_line = test_records_report_the_caller_not_the_flush_site.__code__.co_firstlineno + 10
+    logger.shutdown()
+
+    info, warning = (json.loads(line) for line in path.read_text().splitlines())
+    assert "pathname" not in info
+    assert warning["pathname"] == __file__
+    assert warning["lineno"] == expected_line
@@ -0,0 +1,126 @@
+import asyncio
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.durability import FsyncPolicy
+from dual_logging.core.record import Record
+
+FSYNC_EVERY: int = 10
+BATCHES: int = 5
+
+
+@pytest.fixture
+def fsyncs(monkeypatch):
+    calls = []
+    fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: calls.append(fd) or fsync(fd))
+    return calls
+
+
+def _batch(level="info", size=5):
+    return [(level, "event", {"callsite": None}) for _ in range(size)]
+
+
+def test_every_n_syncs_once_per_n_records_and_on_close(make_file_logger, fsyncs):
+    logger = make_file_logger(durability="every_n", fsync_every=FSYNC_EVERY)
+    for _ in range(BATCHES):
+        logger.write_batch(_batch())
+    synced = BATCHES * len(_batch()) // FSYNC_EVERY
+    assert len(fsyncs) == synced
+    assert logger.metrics.fsyncs == synced
+    logger.handler.close()
+    assert len(fsyncs) == synced + 1
+
+
+def test_level_syncs_on_warning_and_above(make_file_logger, fsyncs):
+    logger = make_file_logger(durability="level")
+    logger.write_batch(_batch("info"))
+    logger.write_batch(_batch("debug"))
+    assert fsyncs == []
+    logger.write_batch([*_batch("info"), *_batch("warning", 1)])
+    assert len(fsyncs) == 1
+
+
+def test_none_never_syncs(make_file_logger, fsyncs):
+    logger = make_file_logger()
+    logger.write_batch(_batch("critical"))
+    logger.handler.close()
+    assert fsyncs == []
+
+
+def test_interval_syncs_what_is_left_once_writes_go_quiet():
+    policy = FsyncPolicy("interval", interval=60)
+    assert not policy.wrote([Record(logging.INFO, "x")])
+    assert not policy.due()
+    policy._last_sync -= 60
+    assert policy.due()
+    policy.synced()
+    assert not policy.due()
+
+
+def _events(path):
+    return [json.loads(line)["event"] for line in path.read_text().splitlines()]
+
+
+async def test_shutdown_writes_the_async_queue(tmp_path, make_logger):
+    logger = make_logger("durable", writer_max_interval=60)
+    logger.info("queued on a loop")
+    # As if the loop stopped before its sink task ever ran.
+    lane = logger._async_lanes[asyncio.get_running_loop()]
+    lane.task.cancel()
+    await asyncio.sleep(0)
+    assert lane.queue.qsize() == 1
+
+    assert logger.shutdown() == {"console": 0, "file": 0, "async": 0}
+    assert _events(tmp_path / "app.log") == ["queued on a loop"]
+
+
+def test_records_left_at_the_deadline_are_reported(make_logger, capsys):
+    logger = make_logger("durable", console_level="INFO", writer_max_interval=60)
+    logger._writer_started = True  # no writer ever runs, as if every one were stuck
+    for i in range(3):
+        logger.info("late %d", i)
+
+    lost = logger.shutdown(timeout=0)
+    assert lost == {"console": 3, "file": 3, "async": 0}
+    assert "6 records lost (console=3, file=3)" in capsys.readouterr().err
+    assert logger.stats()["queues"]["file"]["drops"] == {"shutdown": {"info": 3}}
+    assert logger.shutdown() == {}
+
+
+def test_unknown_signal_names_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        LoggerConfig(log_file_path=str(tmp_path / "app.log"), drain_signals=("SIGNOPE",))
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM") or os.name != "posix", reason="POSIX signals")
+def test_sigterm_drains_the_queues_before_exit(tmp_path):
+    path = tmp_path / "app.log"
+    script = textwrap.dedent(f"""
+        import sys, time
+        from dual_logging import DualLogger, LoggerConfig
+        cfg = LoggerConfig(
+            name="sigterm", console_level="CRITICAL", log_file_path={str(path)!r},
+            file_queue_size=0, writer_max_interval=60, drain_signals=("SIGTERM",),
+        )
+        logger = DualLogger("sigterm", cfg=cfg)
+        for i in range(500):
+            logger.info("queued", seq=i)
+        print("ready", flush=True)
+        time.sleep(30)
+    """)
+    proc = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-c", script], stdout=subprocess.PIPE, text=True, cwd=os.getcwd()
+    )
+    assert proc.stdout.readline().strip() == "ready"
+    proc.send_signal(signal.SIGTERM)
+    assert proc.wait(10) == 128 + signal.SIGTERM
+    assert [json.loads(line)["seq"] for line in path.read_text().splitlines()] == list(range(500))
@@ -0,0 +1,59 @@
+import pytest
+from structlog.processors import TimeStamper
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.fast_json import FastJSONRenderer
+from dual_logging.core.file_logger import FileLogger
+from dual_logging.core.record import Record
+
+
+class Opaque:
+    def __repr__(self):
+        return "<opaque>"
+
+
+@pytest.mark.parametrize(
+    "ctx",
+    [
+        {},
+        {"trace_id": "abc", "count": 3, "ratio": 0.5, "ok": True, "none": None},
+        {"nested": {"a": [1, 2.5, "x"]}, "text": 'café ☃ "q"\n'},
+        {"obj": Opaque(), "nan": float("nan")},
+        {"level": "shadowed", "user": "u1"},
+    ],
+)
+@pytest.mark.parametrize("exc_info", [False, True])
+@pytest.mark.parametrize("callsite", [("/app/handlers.py", 42), None])
+def test_matches_structlog_pipeline(tmp_path, ctx, exc_info, callsite):
+    record = Record.from_item((
+        "warning",
+        "hello ü",
+        {**ctx, "exc_info": exc_info, "callsite": callsite},
+    ))
+
+    def render(fast_json):
+        cfg = LoggerConfig(log_file_path=str(tmp_path / "f.log"), fast_json=fast_json)
+        return FileLogger(cfg)._render(record)
+
+    assert render(fast_json=True) == render(fast_json=False)
+
+
+@pytest.mark.parametrize("utc", [False, True])
+def test_iso_clock_matches_datetime_isoformat(tmp_path, utc):
+    cfg = LoggerConfig(log_file_path=str(tmp_path / "f.log"), use_utc=utc)
+    stamp = FastJSONRenderer(cfg)._now()
+    expected = TimeStamper(fmt="iso", utc=utc)(None, "info", {})["timestamp"]
+    assert len(stamp) == len(expected)
+    assert stamp[:16] == expected[:16]
+    assert stamp.endswith("Z") == utc
+
+
+@pytest.mark.parametrize("levelno", [5, 10, 20, 25, 30, 40, 50])
+def test_levels_match_structlog_pipeline(tmp_path, levelno):
+    record = Record(levelno, "custom level", fields={"user": "u1"}, callsite=None)
+
+    def render(fast_json):
+        cfg = LoggerConfig(log_file_path=str(tmp_path / "f.log"), fast_json=fast_json)
+        return FileLogger(cfg)._render(record)
+
+    assert render(fast_json=True) == render(fast_json=False)
@@ -0,0 +1,62 @@
+import asyncio
+import json
+
+import pytest
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.config.log_context import current_context, log_context_manager, logcontext
+from dual_logging.duallogger import DualLogger
+
+
+def test_nested_contexts_restore_on_exit():
+    assert current_context() is None
+    with log_context_manager.context({"request": "r1", "user": "a"}):
+        outer = current_context()
+        with log_context_manager.context({"user": "b", "step": 2}):
+            assert dict(current_context()) == {"request": "r1", "user": "b", "step": 2}
+        assert current_context() is outer
+        assert dict(outer) == {"request": "r1", "user": "a"}
+    assert current_context() is None
+
+
+def test_flattened_view_is_cached_and_read_only():
+    with log_context_manager.context({"a": 1}):
+        view = current_context()
+        assert current_context() is view
+        with pytest.raises(TypeError):
+            view["a"] = 2
+        assert dict(current_context()) == {"a": 1}
+
+
+async def test_tasks_do_not_share_context():
+    @logcontext({"task": "x"})
+    async def first():
+        await asyncio.sleep(0.01)
+        return dict(current_context())
+
+    @logcontext({"task": "y"})
+    async def second():
+        await asyncio.sleep(0)
+        return dict(current_context())
+
+    assert await asyncio.gather(first(), second()) == [{"task": "x"}, {"task": "y"}]
+
+
+def test_records_carry_context_captured_at_enqueue(tmp_path):
+    path = tmp_path / "ctx.log"
+    cfg = LoggerConfig(name="ctx", console_level="CRITICAL", log_file_path=str(path))
+    logger = DualLogger("ctx", cfg=cfg)
+
+    @logcontext({"trace_id": "t-1", "tenant": "acme"})
+    def handle_request():
+        logger.info("inside", tenant="override")
+
+    handle_request()
+    logger.info("outside")
+    logger.shutdown()
+
+    inside, outside = (json.loads(line) for line in path.read_text().splitlines())
+    assert inside["trace_id"] == "t-1"
+    assert inside["tenant"] == "override"
+    assert "log_context" not in inside
+    assert "trace_id" not in outside
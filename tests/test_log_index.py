@@ -0,0 +1,91 @@
+import json
+import time
+
+from dual_logging import logquery
+from dual_logging.core import log_index
+from dual_logging.core.log_index import query, read_index
+
+# Every batch gets its own index entry.
+INDEXED = {"file_index": True, "file_index_block_bytes": 1, "file_level": "DEBUG"}
+BATCHES: int = 3
+
+
+def _write_three_batches(logger):
+    logger.write_batch([("debug", f"warmup {i}", {"callsite": None}) for i in range(50)])
+    time.sleep(0.002)
+    logger.write_batch([
+        ("error", "failed", {"user": "alice", "status": 500, "callsite": None}),
+        ("info", "retry", {"user": "bob", "callsite": None}),
+    ])
+    time.sleep(0.002)
+    logger.write_batch([("info", f"steady {i}", {"callsite": None}) for i in range(50)])
+    logger.handler.close()
+
+
+def test_time_range_reads_only_the_spans_that_overlap(tmp_path, make_file_logger, monkeypatch):
+    path = tmp_path / "app.log"
+    _write_three_batches(make_file_logger(**INDEXED))
+    entries = read_index(str(path))
+    assert [e["offset"] for e in entries] == sorted(e["offset"] for e in entries)
+    assert len(entries) == BATCHES
+
+    checked = []
+    record = log_index._Filter.record
+    monkeypatch.setattr(
+        log_index._Filter, "record", lambda self, e, us: checked.append(e) or record(self, e, us)
+    )
+    middle = entries[1]
+    events = list(query(str(path), start=middle["first"] / 1e6, end=middle["last"] / 1e6))
+    assert [e["event"] for e in events] == ["failed", "retry"]
+    assert len(checked) == len(events)
+
+
+def test_level_and_field_filters_use_the_bitmaps(tmp_path, make_file_logger):
+    path = tmp_path / "app.log"
+    _write_three_batches(make_file_logger(**INDEXED))
+
+    assert [e["event"] for e in query(str(path), levels=["ERROR"])] == ["failed"]
+    assert [e["user"] for e in query(str(path), fields={"user": "bob"})] == ["bob"]
+    assert [e["event"] for e in query(str(path), fields={"status": "500"})] == ["failed"]
+    assert list(query(str(path), fields={"user": "carol"})) == []
+
+
+def test_index_follows_rotation_and_compression(tmp_path, make_file_logger):
+    path = tmp_path / "app.log"
+    logger = make_file_logger(max_bytes=400, backup_count=5, rotate_compression="gzip", **INDEXED)
+    for i in range(30):
+        logger.write_batch([("info", "tick", {"n": i, "callsite": None})])
+    logger.handler.close()
+
+    assert (tmp_path / "app.log.1.gz").exists()
+    assert (tmp_path / "app.log.1.idx").exists()
+    assert not list(tmp_path.glob("*.pending*"))
+    kept = [e["n"] for e in query(str(path))]
+    assert kept == list(range(30 - len(kept), 30))
+    assert [e["n"] for e in query(str(path), fields={"n": 29})] == [29]
+
+
+def test_unindexed_writes_are_still_found(tmp_path, make_file_logger):
+    path = tmp_path / "app.log"
+    make_file_logger(**INDEXED).write_batch([("info", "indexed", {"callsite": None})])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"event": "written elsewhere", "level": "error"}) + "\n")
+    logger = make_file_logger(**INDEXED)
+    logger.write_batch([("info", "after restart", {"callsite": None})])
+    logger.handler.close()
+
+    assert [e["event"] for e in query(str(path), levels=["error"])] == ["written elsewhere"]
+    assert [e["event"] for e in query(str(path))] == [
+        "indexed",
+        "written elsewhere",
+        "after restart",
+    ]
+
+
+def test_binary_files_and_cli(tmp_path, make_file_logger, capsys):
+    path = tmp_path / "app.log"
+    _write_three_batches(make_file_logger(file_format="binary", **INDEXED))
+
+    assert [e["event"] for e in query(str(path), fields={"user": "alice"})] == ["failed"]
+    assert logquery.main([str(path), "--level", "info", "--field", "user=bob", "--count"]) == 0
+    assert capsys.readouterr().out.strip() == "1"
@@ -1,4 +1,10 @@
+import json
 import logging
+import os
+import subprocess
+import sys
+import threading
+import time
 from typing import Any
 from unittest.mock import patch
 
@@ -30,6 +36,8 @@ def dual_logger(logger_config):
 
 
 EXPECTED_CALL_COUNT: int = 5
+# The console and the file.
+SINK_COUNT: int = 2
 
 
 def test_sync_logging_methods(dual_logger):
@@ -83,3 +91,166 @@ async def test_async_flush(dual_logger):
         for _ in range(3):
             dual_logger.debug("Async flush test message")
         await dual_logger.flush_async()
+
+
+def test_disabled_levels_return_at_entry(dual_logger, logger_config):
+    logger_config.console_level = logger_config.file_level = "WARNING"
+    logger_config.__post_init__()
+    dual_logger.configure(logger_config)
+    with patch.object(dual_logger, "_auto_detect_log") as mock_auto_detect:
+        dual_logger.debug("Debug message")
+        dual_logger.info("Info message")
+        dual_logger.warning("Warning message")
+        assert mock_auto_detect.call_count == 1
+    assert not dual_logger.isEnabledFor(logging.INFO)
+
+    logger_config.console_level = logger_config.file_level = "DEBUG"
+    logger_config.__post_init__()
+    dual_logger.configure(logger_config)
+    assert dual_logger.isEnabledFor(logging.DEBUG)
+
+
+def test_disabled_loggers_and_logging_disable_are_honoured(tmp_path):
+    path = tmp_path / "disabled.log"
+    cfg = LoggerConfig(name="disabled_test", console_level="CRITICAL", log_file_path=str(path))
+    logger = DualLogger("disabled_test", cfg=cfg)
+    logging.disable(logging.CRITICAL)
+    try:
+        logger.critical("globally disabled")
+    finally:
+        logging.disable(logging.NOTSET)
+    logger.disabled = True
+    logger.critical("logger disabled")
+    logger.disabled = False
+    logger.critical("enabled again")
+    logger.shutdown()
+
+    assert [json.loads(line)["event"] for line in path.read_text().splitlines()] == [
+        "enabled again"
+    ]
+
+
+def test_message_args_are_formatted_lazily(tmp_path):
+    class Expensive:
+        renders = 0
+
+        def __str__(self):
+            Expensive.renders += 1
+            return "expensive"
+
+    path = tmp_path / "lazy.log"
+    cfg = LoggerConfig(
+        name="lazy_test", console_level="INFO", file_level="INFO", log_file_path=str(path)
+    )
+    logger = DualLogger("lazy_test", cfg=cfg)
+    logger.debug("skipped %s", Expensive())
+    assert Expensive.renders == 0
+
+    logger.info("user %s made %d calls", "alice", 3)
+    logger.info("%(who)s left", {"who": "bob"})
+    logger.shutdown()
+
+    events = [json.loads(line)["event"] for line in path.read_text().splitlines()]
+    assert events == ["user alice made 3 calls", "bob left"]
+
+
+def test_stdlib_log_calls_are_written_once_with_only_their_extras(tmp_path):
+    path = tmp_path / "handle.log"
+    cfg = LoggerConfig(
+        name="handle_test", console_level="INFO", file_level="INFO", log_file_path=str(path)
+    )
+    logger = DualLogger("handle_test", cfg=cfg)
+    with patch.object(logger.console_logger, "write_batch") as console:
+        logger.log(logging.WARNING, "retry %s", 2, extra={"job": "sync"})
+        logger.flush()
+    logger.shutdown()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 1
+    assert lines[0]["event"] == "retry 2"
+    assert lines[0]["job"] == "sync"
+    assert "msecs" not in lines[0]
+    assert "threadName" not in lines[0]
+    assert sum(len(call.args[0]) for call in console.call_args_list) == 1
+
+
+def test_loggers_that_never_log_open_nothing(tmp_path):
+    threads = threading.active_count()
+    cfg = LoggerConfig(name="idle_test", log_file_path=str(tmp_path / "logs" / "idle.log"))
+    logger = DualLogger("idle_test", cfg=cfg)
+    assert not (tmp_path / "logs").exists()
+    assert threading.active_count() == threads
+    assert logger.handlers == []
+
+    logger.warning("first")
+    logger.flush()
+    assert (tmp_path / "logs" / "idle.log").read_text().count("first") == 1
+    assert len(logger.handlers) == SINK_COUNT
+    logger.shutdown()
+
+
+def test_a_sink_is_built_once_when_threads_race_for_it(tmp_path):
+    cfg = LoggerConfig(name="race_test", log_file_path=str(tmp_path / "race.log"))
+    logger = DualLogger("race_test", cfg=cfg)
+    worker = logger._workers["file"]
+    build, built = worker._factory, []
+    # Slow enough that every thread gets there before the first sink exists.
+    worker._factory = lambda: built.append(time.sleep(0.05)) or build()
+    sinks = []
+    threads = [threading.Thread(target=lambda: sinks.append(logger.file_logger)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(built) == 1
+    assert len({id(sink) for sink in sinks}) == 1
+    logger.shutdown()
+
+
+def test_import_loads_no_sink_dependencies(tmp_path):
+    script = (
+        "import sys, dual_logging\n"
+        "from dual_logging import DualLogger, LoggerConfig\n"
+        "DualLogger('x', cfg=LoggerConfig(name='x'))\n"
+        "print(sorted(m for m in ('rich', 'structlog', 'asyncio') if m in sys.modules))\n"
+    )
+    out = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert out.strip() == "[]"
+    assert not (tmp_path / "logs").exists()
+
+
+def test_threads_logging_while_asyncio_is_first_imported(tmp_path):
+    # The writer thread's structlog import pulls asyncio in while these threads log.
+    script = (
+        "import sys, threading\n"
+        "from dual_logging import DualLogger, LoggerConfig\n"
+        "assert 'asyncio' not in sys.modules\n"
+        "cfg = LoggerConfig(name='cold', console_level='CRITICAL', log_file_path='cold.log')\n"
+        "logger = DualLogger('cold', cfg=cfg)\n"
+        "errors = []\n"
+        "threading.excepthook = errors.append\n"
+        "def run():\n"
+        "    for i in range(5000):\n"
+        "        logger.info('cold', seq=i)\n"
+        "threads = [threading.Thread(target=run) for _ in range(16)]\n"
+        "for t in threads: t.start()\n"
+        "for t in threads: t.join()\n"
+        "logger.shutdown()\n"
+        "print(len(errors))\n"
+    )
+    out = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": os.getcwd()},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert out.strip() == "0"
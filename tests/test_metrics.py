@@ -0,0 +1,85 @@
+from dual_logging.core.metrics import Histogram, MetricsReporter, to_prometheus
+
+# Writers that never wake on their own, so the tests decide when records are written.
+IDLE_WRITERS = {"writer_min_interval": 60, "writer_max_interval": 60}
+FILE_QUEUE_SIZE: int = 2
+# Ten 50-character records past a 200-byte limit rotate at least this often.
+MIN_ROTATIONS: int = 4
+
+
+def test_histogram_buckets_are_cumulative():
+    hist = Histogram((1, 10))
+    observed = (0.5, 5, 50)
+    for value in observed:
+        hist.observe(value)
+    snap = hist.snapshot()
+    assert list(snap["buckets"].values()) == [1, 2, 3]
+    assert snap["count"] == len(observed)
+
+
+def test_stats_snapshot(tmp_path, make_logger):
+    logger = make_logger("stats_test", console_queue_size=100, file_queue_size=100, **IDLE_WRITERS)
+    logger._wake_threshold = 1000
+    logger._file_queue.maxsize = FILE_QUEUE_SIZE
+    logger.info("one")
+    logger.info("two")
+    logger.error("three")
+
+    queued = logger.stats()
+    assert queued["queues"]["file"]["depth"] == FILE_QUEUE_SIZE
+    assert queued["queues"]["file"]["peak"] == FILE_QUEUE_SIZE
+    assert queued["queues"]["file"]["drops"] == {"queue_full": {"error": 1}}
+
+    logger.flush()
+    stats = logger.stats()
+    logger.shutdown()
+    file_sink = stats["sinks"]["file"]
+    assert stats["queues"]["file"]["depth"] == 0
+    assert file_sink["records_written"] == FILE_QUEUE_SIZE
+    assert file_sink["bytes_written"] == (tmp_path / "app.log").stat().st_size
+    assert file_sink["flush_batch_size"]["count"] == 1
+    assert stats["sinks"]["console"]["records_written"] == 0
+
+
+def test_rotations_are_counted(make_logger):
+    logger = make_logger("rotation_stats", max_bytes=200, fast_json=True, **IDLE_WRITERS)
+    for i in range(10):
+        logger.info("x" * 50, seq=i)
+        logger.flush()
+    rotations = logger.stats()["sinks"]["file"]["rotations"]
+    logger.shutdown()
+    assert rotations >= MIN_ROTATIONS
+
+
+def test_reporter_pushes_to_callback_and_prometheus_file(tmp_path, make_logger):
+    logger = make_logger("reporter_test", **IDLE_WRITERS)
+    logger.info("hello")
+    logger.flush()
+    seen = []
+    prom = tmp_path / "dual_logging.prom"
+    reporter = MetricsReporter(
+        logger.stats, 60, "reporter_test", callback=seen.append, prometheus_path=str(prom)
+    )
+    reporter.report()
+    logger.shutdown()
+
+    assert seen[0]["sinks"]["file"]["records_written"] == 1
+    text = prom.read_text()
+    assert 'dual_logging_records_written_total{logger="reporter_test",sink="file"} 1' in text
+    assert (
+        'dual_logging_flush_seconds_bucket{logger="reporter_test",sink="file",le="+Inf"} 1' in text
+    )
+    assert text == to_prometheus(seen[0], "reporter_test")
+
+
+def test_a_failing_final_report_does_not_stop_shutdown(tmp_path, make_logger, capsys):
+    def broken(stats):
+        raise RuntimeError("collector down")
+
+    logger = make_logger("broken_reporter", metrics_interval=60, metrics_callback=broken)
+    logger.info("kept")
+    logger.shutdown()
+
+    assert logger._workers["file"].sink.handler.stream is None
+    assert "collector down" in capsys.readouterr().out
+    assert "kept" in (tmp_path / "app.log").read_text()
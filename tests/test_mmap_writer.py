@@ -0,0 +1,119 @@
+import errno
+import json
+import mmap
+
+import pytest
+
+from dual_logging import DualLogger
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core import mmap_writer
+from dual_logging.core.mmap_writer import MmapSegmentHandler
+
+ROLLOVERS: int = 3
+
+
+def lines(path):
+    data = path.read_bytes()
+    assert b"\0" not in data
+    return data.decode().splitlines()
+
+
+def test_file_length_is_what_was_written(tmp_path):
+    path = tmp_path / "app.log"
+    handler = MmapSegmentHandler(str(path), segment_size=64 * 1024)
+    assert path.stat().st_size == 0
+    handler.write(b"one\n")
+    assert lines(path) == ["one"]
+    handler.write(b"two\n")
+    assert lines(path) == ["one", "two"]
+    handler.close()
+    assert lines(path) == ["one", "two"]
+
+
+def test_a_full_disk_is_an_os_error(tmp_path, monkeypatch):
+    def full(fd, offset, length):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    handler = MmapSegmentHandler(str(tmp_path / "app.log"), segment_size=64 * 1024)
+    handler.write(b"kept\n")
+    monkeypatch.setattr(mmap_writer, "_allocate", full)
+    with pytest.raises(OSError):
+        handler.write(b"lost\n")
+    monkeypatch.undo()
+    handler.write(b"after\n")
+    handler.close()
+    assert lines(tmp_path / "app.log") == ["kept", "after"]
+
+
+def test_rolls_segments_like_rotating_handler(tmp_path):
+    path = tmp_path / "app.log"
+    rotations = []
+    handler = MmapSegmentHandler(str(path), segment_size=mmap.PAGESIZE, backup_count=2)
+    handler.on_rollover = lambda: rotations.append(1)
+    record = b"x" * 99 + b"\n"
+    count = ROLLOVERS * mmap.PAGESIZE // len(record) + 1
+    for _ in range(count):
+        handler.write(record)
+    handler.close()
+
+    assert len(rotations) == ROLLOVERS
+    assert (tmp_path / "app.log.1").stat().st_size <= mmap.PAGESIZE
+    assert not (tmp_path / "app.log.3").exists()
+    for name in ("app.log", "app.log.1", "app.log.2"):
+        assert set(lines(tmp_path / name)) == {"x" * 99}
+
+
+def test_grows_in_place_without_backups(tmp_path):
+    path = tmp_path / "app.log"
+    handler = MmapSegmentHandler(str(path), segment_size=mmap.PAGESIZE, backup_count=0)
+    for i in range(1000):
+        handler.write(f"{i}\n".encode())
+    handler.write(b"y" * (3 * mmap.PAGESIZE) + b"\n")
+    handler.close()
+    written = lines(path)
+    assert written[:1000] == [str(i) for i in range(1000)]
+    assert written[1000] == "y" * (3 * mmap.PAGESIZE)
+
+
+def test_reopen_after_crash_trims_zero_tail(tmp_path):
+    path = tmp_path / "app.log"
+    crashed = MmapSegmentHandler(str(path), segment_size=64 * 1024)
+    crashed.write(b"before\n")
+    crashed._map.flush()  # never closed, as if the process died
+
+    handler = MmapSegmentHandler(str(path), segment_size=64 * 1024)
+    handler.write(b"after\n")
+    handler.close()
+    assert lines(path) == ["before", "after"]
+
+
+@pytest.mark.parametrize("sync", ["batch", "interval"])
+def test_sync_policies(tmp_path, sync):
+    path = tmp_path / "app.log"
+    handler = MmapSegmentHandler(str(path), 64 * 1024, sync=sync, sync_interval=0.0)
+    handler.write(b"durable\n")
+    assert handler._synced == handler._pos
+    handler.close()
+    assert lines(path) == ["durable"]
+
+
+def test_rejects_unknown_sync_policy(tmp_path):
+    with pytest.raises(ValueError):
+        MmapSegmentHandler(str(tmp_path / "app.log"), 4096, sync="always")
+
+
+def test_duallogger_mmap_backend(tmp_path):
+    path = tmp_path / "app.log"
+    cfg = LoggerConfig(
+        name="mmap_backend", log_file_path=str(path), console_level="CRITICAL", file_backend="mmap"
+    )
+    logger = DualLogger(name=cfg.name, cfg=cfg)
+    assert isinstance(logger.file_logger.handler, MmapSegmentHandler)
+    logger.info("hello %s", "mmap", request="r1")
+    logger.flush()
+    logger.file_logger.handler.close()
+
+    (line,) = lines(path)
+    record = json.loads(line)
+    assert record["event"] == "hello mmap"
+    assert record["request"] == "r1"
@@ -0,0 +1,189 @@
+import contextlib
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.base_logger import BaseLogger
+from dual_logging.core.network import NDJSONSink, SyslogSink
+from dual_logging.core.record import Record
+
+STALLED_QUEUE_SIZE: int = 5
+STALLED_RECORDS: int = 20
+
+
+class _Collector:
+    """Stand-in NDJSON collector: accepts connections and keeps every line it reads."""
+
+    def __init__(self, port: int = 0) -> None:
+        self.listener = socket.create_server(("127.0.0.1", port))
+        self.address = self.listener.getsockname()
+        self.lines: list[dict] = []
+        self.connections = 0
+        self._conns: list[socket.socket] = []
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            self.connections += 1
+            self._conns.append(conn)
+            threading.Thread(target=self._read, args=(conn,), daemon=True).start()
+
+    def _read(self, conn: socket.socket) -> None:
+        with conn, conn.makefile("rb") as stream:
+            for line in stream:
+                self.lines.append(json.loads(line))
+
+    def close(self) -> None:
+        # shutdown() is what wakes a thread blocked in accept() on Linux.
+        for sock in (self.listener, *self._conns):
+            with contextlib.suppress(OSError):
+                sock.shutdown(socket.SHUT_RDWR)
+        self.listener.close()
+
+
+@pytest.fixture
+def collector():
+    collector = _Collector()
+    yield collector
+    collector.close()
+
+
+def _records(*messages: str, level: int = 20) -> list[Record]:
+    return [
+        Record(level, message, None, {"seq": i}, callsite=None)
+        for i, message in enumerate(messages)
+    ]
+
+
+def test_ndjson_batch_is_one_line_per_record(collector, wait_for):
+    sink = NDJSONSink(collector.address)
+    messages = ["a", "b", "c"]
+    sink.write_batch(_records(*messages))
+    wait_for(lambda: len(collector.lines) == len(messages))
+    sink.close()
+    assert [line["event"] for line in collector.lines] == messages
+    assert [line["seq"] for line in collector.lines] == list(range(len(messages)))
+    assert collector.lines[0]["level"] == "info"
+    assert collector.connections == 1
+    assert sink.metrics.records_written == len(messages)
+
+
+def test_ndjson_holds_records_while_down_and_reconnects(collector, wait_for):
+    sink = NDJSONSink(collector.address, backoff=0.01)
+    sink.write_batch(_records("before"))
+    wait_for(lambda: len(collector.lines) == 1)
+    port = collector.address[1]
+    collector.close()
+
+    sink.write_batch(_records("while down"))
+    assert sink.metrics.records_failed == 0
+    restarted = _Collector(port)
+    try:
+        time.sleep(0.02)
+        sink.write_batch(_records("after"))
+        held = ["while down", "after"]
+        wait_for(lambda: len(restarted.lines) == len(held))
+        assert [line["event"] for line in restarted.lines] == held
+        assert sink.metrics.reconnects == 1
+    finally:
+        sink.close()
+        restarted.close()
+
+
+def test_pending_records_past_the_bound_are_counted_as_failed():
+    with socket.create_server(("127.0.0.1", 0)) as probe:
+        address = probe.getsockname()
+    sink = NDJSONSink(address, backoff=60, max_pending=2)
+    records = _records("a", "b", "c")
+    sink.write_batch(records)
+    assert sink.metrics.records_failed == 1
+    sink.close()
+    assert sink.metrics.records_failed == len(records)
+
+
+def test_syslog_over_udp():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server:
+        server.bind(("127.0.0.1", 0))
+        server.settimeout(5)
+        sink = SyslogSink(server.getsockname(), app_name="billing", facility=16)
+        sink.write_batch([*_records("paid"), *_records("refused", level=40)])
+        paid = server.recv(65536).decode()
+        refused = server.recv(65536).decode()
+        sink.close()
+    assert paid.startswith("<134>1 ")  # local0.info
+    assert refused.startswith("<131>1 ")  # local0.err
+    header, _, msg = paid.partition(" - - ")
+    assert header.split(" ")[3:] == ["billing", str(os.getpid())]
+    assert header.split(" ")[1].endswith("Z")
+    assert json.loads(msg)["event"] == "paid"
+
+
+def test_syslog_over_unix_datagram_socket(tmp_path):
+    path = str(tmp_path / "log.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as server:
+        server.bind(path)
+        server.settimeout(5)
+        sink = SyslogSink(path)
+        sink.write_batch(_records("local"))
+        message = server.recv(65536).decode()
+        sink.close()
+    assert message.startswith("<14>1 ")
+    assert json.loads(message.partition(" - - ")[2])["event"] == "local"
+
+
+class _StalledSink(BaseLogger):
+    name = "stalled"
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.written: list[Record] = []
+
+    def write_batch(self, records: list[Record]) -> None:
+        self.release.wait(10)
+        self.written.extend(records)
+
+
+def test_a_stalled_sink_does_not_hold_up_the_file(tmp_path, make_logger, wait_for):
+    stalled = _StalledSink()
+    stalled.queue_size = STALLED_QUEUE_SIZE
+    logger = make_logger("sinks", writer_max_interval=0.01, sinks=[stalled])
+    for i in range(STALLED_RECORDS):
+        logger.info("event", seq=i)
+    path = tmp_path / "app.log"
+    wait_for(lambda: path.exists() and len(path.read_text().splitlines()) == STALLED_RECORDS)
+
+    stats = logger.stats()["queues"]["stalled"]
+    assert stats["capacity"] == STALLED_QUEUE_SIZE
+    assert stats["dropped"] > 0
+    stalled.release.set()
+    logger.shutdown()
+    assert len(stalled.written) + stats["dropped"] == STALLED_RECORDS
+
+
+def test_dual_logger_ships_to_ndjson_collector(collector, make_logger, wait_for):
+    logger = make_logger(
+        "sinks", writer_max_interval=0.01, sinks=[NDJSONSink(collector.address, level="WARNING")]
+    )
+    logger.info("local only")
+    logger.warning("shipped", order=7)
+    logger.shutdown()
+    wait_for(lambda: len(collector.lines) == 1)
+    shipped = collector.lines[0]
+    assert (shipped["event"], shipped["order"]) == ("shipped", 7)
+    assert shipped["pathname"].endswith("test_network_sinks.py")
+
+
+def test_sink_names_must_be_unique(tmp_path):
+    with pytest.raises(ValueError):
+        LoggerConfig(sinks=[NDJSONSink(), NDJSONSink()])
+    with pytest.raises(ValueError):
+        LoggerConfig(sinks=[NDJSONSink(name="file")])
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import threading
+import time
+
+from dual_logging.config.log_config import QueueOverflowPolicy
+from dual_logging.core.async_queue import AsyncOverflowQueue
+from dual_logging.core.overflow import OverflowQueue
+from dual_logging.core.record import Record
+
+# debug, info and the rejected debug record all lose to higher levels.
+PRIORITY_EVICTIONS: int = 3
+BLOCK_TIMEOUT: float = 0.05
+SPILL_CAPACITY: int = 2
+SPILLED_RECORDS: int = 6
+
+
+def _record(level, message, fields):
+    return Record.from_item((level, message, fields))
+
+
+def _messages(queue):
+    return [record.message for record in queue.get_batch(100)]
+
+
+def test_drop_rejects_newest():
+    queue = OverflowQueue(2, QueueOverflowPolicy.DROP)
+    assert queue.put(_record("info", "a", {}))
+    assert queue.put(_record("info", "b", {}))
+    assert not queue.put(_record("error", "c", {}))
+    assert _messages(queue) == ["a", "b"]
+    assert queue.dropped == 1
+
+
+def test_drop_oldest_keeps_newest():
+    queue = OverflowQueue(2, QueueOverflowPolicy.DROP_OLDEST)
+    for message in "abc":
+        queue.put(_record("info", message, {}))
+    assert _messages(queue) == ["b", "c"]
+    assert queue.dropped == 1
+
+
+def test_priority_evicts_low_levels_first():
+    queue = OverflowQueue(3, QueueOverflowPolicy.PRIORITY)
+    queue.put(_record("error", "e1", {}))
+    queue.put(_record("debug", "d1", {}))
+    queue.put(_record("info", "i1", {}))
+    assert queue.put(_record("warning", "w1", {}))
+    assert queue.put(_record("error", "e2", {}))
+    assert not queue.put(_record("debug", "d2", {}))
+    assert _messages(queue) == ["e1", "w1", "e2"]
+    assert queue.dropped == PRIORITY_EVICTIONS
+
+
+def test_block_waits_for_room_then_times_out():
+    queue = OverflowQueue(1, QueueOverflowPolicy.BLOCK, block_timeout=BLOCK_TIMEOUT)
+    queue.put(_record("info", "a", {}))
+    start = time.monotonic()
+    assert not queue.put(_record("info", "b", {}))
+    assert time.monotonic() - start >= BLOCK_TIMEOUT
+
+    queue = OverflowQueue(1, QueueOverflowPolicy.BLOCK, block_timeout=2)
+    queue.put(_record("info", "a", {}))
+    threading.Timer(0.05, queue.get_batch, args=(1,)).start()
+    assert queue.put(_record("info", "b", {}))
+    assert _messages(queue) == ["b"]
+
+
+def test_spill_replays_in_order(tmp_path):
+    path = tmp_path / "q.spill"
+    queue = OverflowQueue(SPILL_CAPACITY, QueueOverflowPolicy.SPILL, spill_path=str(path))
+    for i in range(6):
+        assert queue.put(_record("info", f"m{i}", {"n": i}))
+    assert path.exists()
+    assert queue.qsize() == SPILL_CAPACITY
+
+    assert _messages(queue) == [f"m{i}" for i in range(6)]
+    assert queue.dropped == 0
+    assert not path.exists()
+
+
+async def test_async_queue_applies_policy():
+    queue = AsyncOverflowQueue(2, QueueOverflowPolicy.DROP_OLDEST)
+    for message in "abc":
+        await queue.offer(_record("info", message, {}))
+    assert [queue.get_nowait().message for _ in range(2)] == ["b", "c"]
+    assert queue.dropped == 1
+
+
+async def test_async_block_waits_in_a_task_and_keeps_order():
+    queue = AsyncOverflowQueue(1, QueueOverflowPolicy.BLOCK, block_timeout=1.0)
+    assert not queue.must_wait()
+    assert queue.offer_nowait(_record("info", "a", {}))
+    assert queue.must_wait()
+    waiting = [asyncio.create_task(queue.offer(_record("info", m, {}))) for m in "bc"]
+    await asyncio.sleep(0)
+    assert [(await queue.get()).message for _ in range(3)] == ["a", "b", "c"]
+    assert await asyncio.gather(*waiting) == [True, True]
+    assert queue.dropped == 0
+
+
+def test_loggers_sharing_a_name_spill_to_their_own_files(tmp_path, make_logger):
+    loggers = [
+        make_logger(
+            "spilled",
+            log_file_path=str(tmp_path / f"{n}.log"),
+            file_queue_size=SPILL_CAPACITY,
+            file_overflow_policy=QueueOverflowPolicy.SPILL,
+            writer_min_interval=60,
+            writer_max_interval=60,
+        )
+        for n in range(2)
+    ]
+    for logger in loggers:
+        logger._wake_threshold = 1000
+        for i in range(SPILLED_RECORDS):
+            logger.info("spilled", seq=i)
+        logger._collect_buffers()
+    assert len(list(tmp_path.glob("*.spill"))) == len(loggers)
+
+    for n, logger in enumerate(loggers):
+        logger.shutdown()
+        lines = (tmp_path / f"{n}.log").read_text().splitlines()
+        assert [json.loads(line)["seq"] for line in lines] == list(range(SPILLED_RECORDS))
@@ -0,0 +1,68 @@
+import io
+from typing import Any
+
+import pytest
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.console_logger import ConsoleLogger
+from dual_logging.core.plain_console import PlainConsoleHandler
+
+
+def _console(tmp_path, console_format, **overrides: Any):
+    cfg = LoggerConfig(
+        log_file_path=str(tmp_path / "c.log"),
+        console_format=console_format,
+        time_format="static",
+        **overrides,
+    )
+    console = ConsoleLogger(cfg)
+    stream = io.StringIO()
+    console.handler.setStream(stream)
+    return console, stream
+
+
+def test_auto_uses_plain_text_when_stdout_is_not_a_tty(tmp_path, monkeypatch):
+    monkeypatch.setattr("sys.stdout", io.StringIO())
+    console = ConsoleLogger(LoggerConfig(log_file_path=str(tmp_path / "c.log")))
+    assert console.format == "text"
+    assert isinstance(console.handler, PlainConsoleHandler)
+    assert (
+        ConsoleLogger(
+            LoggerConfig(log_file_path=str(tmp_path / "c.log"), console_format="rich")
+        ).format
+        == "rich"
+    )
+
+
+def test_text_layout_batches_into_one_write(tmp_path):
+    console, stream = _console(tmp_path, "text")
+    writes = []
+    stream.write = lambda text, write=stream.write: (writes.append(text), write(text))[1]
+    console.write_batch([
+        ("info", "user %s", {"args": ("alice",), "attempt": 2, "callsite": ("/a/b.py", 7)}),
+        ("debug", "below level", {}),
+        ("warning", "careful", {"trace_id": "t1", "callsite": None}),
+    ])
+    assert len(writes) == 1
+    lines = stream.getvalue().splitlines()
+    assert lines == [
+        "static INFO     user alice attempt=2 [b.py:7]",
+        "static WARNING  careful",
+    ]
+    assert console.metrics.records_written == len(lines)
+
+
+def test_logfmt_quotes_and_includes_traceback(tmp_path):
+    console, stream = _console(tmp_path, "logfmt")
+    try:
+        raise ValueError("bad value")
+    except ValueError:
+        console._log_sync("error", 'said "hi"', exc_info=True, path="a b")
+    (line,) = stream.getvalue().splitlines()
+    assert line.startswith('ts=static level=error msg="said \\"hi\\"" path="a b" exc="Traceback')
+    assert "ValueError: bad value" in line
+
+
+def test_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        LoggerConfig(log_file_path=str(tmp_path / "c.log"), console_format="html")
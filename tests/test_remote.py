@@ -0,0 +1,168 @@
+import asyncio
+import json
+import multiprocessing
+import socket
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from dual_logging.config.log_config import LoggerConfig, QueueOverflowPolicy
+from dual_logging.core.remote import _HEADER, LogServer, RemoteSink
+from dual_logging.duallogger import DualLogger
+
+# "hello server" and the logged exception.
+CLIENT_RECORDS: int = 2
+WORKERS: int = 4
+RECORDS_PER_WORKER: int = 200
+ORPHANED_RECORDS: int = 3
+
+
+def _cfg(tmp_path, name="remote", **overrides: Any):
+    return LoggerConfig(
+        name=name,
+        console_level="CRITICAL",
+        log_file_path=str(tmp_path / "app.log"),
+        log_server_address=str(tmp_path / "log.sock"),
+        **overrides,
+    )
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = LogServer(_cfg(tmp_path, "server"))
+    server.start()
+    yield server
+    server.close()
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_client_records_reach_server_file(tmp_path, server, wait_for):
+    logger = DualLogger("client", cfg=_cfg(tmp_path, "client"))
+    assert isinstance(logger.file_logger, RemoteSink)
+    logger.info("hello %s", "server", request="r1")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+    logger.flush()
+    logger.shutdown()
+
+    path = tmp_path / "app.log"
+    wait_for(lambda: path.exists() and len(path.read_text().splitlines()) == CLIENT_RECORDS)
+    hello, failed = _records(path)
+    assert hello["event"] == "hello server"
+    assert hello["request"] == "r1"
+    assert hello["pathname"].endswith("test_remote.py")
+    assert "ValueError: boom" in failed["exception"]
+    assert (hello["exc_info"], failed["exc_info"]) == (False, True)
+    assert logger.stats()["sinks"]["file"]["records_written"] == CLIENT_RECORDS
+    assert logger._console_queue.stats()["peak"] == 0
+
+
+def _child(cfg, worker, count):
+    logger = DualLogger(f"worker{worker}", cfg=cfg)
+    for i in range(count):
+        logger.info("record", worker=worker, seq=i)
+    logger.shutdown()
+
+
+def test_many_processes_share_one_writer(tmp_path, server, wait_for):
+    ctx = multiprocessing.get_context("spawn")
+    cfg = _cfg(tmp_path, "child", file_queue_size=1000)
+    workers = [
+        ctx.Process(target=_child, args=(cfg, w, RECORDS_PER_WORKER)) for w in range(WORKERS)
+    ]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join()
+        assert p.exitcode == 0
+
+    path = tmp_path / "app.log"
+    wait_for(lambda: len(path.read_text().splitlines()) == WORKERS * RECORDS_PER_WORKER)
+    records = _records(path)
+    for w in range(WORKERS):
+        assert [r["seq"] for r in records if r["worker"] == w] == list(range(RECORDS_PER_WORKER))
+
+
+def test_slow_server_applies_overflow_policy(tmp_path, server):
+    release = threading.Event()
+    write = server.write
+    server.write = lambda records: (release.wait(), write(records))
+
+    cfg = _cfg(
+        tmp_path,
+        "backpressure",
+        file_queue_size=10,
+        queue_overflow_policy=QueueOverflowPolicy.DROP,
+        writer_batch_size=10,
+        writer_min_interval=0.001,
+    )
+    logger = DualLogger("backpressure", cfg=cfg)
+    for _ in range(2000):
+        logger.info("x" * 4096)
+    dropped = logger.dropped_file_logs
+    release.set()
+    logger.shutdown()
+    assert dropped > 0
+
+
+def test_batches_for_a_missing_server_are_counted_as_failed(tmp_path, capsys):
+    logger = DualLogger("orphan", cfg=_cfg(tmp_path, "orphan"))
+    for i in range(ORPHANED_RECORDS):
+        logger.info("nowhere", seq=i)
+    logger.flush()
+    logger.shutdown()
+
+    sink = logger.stats()["sinks"]["file"]
+    assert sink["records_failed"] == ORPHANED_RECORDS
+    assert sink["records_written"] == 0
+    assert "Traceback" not in capsys.readouterr().out
+
+
+async def test_storm_summaries_go_out_while_only_a_loop_logs(tmp_path, server):
+    cfg = _cfg(tmp_path, "loop_storm", storm_limit=1, storm_window=0.05, writer_max_interval=0.01)
+    logger = DualLogger("loop_storm", cfg=cfg)
+    for _ in range(5):
+        logger.error("timeout")
+
+    path = tmp_path / "app.log"
+    deadline = time.monotonic() + 5
+    while not (path.exists() and "repeated 4 times" in path.read_text()):
+        assert time.monotonic() < deadline, "no summary before shutdown"
+        await asyncio.sleep(0.01)
+    logger.shutdown()
+
+
+def test_bad_frames_do_not_kill_the_client_thread(tmp_path, server, wait_for, monkeypatch, capsys):
+    crashes = []
+    monkeypatch.setattr(threading, "excepthook", crashes.append)
+    good = json.dumps([["info", "after the bad frame", {}]]).encode()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(server.address)
+        client.sendall(_HEADER.pack(8) + b"not json" + _HEADER.pack(len(good)) + good)
+        path = tmp_path / "app.log"
+        wait_for(lambda: path.exists() and path.read_text())
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as truncated:
+        truncated.connect(server.address)
+        truncated.sendall(b"\0\0")
+    server.close()
+
+    assert [r["event"] for r in _records(path)] == ["after the bad frame"]
+    assert "JSONDecodeError" in capsys.readouterr().out
+    assert crashes == []
+
+
+def test_close_closes_both_sinks(server, monkeypatch):
+    closed = []
+    for sink in (server.console_logger, server.file_logger):
+        monkeypatch.setattr(
+            sink, "close", lambda s=sink, close=sink.close: (closed.append(s), close())
+        )
+    server.close()
+    assert closed == [server.console_logger, server.file_logger]
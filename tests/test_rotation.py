@@ -0,0 +1,104 @@
+import gzip
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core import rotation
+from dual_logging.core.rotation import BackgroundRotatingFileHandler, BackupRotator, _next_boundary
+
+# Every record past the first rolls the 10-byte file over.
+QUEUED_ROLLOVERS: int = 4
+DISK_BUDGET: int = 200
+MINUTE: int = 60
+
+
+def _emit(handler, text):
+    handler.handle(logging.makeLogRecord({"msg": text, "levelno": logging.INFO}))
+
+
+def test_size_rollover_numbers_backups_newest_first(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BackgroundRotatingFileHandler(str(path), max_bytes=10, backup_count=2)
+    for text in ("first", "second", "third", "fourth"):
+        _emit(handler, text)
+    handler.close()
+
+    assert path.read_text() == "fourth\n"
+    assert (tmp_path / "app.log.1").read_text() == "third\n"
+    assert (tmp_path / "app.log.2").read_text() == "second\n"
+    assert not (tmp_path / "app.log.3").exists()
+    assert not list(tmp_path.glob("*.pending"))
+
+
+def test_rollover_does_not_wait_for_backup_work(tmp_path, monkeypatch):
+    release = threading.Event()
+    rotate = BackupRotator._rotate
+    monkeypatch.setattr(BackupRotator, "_rotate", lambda self, p: (release.wait(), rotate(self, p)))
+
+    handler = BackgroundRotatingFileHandler(str(tmp_path / "app.log"), max_bytes=10, backup_count=5)
+    start = time.perf_counter()
+    for i in range(QUEUED_ROLLOVERS + 1):
+        _emit(handler, f"record {i}")
+    elapsed = time.perf_counter() - start
+    assert len(list(tmp_path.glob("*.pending"))) == QUEUED_ROLLOVERS
+
+    release.set()
+    handler.close()
+    assert elapsed < 1
+    assert [(tmp_path / f"app.log.{n}").read_text() for n in (1, 4)] == ["record 3\n", "record 0\n"]
+
+
+def test_gzip_compression_and_disk_budget(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BackgroundRotatingFileHandler(
+        str(path), max_bytes=1000, compression="gzip", max_total_bytes=DISK_BUDGET
+    )
+    for i in range(20):
+        _emit(handler, f"{i:04d}" + "x" * 995)
+    handler.close()
+
+    backups = sorted(tmp_path.glob("app.log.*.gz"))
+    assert backups
+    assert sum(os.path.getsize(b) for b in backups) <= DISK_BUDGET
+    assert gzip.decompress((tmp_path / "app.log.1.gz").read_bytes()).startswith(b"0018")
+
+
+def test_zstd_requires_a_codec(tmp_path, monkeypatch):
+    monkeypatch.setattr(rotation, "_zstd", None)
+    with pytest.raises(ValueError):
+        BackgroundRotatingFileHandler(str(tmp_path / "app.log"), compression="zstd")
+
+
+def test_time_rollover(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BackgroundRotatingFileHandler(str(path), when="time", interval=3600)
+    _emit(handler, "old period")
+    handler._next_rollover = time.time() - 1
+    _emit(handler, "new period")
+    handler.close()
+    assert path.read_text() == "new period\n"
+    assert (tmp_path / "app.log.1").read_text() == "old period\n"
+
+
+def test_next_boundary_is_aligned():
+    assert _next_boundary(1000.5, MINUTE, utc=True) == 17 * MINUTE
+    assert _next_boundary(17 * MINUTE, MINUTE, utc=True) == 18 * MINUTE
+
+
+def test_pending_segments_are_recovered(tmp_path):
+    path = tmp_path / "app.log"
+    (tmp_path / "app.log.1").write_text("older\n")
+    (tmp_path / "app.log.100-000000.pending").write_text("interrupted\n")
+    BackgroundRotatingFileHandler(str(path), max_bytes=10, backup_count=3).close()
+    assert (tmp_path / "app.log.1").read_text() == "interrupted\n"
+    assert (tmp_path / "app.log.2").read_text() == "older\n"
+
+
+@pytest.mark.parametrize("when", ["time", "size_or_time"])
+def test_time_rollover_needs_the_rotating_backend(tmp_path, when):
+    with pytest.raises(ValueError):
+        LoggerConfig(log_file_path=str(tmp_path / "app.log"), file_backend="mmap", rotate_when=when)
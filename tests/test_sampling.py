@@ -0,0 +1,89 @@
+import json
+import logging
+from typing import Any
+
+import pytest
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.record import Record
+from dual_logging.core.sampling import AdaptiveSampler
+from dual_logging.duallogger import DualLogger
+
+RECORDS_PER_LEVEL: int = 100
+INFO_FLOOR: float = 0.5
+
+
+def _sampler(pressure, **kwargs: Any):
+    sampler = AdaptiveSampler(lambda: pressure, interval=0, **kwargs)
+    sampler._update()
+    return sampler
+
+
+def _record(levelno, **fields: Any):
+    return Record(levelno, "message", fields=fields)
+
+
+def test_keep_rates_follow_pressure():
+    assert _sampler(0.3).rates == {logging.DEBUG: 1.0, logging.INFO: 1.0}
+    assert _sampler(0.75).rates == {logging.DEBUG: 0.0, logging.INFO: 1.0}
+    assert _sampler(1.0, info_floor=0.2).rates == {
+        logging.DEBUG: 0.0,
+        logging.INFO: pytest.approx(0.2),
+    }
+
+
+def test_warnings_always_kept_and_drops_counted():
+    sampler = _sampler(1.0, info_floor=0.0)
+    assert all(sampler.keep(_record(logging.WARNING)) for _ in range(100))
+    assert not any(sampler.keep(_record(logging.INFO)) for _ in range(100))
+    assert not any(sampler.keep(_record(logging.DEBUG)) for _ in range(10))
+    assert sampler.stats()["sampled"] == {"info": 100, "debug": 10}
+
+
+def test_kept_records_carry_rate_and_traces_stay_whole():
+    sampler = _sampler(1.0, info_floor=INFO_FLOOR)
+    for trace in range(50):
+        decisions = set()
+        for _ in range(5):
+            record = _record(logging.INFO, trace_id=f"trace-{trace}")
+            kept = sampler.keep(record)
+            decisions.add(kept)
+            if kept:
+                assert record.fields["sample_rate"] == INFO_FLOOR
+        assert len(decisions) == 1
+
+
+def test_enqueue_rate_raises_pressure():
+    sampler = AdaptiveSampler(lambda: 0.0, target_rate=1.0, interval=0)
+    for _ in range(1000):
+        sampler.keep(_record(logging.DEBUG))
+    assert sampler.rates[logging.DEBUG] == 0.0
+
+
+def test_dual_logger_thins_debug_under_queue_pressure(tmp_path):
+    path = tmp_path / "sampled.log"
+    cfg = LoggerConfig(
+        name="sampled",
+        console_level="CRITICAL",
+        log_file_path=str(path),
+        file_queue_size=200,
+        writer_min_interval=60,
+        writer_max_interval=60,
+        sampling=True,
+    )
+    logger = DualLogger("sampled", cfg=cfg)
+    logger._wake_threshold = 10_000
+    logger._sampler.interval = 0
+    for i in range(RECORDS_PER_LEVEL):
+        logger.debug("noise", seq=i)
+        logger.warning("important", seq=i)
+    stats = logger.stats()
+    logger.shutdown()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    noise = [r for r in records if r["event"] == "noise"]
+    assert len([r for r in records if r["event"] == "important"]) == RECORDS_PER_LEVEL
+    assert len(noise) + stats["sampling"]["sampled"]["debug"] == RECORDS_PER_LEVEL
+    assert stats["sampling"]["sampled"]["debug"] > 0
+    assert stats["queues"]["file"]["dropped"] == 0
+    assert "sample_rate" not in noise[0]
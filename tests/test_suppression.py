@@ -0,0 +1,70 @@
+import json
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.suppression import StormSuppressor
+from dual_logging.duallogger import DualLogger
+
+# Suppressed "retry" calls: the five made less the two the limit lets through.
+INFO_REPEATS: int = 3
+STORM_LIMIT: int = 3
+STORM_CALLS: int = 500
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_passes_first_k_per_window_then_summarizes():
+    clock = FakeClock()
+    storm = StormSuppressor(2, window=1.0, level_limits={"ERROR": 3}, utc=True, clock=clock)
+    site = ("/app/db.py", 10)
+
+    assert [storm.allow("info", "retry", site) for _ in range(5)] == [True] * 2 + [
+        False
+    ] * INFO_REPEATS
+    assert [storm.allow("error", "down", site) for _ in range(4)] == [True] * 3 + [False]
+    assert storm.allow("info", "retry", ("/app/other.py", 1))
+    assert storm.summaries() == []
+
+    clock.now += 1.5
+    summaries = {record.message: record for record in storm.summaries()}
+    summary = summaries["retry (repeated 3 times)"]
+    assert summary.level == "info"
+    assert summary.fields["repeated"] == INFO_REPEATS
+    assert summary.callsite == site
+    assert summary.fields["first_seen"].startswith("1970-01-01T00:16:40")
+    assert "down (repeated 1 times)" in summaries
+    assert storm.suppressed == INFO_REPEATS + 1
+    assert storm.allow("info", "retry", site)
+
+
+def test_dual_logger_sinks_see_the_same_suppressed_stream(tmp_path):
+    path = tmp_path / "storm.log"
+    cfg = LoggerConfig(
+        name="storm",
+        console_level="CRITICAL",
+        log_file_path=str(path),
+        file_queue_size=1000,
+        storm_limit=STORM_LIMIT,
+        storm_window=60,
+    )
+    logger = DualLogger("storm", cfg=cfg)
+    for i in range(STORM_CALLS):
+        logger.error("upstream %s failed", "db", attempt=i)
+    logger.info("unrelated")
+    assert logger.stats()["suppressed"] == STORM_CALLS - STORM_LIMIT
+    logger.shutdown()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    repeated = STORM_CALLS - STORM_LIMIT
+    assert [r["event"] for r in records] == [
+        *["upstream db failed"] * STORM_LIMIT,
+        "unrelated",
+        f"upstream %s failed (repeated {repeated} times)",
+    ]
+    assert records[-1]["repeated"] == repeated
+    assert records[-1]["level"] == "error"
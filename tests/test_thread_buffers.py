@@ -0,0 +1,63 @@
+import json
+import threading
+
+from dual_logging.config.log_config import QueueOverflowPolicy
+from dual_logging.core.record import Record
+from dual_logging.core.thread_buffers import ThreadBuffers
+
+
+def test_collect_merges_by_timestamp_and_keeps_each_threads_order():
+    buffers = ThreadBuffers()
+    ready = threading.Barrier(2)
+
+    def other() -> None:
+        buffers.append(Record(20, "b1", timestamp_us=2))
+        # A clock step back: still after b1, since both came from this thread.
+        buffers.append(Record(20, "b2", timestamp_us=1))
+        ready.wait()
+
+    thread = threading.Thread(target=other)
+    thread.start()
+    buffers.append(Record(20, "a1", timestamp_us=0))
+    buffers.append(Record(20, "a2", timestamp_us=3))
+    ready.wait()
+    thread.join()
+
+    merged = ["a1", "b1", "b2", "a2"]
+    assert len(buffers) == len(merged)
+    assert [r.message for r in buffers.collect()] == merged
+    assert buffers.collect() == []
+    # The exited thread's buffer is dropped once it has been emptied.
+    assert len(buffers._buffers) == 1
+
+
+def test_every_record_is_written_or_counted_as_dropped(tmp_path, make_logger):
+    logger = make_logger("threads", file_queue_size=64, writer_max_interval=0.01)
+    threads, per_thread = 16, 500
+
+    def worker(n: int) -> None:
+        for i in range(per_thread):
+            logger.info("event", worker=n, seq=i)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    logger.flush()
+    dropped = logger.stats()["queues"]["file"]["dropped"]
+    logger.shutdown()
+
+    records = [json.loads(line) for line in (tmp_path / "app.log").read_text().splitlines()]
+    assert len(records) + dropped == threads * per_thread
+    for n in range(threads):
+        seqs = [r["seq"] for r in records if r["worker"] == n]
+        assert seqs == sorted(seqs)
+
+
+def test_block_policy_puts_straight_into_the_queues(make_logger):
+    logger = make_logger("threads", queue_overflow_policy=QueueOverflowPolicy.BLOCK)
+    assert logger._buffers is None
+    logger.info("direct")
+    assert logger._file_queue.qsize() == 1
+    logger.shutdown()
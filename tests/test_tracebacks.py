@@ -0,0 +1,115 @@
+import io
+import logging
+import sys
+
+from dual_logging.config.log_config import LoggerConfig
+from dual_logging.core.record import Record
+from dual_logging.core.tracebacks import TracebackCache, fingerprint
+from dual_logging.duallogger import DualLogger
+
+REPEATED_FAILURES: int = 3
+
+
+def _fail(message: str) -> None:
+    raise ValueError(message)
+
+
+def _caught(fn=_fail, message="boom"):
+    try:
+        fn(message)
+    except ValueError:
+        return sys.exc_info()
+
+
+def _wrapped(message: str) -> None:
+    try:
+        _fail(message)
+    except ValueError as exc:
+        raise RuntimeError("wrapped") from exc
+
+
+def test_fingerprint_follows_the_code_path_not_the_message():
+    first, second = _caught(message="row 1"), _caught(message="row 2")
+    assert fingerprint(first[1]) == fingerprint(second[1])
+    try:
+        _wrapped("row 3")
+    except RuntimeError as exc:
+        assert fingerprint(exc) != fingerprint(first[1])
+
+
+def test_full_once_per_window_then_references():
+    cache = TracebackCache(window=10)
+    exc_info = _caught()
+    with cache.lock:
+        full, repeat = cache.render(exc_info, 0)
+        assert not repeat
+        assert full.startswith("Traceback (most recent call last):")
+        key = full.rpartition("[traceback ")[2].rstrip("]")
+
+        text, repeat = cache.render(_caught(message="again"), 5_000_000)
+        assert repeat
+        assert text == f"ValueError: again [traceback {key} repeated, seen 2 times]"
+
+        _, repeat = cache.render(exc_info, 10_000_000)
+        assert not repeat
+    assert cache.stats() == {"rendered": 2, "referenced": 1, "fingerprints": 1}
+
+
+def test_least_recently_seen_fingerprint_is_evicted():
+    cache = TracebackCache(window=60, max_entries=1)
+    try:
+        _wrapped("x")
+    except RuntimeError:
+        other = sys.exc_info()
+    with cache.lock:
+        cache.render(_caught(), 0)
+        cache.render(other, 1)
+        assert not cache.render(_caught(), 2)[1]
+
+
+def test_every_sink_sees_the_same_form_for_a_record():
+    cache = TracebackCache()
+    record = Record(logging.ERROR, "failed", exc_info=_caught(), tracebacks=cache)
+    text = record.exception_text()
+    assert record.exception_text() is text
+    assert cache.stats()["rendered"] == 1
+
+
+def test_repeated_exceptions_render_in_full_once(tmp_path):
+    cfg = LoggerConfig(name="storm", console_format="text", log_file_path=str(tmp_path / "app.log"))
+    logger = DualLogger("storm", cfg=cfg)
+    stream = io.StringIO()
+    logger.console_logger.handler.setStream(stream)
+    for i in range(50):
+        try:
+            _fail(f"row {i}")
+        except ValueError:
+            logger.exception("import failed")
+    logger.flush()
+    stats = logger.stats()["tracebacks"]
+    logger.shutdown()
+
+    out = stream.getvalue()
+    assert out.count("Traceback (most recent call last):") == 1
+    assert "ValueError: row 49 [traceback" in out
+    assert "seen 50 times" in out
+    assert stats == {"rendered": 1, "referenced": 49, "fingerprints": 1}
+
+
+def test_window_none_renders_every_traceback(tmp_path):
+    cfg = LoggerConfig(
+        name="plain",
+        console_format="text",
+        log_file_path=str(tmp_path / "app.log"),
+        traceback_window=None,
+    )
+    logger = DualLogger("plain", cfg=cfg)
+    stream = io.StringIO()
+    logger.console_logger.handler.setStream(stream)
+    for _ in range(REPEATED_FAILURES):
+        try:
+            _fail("again")
+        except ValueError:
+            logger.exception("failed")
+    logger.shutdown()
+    assert stream.getvalue().count("Traceback (most recent call last):") == REPEATED_FAILURES